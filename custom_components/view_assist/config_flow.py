@@ -46,6 +46,8 @@ from .const import (
     CONF_DO_NOT_DISTURB,
     CONF_DUCKING_VOLUME,
     CONF_ENABLE_UPDATES,
+    CONF_EXPIRED_TIMER_MAX,
+    CONF_EXPIRED_TIMER_RETENTION,
     CONF_FONT_STYLE,
     CONF_HOME,
     CONF_INTENT,
@@ -358,6 +360,23 @@ INTEGRATION_OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_ENABLE_UPDATES): BooleanSelector(),
         vol.Optional(CONF_TRANSLATION_ENGINE): ConversationAgentSelector(),
+        vol.Optional(CONF_EXPIRED_TIMER_RETENTION): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=10080,
+                step=1.0,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="minutes",
+            )
+        ),
+        vol.Optional(CONF_EXPIRED_TIMER_MAX): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=100,
+                step=1.0,
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
     }
 )
 
@@ -647,6 +666,13 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
                 CONF_TRANSLATION_ENGINE: self.config_entry.options.get(
                     CONF_TRANSLATION_ENGINE
                 ),
+                CONF_EXPIRED_TIMER_RETENTION: self.config_entry.options.get(
+                    CONF_EXPIRED_TIMER_RETENTION,
+                    DEFAULT_VALUES[CONF_EXPIRED_TIMER_RETENTION],
+                ),
+                CONF_EXPIRED_TIMER_MAX: self.config_entry.options.get(
+                    CONF_EXPIRED_TIMER_MAX, DEFAULT_VALUES[CONF_EXPIRED_TIMER_MAX]
+                ),
             },
         )
 
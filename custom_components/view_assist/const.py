@@ -118,6 +118,8 @@ CONF_DUCKING_VOLUME = "ducking_volume"
 
 CONF_ENABLE_UPDATES = "enable_updates"
 CONF_TRANSLATION_ENGINE = "translation_engine"
+CONF_EXPIRED_TIMER_RETENTION = "expired_timer_retention"
+CONF_EXPIRED_TIMER_MAX = "expired_timer_max"
 CONF_DEVELOPER_DEVICE = "developer_device"
 CONF_DEVELOPER_MIMIC_DEVICE = "developer_mimic_device"
 
@@ -167,6 +169,8 @@ DEFAULT_VALUES = {
     CONF_DUCKING_VOLUME: 70,
     # Default integration options
     CONF_ENABLE_UPDATES: True,
+    CONF_EXPIRED_TIMER_RETENTION: 60,
+    CONF_EXPIRED_TIMER_MAX: 10,
     # Default developer otions
     CONF_DEVELOPER_DEVICE: "",
     CONF_DEVELOPER_MIMIC_DEVICE: "",
@@ -59,6 +59,11 @@ class CoreManager:
 
         setup_result = all(await asyncio.gather(*loader_tasks))
 
+        # Load sensor platform for timer diagnostics
+        await self.hass.config_entries.async_forward_entry_setups(
+            self.config, [Platform.SENSOR]
+        )
+
         # Load update platform
         if self.config.runtime_data.integration.enable_updates:
             _LOGGER.debug("Loading %s platform", Platform.UPDATE)
@@ -95,6 +100,8 @@ class CoreManager:
             _LOGGER.debug("Unloading update notifications")
             await hass.config_entries.async_unload_platforms(config, [Platform.UPDATE])
 
+        await hass.config_entries.async_unload_platforms(config, [Platform.SENSOR])
+
         unloader_tasks = set()
         for module in LOAD_MODULES:
             if hasattr(module, "async_unload"):
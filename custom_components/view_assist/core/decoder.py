@@ -5,7 +5,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import StrEnum
-import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -15,6 +14,7 @@ import wordtodigits
 from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN  # noqa: TID252
+from .translator.langpack import LANGUAGE_PACKS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -387,13 +387,9 @@ class TimeSentenceTranslator:
 
         if not p.exists():
             p = Path(Path(__file__).parent, "translations", "timers", "en.json")
-        try:
-            with p.open(mode="r", encoding="utf-8") as f:
-                self.lang = json.load(f)
-        except json.JSONDecodeError:
-            _LOGGER.error("Error decoding language file %s", p)
-        except OSError:
-            _LOGGER.error("Error loading language file %s", p)
+
+        if pack := LANGUAGE_PACKS.load(p, lang):
+            self.lang = pack.data
 
     def get_match(self, s: str, options: str | list[str]) -> str | None:
         """Get first matching option in string."""
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import bisect
+from collections.abc import Callable, Coroutine
 import contextlib
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 import datetime as dt
 from enum import StrEnum
+import heapq
 import inspect
+import itertools
 import logging
 import math
 import time
@@ -24,20 +27,37 @@ from homeassistant.components.intent import (
     TimerManager as IntentTimerManager,
 )
 from homeassistant.components.intent.timers import _normalize_name
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID, ATTR_NAME, ATTR_TIME
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_NAME,
+    ATTR_TIME,
+    EVENT_CORE_CONFIG_UPDATE,
+)
 from homeassistant.core import (
+    Event,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
+    callback,
 )
 from homeassistant.helpers import (
     area_registry as ar,
     config_validation as cv,
     device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
 )
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.storage import Store
 from homeassistant.util import ulid as ulid_util
 
@@ -51,13 +71,15 @@ from ..const import (  # noqa: TID252
     DOMAIN,
 )
 from ..helpers import (  # noqa: TID252
+    get_config_entry_by_entity_id,
     get_entity_id_from_conversation_device_id,
     get_mic_device_domain,
     get_mic_device_id_from_entity_id,
     get_mimic_entity_id,
 )
 from ..typed import VAEvent, VAEventType  # noqa: TID252
-from .translator import Normaliser, TimerInfo, Translator
+from .translator import TimerInfo, Translator
+from .translator.tracing import DecodeTrace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +90,22 @@ VA_COMMAND_EVENT_PREFIX = "va_timer_command_{}"
 TIMERS = "timers"
 TIMERS_STORE_NAME = f"{DOMAIN}.{TIMERS}"
 
+# Seconds to wait before writing the timer store, to coalesce updates
+TIMERS_SAVE_DELAY = 1
+
+# Interval to remove expired timers outside the retention policy
+EXPIRED_TIMERS_SWEEP_INTERVAL = dt.timedelta(minutes=5)
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
 
 class TimerClass(StrEnum):
     """Timer class."""
@@ -104,6 +142,67 @@ class TimerEvent(StrEnum):
     CANCELLED = "cancelled"
 
 
+class TimerRecurrence(StrEnum):
+    """Timer recurrence rules."""
+
+    DAILY = "daily"
+    WEEKDAYS = "weekdays"
+    WEEKENDS = "weekends"
+    DAYS = "days"
+    HOURS = "hours"
+
+
+# Days of week for each day based recurrence rule.  DAYS uses its own list
+RECURRENCE_DAYS = {
+    TimerRecurrence.DAILY: WEEKDAYS,
+    TimerRecurrence.WEEKDAYS: WEEKDAYS[:5],
+    TimerRecurrence.WEEKENDS: WEEKDAYS[5:],
+}
+
+
+# Upper bounds in ms of timer event lateness histogram buckets
+LATENESS_BUCKETS = [10, 50, 100, 250, 500, 1000, 5000]
+
+
+@dataclass
+class LatenessHistogram:
+    """Histogram of how late timer events fired, in ms."""
+
+    count: int = 0
+    total: float = 0
+    max: float = 0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENESS_BUCKETS) + 1)
+    )
+
+    def record(self, lateness: float) -> None:
+        """Add a lateness sample.  Early events count as on time."""
+        lateness = max(0.0, lateness)
+        self.count += 1
+        self.total += lateness
+        self.max = max(self.max, lateness)
+        self.buckets[bisect.bisect_left(LATENESS_BUCKETS, lateness)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return histogram as a dict."""
+        labels = [f"<={bound}" for bound in LATENESS_BUCKETS]
+        labels.append(f">{LATENESS_BUCKETS[-1]}")
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "max": round(self.max, 1),
+            "buckets": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+class TimerDeltaType(StrEnum):
+    """Timer store change types."""
+
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+
 @dataclass
 class Timer:
     """Class to hold timer."""
@@ -122,6 +221,16 @@ class Timer:
     created_at_monotonic: int = 0
     updated_at: int = 0
     extra_info: dict[str, Any] | None = None
+    recurrence: dict[str, Any] | None = None
+
+
+def valid_recurrence(value: dict[str, Any]) -> dict[str, Any]:
+    """Validate a timer recurrence rule has the days or hours it needs."""
+    if value["rule"] == TimerRecurrence.DAYS and not value.get("days"):
+        raise vol.Invalid("days are required for a days recurrence")
+    if value["rule"] == TimerRecurrence.HOURS and not value.get("hours"):
+        raise vol.Invalid("hours are required for an hours recurrence")
+    return value
 
 
 def get_formatted_time(timer_dt: dt.datetime, h24format: bool = False) -> str:
@@ -210,29 +319,111 @@ def make_singular(sentence: str) -> str:
 class VATimerStore:
     """Class to manager timer store."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self, hass: HomeAssistant, clock: Callable[[], float] = time.time
+    ) -> None:
         """Initialise."""
         self.hass = hass
+        self.clock = clock
         self.store = Store(hass, 1, TIMERS_STORE_NAME)
         self.listeners: dict[str, Callable] = {}
         self.timers: dict[str, Timer] = {}
         self.dirty = False
 
+        # Timer ids indexed by entity id, status and normalised name.  Names
+        # are normalised as HA intent timers do, so name matching ignores
+        # case and surrounding whitespace, where it used to be exact
+        self.by_entity: dict[str, set[str]] = {}
+        self.by_status: dict[str, set[str]] = {}
+        self.by_name: dict[str, set[str]] = {}
+
+        self.save_requests = 0
+        self.writes = 0
+
+    def _data_to_save(self) -> dict[str, Timer]:
+        """Return timers to write to store."""
+        self.writes += 1
+        self.dirty = False
+        return self.timers
+
     async def save(self):
-        """Save store."""
+        """Save store.
+
+        Writes are delayed by TIMERS_SAVE_DELAY so that several updates are
+        written once.  HA writes any pending save when it stops.
+        """
+        if self.dirty:
+            self.save_requests += 1
+            self.store.async_delay_save(self._data_to_save, TIMERS_SAVE_DELAY)
+
+    async def flush(self):
+        """Write any pending save now."""
         if self.dirty:
-            await self.store.async_save(self.timers)
-            self.dirty = False
+            # Also cancels the pending delayed save
+            await self.store.async_save(self._data_to_save())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return store write statistics."""
+        return {
+            "save_requests": self.save_requests,
+            "writes": self.writes,
+            "writes_avoided": max(0, self.save_requests - self.writes),
+        }
 
     async def load(self):
         """Load tiers from store."""
         stored: dict[str, Any] = await self.store.async_load()
         if stored:
             # stored = await self.migrate(stored)
-            for timer_id, timer in stored.items():
-                self.timers[timer_id] = Timer(**timer)
+            for timer in stored.values():
+                self.add(Timer(**timer))
         self.dirty = False
 
+    def _index_keys(self, timer: Timer) -> list[tuple[dict[str, set[str]], str]]:
+        """Get the index and key for each index the timer is in."""
+        keys = [(self.by_entity, timer.entity_id), (self.by_status, timer.status)]
+        if timer.name:
+            keys.append((self.by_name, _normalize_name(timer.name)))
+        return keys
+
+    def add(self, timer: Timer) -> None:
+        """Add timer to store and indexes."""
+        self.timers[timer.id] = timer
+        for index, key in self._index_keys(timer):
+            index.setdefault(key, set()).add(timer.id)
+
+    def remove(self, timer_id: str) -> Timer | None:
+        """Remove timer from store and indexes."""
+        if (timer := self.timers.pop(timer_id, None)) is None:
+            return None
+        for index, key in self._index_keys(timer):
+            if ids := index.get(key):
+                ids.discard(timer_id)
+                if not ids:
+                    del index[key]
+        return timer
+
+    def get_timer_ids(
+        self,
+        entity_id: str | None = None,
+        status: TimerStatus | None = None,
+        name: str | None = None,
+    ) -> set[str]:
+        """Get ids of timers matching all of the supplied filters."""
+        filters = []
+        if entity_id is not None:
+            filters.append(self.by_entity.get(entity_id, set()))
+        if status is not None:
+            filters.append(self.by_status.get(status, set()))
+        if name is not None:
+            filters.append(self.by_name.get(_normalize_name(name), set()))
+
+        if not filters:
+            return set(self.timers)
+        filters.sort(key=len)
+        return filters[0].intersection(*filters[1:])
+
     async def migrate(self, stored: dict[str, Any]) -> dict[str, Any]:
         """Migrate stored data."""
         # Migrate to entity id from device id
@@ -246,22 +437,51 @@ class VATimerStore:
                 del timer["device_id"]
 
         if migrated:
+            self.dirty = True
             await self.save()
         return stored
 
-    async def updated(self, timer_id: str):
+    async def updated(
+        self,
+        timer_id: str,
+        delta: TimerDeltaType = TimerDeltaType.UPDATED,
+        entity_id: str | None = None,
+    ):
         """Store has been updated."""
+        if timer := self.timers.get(timer_id):
+            timer.updated_at = int(self.clock())
+            entity_id = timer.entity_id
+
+        await self._changed(delta, {entity_id: [timer_id]})
+
+    async def add_timers(self, timers: list[Timer]) -> None:
+        """Add timers as one change, with one delta per entity and one save."""
+        for timer in timers:
+            self.add(timer)
+        if timers:
+            await self._changed(TimerDeltaType.ADDED, self._group_by_entity(timers))
+
+    async def remove_timers(self, timer_ids: list[str]) -> list[Timer]:
+        """Remove timers as one change, with one delta per entity and one save."""
+        removed = [timer for timer_id in timer_ids if (timer := self.remove(timer_id))]
+        if removed:
+            await self._changed(TimerDeltaType.REMOVED, self._group_by_entity(removed))
+        return removed
+
+    def _group_by_entity(self, timers: list[Timer]) -> dict[str | None, list[str]]:
+        """Group timer ids by entity id."""
+        by_entity: dict[str | None, list[str]] = {}
+        for timer in timers:
+            by_entity.setdefault(timer.entity_id, []).append(timer.id)
+        return by_entity
+
+    async def _changed(
+        self, delta: TimerDeltaType, timer_ids: dict[str | None, list[str]]
+    ) -> None:
+        """Send deltas for changed timer ids by entity, call listeners and save."""
         self.dirty = True
-        if timer_id in self.timers:
-            self.timers[timer_id].updated_at = time.mktime(
-                dt.datetime.now().timetuple()
-            )
-
-        async_dispatcher_send(
-            self.hass,
-            f"{DOMAIN}_event",
-            VAEvent(VAEventType.TIMER_UPDATE),
-        )
+        for entity_id, ids in timer_ids.items():
+            self._send_delta(delta, ids, entity_id)
 
         for callback in self.listeners.values():
             if inspect.iscoroutinefunction(callback):
@@ -270,6 +490,32 @@ class VATimerStore:
                 callback(self.timers)
         await self.save()
 
+    def _send_delta(
+        self, delta: TimerDeltaType, timer_ids: list[str], entity_id: str | None
+    ) -> None:
+        """Send timer changes to the owning entity's listeners only.
+
+        Falls back to a full update to all listeners if the owning entity
+        has no config entry.
+        """
+        if entity_id and (
+            config := get_config_entry_by_entity_id(self.hass, entity_id)
+        ):
+            async_dispatcher_send(
+                self.hass,
+                f"{DOMAIN}_{config.entry_id}_event",
+                VAEvent(
+                    VAEventType.TIMER_DELTA,
+                    {"type": delta, "entity_id": entity_id, "timer_ids": timer_ids},
+                ),
+            )
+        else:
+            async_dispatcher_send(
+                self.hass,
+                f"{DOMAIN}_event",
+                VAEvent(VAEventType.TIMER_UPDATE),
+            )
+
     def add_listener(self, entity, callback):
         """Add store updated listener."""
         self.listeners[entity] = callback
@@ -282,18 +528,144 @@ class VATimerStore:
 
     async def update_status(self, timer_id: str, status: TimerStatus):
         """Update timer current status."""
-        self.timers[timer_id].status = status
+        timer = self.remove(timer_id)
+        timer.status = status
+        self.add(timer)
         await self.updated(timer_id)
 
     async def cancel_timer(self, timer_id: str) -> bool:
         """Cancel timer."""
-        if timer_id in self.timers:
-            self.timers.pop(timer_id)
-            await self.updated(timer_id)
+        if timer := self.remove(timer_id):
+            await self.updated(timer_id, TimerDeltaType.REMOVED, timer.entity_id)
             return True
         return False
 
 
+class TimerScheduler:
+    """Schedule timer deadlines with a single loop call_at handle.
+
+    Deadlines are held in a min heap with one pending deadline per timer.
+    Cancelled or rescheduled entries are left in the heap and skipped when
+    they reach the top.  Deadlines are unix times from clock, so a virtual
+    clock can be used if the loop time advances with it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: ConfigEntry,
+        callback: Callable[[str, TimerEvent, float], Coroutine[Any, Any, None]],
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.config = config
+        self.callback = callback
+        self.clock = clock
+        self._heap: list[tuple[float, int, str, TimerEvent]] = []
+        self._entries: dict[str, int] = {}
+        self._seq = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_deadline: float | None = None
+
+    def __len__(self) -> int:
+        """Return number of scheduled deadlines."""
+        return len(self._entries)
+
+    def schedule(self, timer_id: str, deadline: float, event: TimerEvent) -> None:
+        """Schedule event for timer at deadline unix time.
+
+        Replaces any deadline already scheduled for the timer.
+        """
+        self._push(timer_id, deadline, event)
+        self._compact()
+        self._arm()
+
+    def schedule_many(self, deadlines: list[tuple[str, float, TimerEvent]]) -> None:
+        """Schedule a list of (timer id, deadline, event) and arm once."""
+        for timer_id, deadline, event in deadlines:
+            self._push(timer_id, deadline, event)
+        self._compact()
+        self._arm()
+
+    def cancel(self, timer_id: str) -> bool:
+        """Cancel any deadline scheduled for timer."""
+        if self._entries.pop(timer_id, None) is None:
+            return False
+        if not self._entries:
+            self.cancel_all()
+        return True
+
+    def cancel_all(self) -> None:
+        """Cancel all scheduled deadlines."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self._heap = []
+        self._entries = {}
+
+    def _push(self, timer_id: str, deadline: float, event: TimerEvent) -> None:
+        """Add deadline to heap, superseding any existing one for the timer."""
+        seq = next(self._seq)
+        self._entries[timer_id] = seq
+        heapq.heappush(self._heap, (deadline, seq, timer_id, event))
+
+    def _is_live(self, entry: tuple[float, int, str, TimerEvent]) -> bool:
+        """Return if heap entry is the current deadline for its timer."""
+        return self._entries.get(entry[2]) == entry[1]
+
+    def _compact(self) -> None:
+        """Rebuild heap if it is mostly superseded entries."""
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [e for e in self._heap if self._is_live(e)]
+            heapq.heapify(self._heap)
+
+    def _arm(self) -> None:
+        """Set the loop call_at handle for the next deadline."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        deadline = self._heap[0][0] if self._heap else None
+        if self._handle and deadline == self._handle_deadline:
+            return
+
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+        if deadline is not None:
+            loop = self.hass.loop
+            delay = max(0, deadline - self.clock())
+            self._handle = loop.call_at(loop.time() + delay, self._run_due)
+            self._handle_deadline = deadline
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return scheduler queue statistics."""
+        return {
+            "queue_depth": len(self._entries),
+            "heap_size": len(self._heap),
+            "next_deadline": self._handle_deadline if self._handle else None,
+        }
+
+    def _run_due(self) -> None:
+        """Run callbacks for all deadlines that are due."""
+        self._handle = None
+        now = self.clock()
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            deadline, _, timer_id, event = entry
+            del self._entries[timer_id]
+            self.config.async_create_background_task(
+                self.hass,
+                self.callback(timer_id, event, deadline),
+                name=f"Timer {timer_id} {event}",
+            )
+        self._arm()
+
+
 class TimerManager:
     """Class to handle VA timers."""
 
@@ -305,14 +677,35 @@ class TimerManager:
         except KeyError:
             return None
 
-    def __init__(self, hass: HomeAssistant, config: ConfigEntry) -> None:
-        """Initialise."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: ConfigEntry,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise.
+
+        Clock returns the current unix time and is shared with the store and
+        scheduler, so timers can be run against a virtual clock.
+        """
         self.hass = hass
         self.config = config
+        self.clock = clock
         self.tz: zoneinfo.ZoneInfo = zoneinfo.ZoneInfo(self.hass.config.time_zone)
 
-        self.store = VATimerStore(hass)
-        self.timer_tasks: dict[str, asyncio.Task] = {}
+        self.store = VATimerStore(hass, clock)
+        self.scheduler = TimerScheduler(hass, config, self._timer_deadline, clock)
+
+        # Static part of formatted timer output by timer id
+        self._output_cache: dict[str, tuple[tuple, dict[str, Any], str]] = {}
+
+        # Lateness of warning and expiry events by event and timer class
+        self.lateness: dict[str, dict[str, LatenessHistogram]] = {}
+
+        # Mic device domains by VA entity id and VA entity ids by conversation
+        # device id.  Cleared on registry and VA config entry changes
+        self._mic_domains: dict[str, str | None] = {}
+        self._device_entities: dict[str, str | None] = {}
 
     async def async_setup(self) -> bool:
         """Set up the Timer Manager."""
@@ -320,38 +713,135 @@ class TimerManager:
         # Register services
         TimerManagerServices(self.hass).register()
 
+        # Periodically remove expired timers outside the retention policy
+        self.config.async_on_unload(
+            async_track_time_interval(
+                self.hass,
+                self._async_sweep_expired_timers,
+                EXPIRED_TIMERS_SWEEP_INTERVAL,
+            )
+        )
+
+        # Clear resolved mic domains and entities if they could have changed
+        for event_type in [
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        ]:
+            self.config.async_on_unload(
+                self.hass.bus.async_listen(event_type, self._clear_resolution_cache)
+            )
+        self.config.async_on_unload(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._config_entry_changed
+            )
+        )
+
+        # Recurring timers occur at a time of day in the HA time zone
+        self.config.async_on_unload(
+            self.hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_time_zone_changed
+            )
+        )
+
         # Initialise timer store
         await self.store.load()
 
         # Load and start any existing timers from storage
         if self.store.timers:
-            # Removed any in expired status on restart as event already got fired
-            expired_timers = [
-                timer_id
-                for timer_id, timer in self.store.timers.items()
-                if timer.status == TimerStatus.EXPIRED
-            ]
-            for timer_id in expired_timers:
-                self.store.timers.pop(timer_id, None)
+            # Removed any in expired status on restart as event already got fired.
+            # Recurring timers instead start their next occurrence below
+            for timer_id in self.store.get_timer_ids(status=TimerStatus.EXPIRED):
+                timer = self.store.timers[timer_id]
+                if timer.recurrence:
+                    next_occurrence = self.get_next_occurrence(
+                        timer.recurrence, timer.original_expires_at
+                    )
+                    timer.expires_at = round(next_occurrence.timestamp())
+                else:
+                    self.store.remove(timer_id)
 
+            # Re-arm all timers in one pass and then finish any that expired
+            # during restart
+            deadlines = []
+            finished = []
             for timer in self.store.timers.values():
-                await self.start_timer(timer)
+                if deadline := self._get_deadline(timer):
+                    deadlines.append((timer.id, *deadline))
+                else:
+                    finished.append(timer.id)
+            self.scheduler.schedule_many(deadlines)
+
+            for timer_id in finished:
+                await self._timer_finished(timer_id)
+            for timer_id, _, _ in deadlines:
+                await self._timer_started(self.store.timers[timer_id])
 
         return True
 
     async def async_unload(self) -> bool:
         """Unload Timer Manager."""
 
-        # Cancel any timer tasks
-        for task in self.timer_tasks.values():
-            task.cancel()
-        self.timer_tasks = {}
+        # Cancel any scheduled timer deadlines
+        self.scheduler.cancel_all()
+
+        # Write any pending timer changes
+        await self.store.flush()
 
         # Unregister services
         TimerManagerServices(self.hass).unregister()
 
         return True
 
+    async def _async_sweep_expired_timers(self, *args) -> list[Timer]:
+        """Remove expired timers older than the retention age or over max count.
+
+        Max count is per entity, keeping the most recently expired.  Recurring
+        timers are not removed but start their next occurrence, as do ones
+        stopped on an esphome device, which leaves them expired.
+        """
+        integration = self.config.runtime_data.integration
+        max_age = int(integration.expired_timer_retention) * 60
+        max_count = int(integration.expired_timer_max)
+        now = self.clock()
+        intent_timers = self.hass.data[TIMER_DATA].timers
+
+        by_entity: dict[str | None, list[Timer]] = {}
+        to_restart = []
+        for timer_id in self.store.get_timer_ids(status=TimerStatus.EXPIRED):
+            timer = self.store.timers[timer_id]
+            if (
+                timer.recurrence
+                and timer_id not in intent_timers
+                and self._get_mic_device_domain(timer.entity_id) == "esphome"
+            ):
+                to_restart.append(timer)
+                continue
+            by_entity.setdefault(timer.entity_id, []).append(timer)
+
+        # Age is from the expiry time, as later updates to an expired timer
+        # would otherwise keep it for longer
+        to_remove = []
+        for timers in by_entity.values():
+            timers.sort(key=lambda t: t.expires_at, reverse=True)
+            for idx, timer in enumerate(timers):
+                if idx >= max_count or now - timer.expires_at > max_age:
+                    if timer.recurrence:
+                        to_restart.append(timer)
+                    else:
+                        to_remove.append(timer.id)
+
+        for timer in to_restart:
+            await self._start_next_occurrence(timer)
+
+        if not to_remove:
+            return []
+
+        for timer_id in to_remove:
+            self._output_cache.pop(timer_id, None)
+        removed = await self.store.remove_timers(to_remove)
+        _LOGGER.debug("Removed %s expired timers", len(removed))
+        return removed
+
     async def add_timer(
         self,
         timer_class: TimerClass,
@@ -362,46 +852,37 @@ class TimerManager:
         pre_expire_warning: int = 10,
         start: bool = True,
         extra_info: dict[str, Any] | None = None,
+        recurrence: dict[str, Any] | None = None,
+        trace: DecodeTrace | None = None,
     ) -> tuple:
-        """Add timer to store."""
+        """Add timer to store.
+
+        If a decode trace is given, the expiry calculation is added to it.
+        """
 
         if not entity_id:
             if not (entity_id := self._get_entity_id(device_id)):
                 raise vol.Invalid("Invalid device or entity id")
 
-        # calculate expiry time from TimerInfo
-        expiry = self.get_expiry_from_timerinfo(timer_info)
-
-        _LOGGER.debug("Adding timer: %s, %s, %s", entity_id, timer_info, expiry)
-
-        expires_unix_ts = round(expiry.timestamp()) if expiry else 0
-        time_now_unix = round(dt.datetime.now(tz=self.tz).timestamp())
+        timer = self._create_timer(
+            timer_class,
+            device_id,
+            entity_id,
+            timer_info,
+            name=name,
+            pre_expire_warning=pre_expire_warning,
+            extra_info=extra_info,
+            recurrence=recurrence,
+            trace=trace,
+        )
 
         if not (
-            duplicate_timer := self.is_duplicate_timer(entity_id, name, expires_unix_ts)
-        ):
-            # Add timer_info to extra_info
-            extra_info["timer_info"] = timer_info
-
-            timer = Timer(
-                id=ulid_util.ulid_now(),
-                timer_class=timer_class.lower(),
-                timer_type="time" if timer_info.is_time else "interval",
-                original_expires_at=expires_unix_ts,
-                expires_at=expires_unix_ts,
-                name=name,
-                entity_id=entity_id,
-                conversation_device_id=device_id,
-                pre_expire_warning=pre_expire_warning,
-                created_at=time_now_unix,
-                created_at_monotonic=time.monotonic_ns(),
-                updated_at=time_now_unix,
-                status=TimerStatus.INACTIVE,
-                extra_info=extra_info,
+            duplicate_timer := self.is_duplicate_timer(
+                entity_id, name, timer.expires_at
             )
-
-            self.store.timers[timer.id] = timer
-            await self.store.save()
+        ):
+            self.store.add(timer)
+            await self.store.updated(timer.id, TimerDeltaType.ADDED)
 
             if start:
                 await self.start_timer(timer)
@@ -414,64 +895,163 @@ class TimerManager:
 
         return "timer_already_exists", self.format_timer_output(duplicate_timer)
 
-    async def start_timer(self, timer: Timer):
-        """Start timer running."""
+    async def add_timers(
+        self, timers: list[dict[str, Any]]
+    ) -> list[tuple[str, dict[str, Any] | None]]:
+        """Add and start timers as one store change.
+
+        Each item has the add_timer arguments, except start.  New timers are
+        added to the store together, with one delta per entity and one save,
+        and scheduled in one pass.  Returns the response id and timer output
+        for each item, in order.
+        """
+        results: list[tuple[str, Timer | None]] = []
+        new_timers: list[Timer] = []
+        deadlines: list[tuple[str, float, TimerEvent]] = []
+        for item in timers:
+            entity_id = item.get("entity_id")
+            if not entity_id and item.get("device_id"):
+                entity_id = self._get_entity_id(item["device_id"])
+            if not entity_id or not item.get("timer_info"):
+                results.append(("timer_error", None))
+                continue
+
+            timer = self._create_timer(**{**item, "entity_id": entity_id})
+
+            # Check for duplicates in the store and earlier in this batch
+            if duplicate_timer := self.is_duplicate_timer(
+                entity_id, timer.name, timer.expires_at
+            ) or next(
+                (
+                    t
+                    for t in new_timers
+                    if t.entity_id == entity_id and t.expires_at == timer.expires_at
+                ),
+                None,
+            ):
+                results.append(("timer_already_exists", duplicate_timer))
+                continue
+
+            # Add as running, so the store only changes once
+            if deadline := self._get_deadline(timer):
+                timer.status = TimerStatus.RUNNING
+                deadlines.append((timer.id, *deadline))
+            new_timers.append(timer)
+            results.append(("timer_named_set" if timer.name else "timer_set", timer))
+
+        if new_timers:
+            await self.store.add_timers(new_timers)
+            self.scheduler.schedule_many(deadlines)
+
+            started = {timer_id for timer_id, _, _ in deadlines}
+            for timer in new_timers:
+                if timer.id not in started:
+                    await self._timer_finished(timer.id)
+                    continue
+                if self._get_mic_device_domain(timer.entity_id) == "esphome":
+                    await self._start_intent_timer(timer)
+                await self._fire_event(timer.id, TimerEvent.STARTED)
+            _LOGGER.debug("Added %s timers", len(new_timers))
+
+        return [
+            (response_id, self.format_timer_output(timer) if timer else None)
+            for response_id, timer in results
+        ]
+
+    def _create_timer(
+        self,
+        timer_class: TimerClass,
+        device_id: str | None,
+        entity_id: str,
+        timer_info: TimerInfo,
+        name: str | None = None,
+        pre_expire_warning: int = 10,
+        extra_info: dict[str, Any] | None = None,
+        recurrence: dict[str, Any] | None = None,
+        trace: DecodeTrace | None = None,
+    ) -> Timer:
+        """Create an inactive timer from timer info, without adding to store."""
+        # calculate expiry time from TimerInfo
+        start = time.perf_counter()
+        expiry = self.get_expiry_from_timerinfo(timer_info)
+        if trace:
+            Translator.get(self.hass).tracer.record_stage(
+                trace, "expiry", (time.perf_counter() - start) * 1000
+            )
+
+        # Day based recurring timers keep the time of day of the decoded
+        # expiry and first occur on the next of their days
+        if recurrence and recurrence["rule"] != TimerRecurrence.HOURS:
+            recurrence = {**recurrence, "time": expiry.strftime("%H:%M:%S")}
+            expiry = self.get_next_occurrence(recurrence, expiry.timestamp())
 
-        total_seconds = round(
-            timer.expires_at - dt.datetime.now(tz=self.tz).timestamp()
+        _LOGGER.debug("Adding timer: %s, %s, %s", entity_id, timer_info, expiry)
+
+        expires_unix_ts = round(expiry.timestamp()) if expiry else 0
+        time_now_unix = round(self._now().timestamp())
+
+        # Add timer_info to extra_info
+        extra_info = extra_info if extra_info is not None else {}
+        extra_info["timer_info"] = timer_info
+
+        return Timer(
+            id=ulid_util.ulid_now(),
+            timer_class=timer_class.lower(),
+            timer_type="time" if timer_info.is_time else "interval",
+            original_expires_at=expires_unix_ts,
+            expires_at=expires_unix_ts,
+            name=name,
+            entity_id=entity_id,
+            conversation_device_id=device_id,
+            pre_expire_warning=pre_expire_warning,
+            created_at=time_now_unix,
+            created_at_monotonic=time.monotonic_ns(),
+            updated_at=time_now_unix,
+            status=TimerStatus.INACTIVE,
+            extra_info=extra_info,
+            recurrence=recurrence,
         )
 
-        # Fire event if total seconds -ve
-        # likely caused by timer expiring during restart
+    def _get_deadline(self, timer: Timer) -> tuple[float, TimerEvent] | None:
+        """Get next deadline and event for timer, or None if it has expired."""
+        total_seconds = round(timer.expires_at - self._now().timestamp())
+
+        # Expired, likely caused by timer expiring during restart
         if total_seconds < 1:
+            return None
+
+        if timer.pre_expire_warning and timer.pre_expire_warning < total_seconds:
+            return timer.expires_at - timer.pre_expire_warning, TimerEvent.WARNING
+        return timer.expires_at, TimerEvent.EXPIRED
+
+    async def start_timer(self, timer: Timer):
+        """Start timer running."""
+        if not (deadline := self._get_deadline(timer)):
             await self._timer_finished(timer.id)
-        else:
-            if timer.pre_expire_warning and timer.pre_expire_warning >= total_seconds:
-                # Create task to wait for timer duration with no warning
-                self.timer_tasks[timer.id] = self.config.async_create_background_task(
-                    self.hass,
-                    self._wait_for_timer(
-                        timer.id, total_seconds, timer.expires_at, fire_warning=False
-                    ),
-                    name=f"Timer {timer.id}",
-                )
-                _LOGGER.debug(
-                    "Started %s timer for %ss, with no warning event",
-                    timer.name,
-                    total_seconds,
-                )
-            else:
-                # Create task to wait for timer duration minus any pre_expire_warning time
-                self.timer_tasks[timer.id] = self.config.async_create_background_task(
-                    self.hass,
-                    self._wait_for_timer(
-                        timer.id,
-                        total_seconds - timer.pre_expire_warning,
-                        timer.expires_at,
-                    ),
-                    name=f"Timer {timer.id}",
-                )
-                _LOGGER.debug(
-                    "Started %s timer for %ss, with warning event at %ss",
-                    timer.name,
-                    total_seconds,
-                    total_seconds - timer.pre_expire_warning,
-                )
+            return
 
-            # Set timer status
-            # if timer.status == TimerStatus.SNOOZED:
-            #    return
+        self.scheduler.schedule(timer.id, *deadline)
+        _LOGGER.debug(
+            "Started %s timer expiring at %s, with %s event at %s",
+            timer.name,
+            timer.expires_at,
+            deadline[1],
+            deadline[0],
+        )
+        await self._timer_started(timer)
 
-            device_domain = get_mic_device_domain(self.hass, timer.entity_id)
-            if device_domain == "esphome":
-                await self._start_intent_timer(timer)
+    async def _timer_started(self, timer: Timer) -> None:
+        """Update status and notify devices of a started timer."""
+        device_domain = self._get_mic_device_domain(timer.entity_id)
+        if device_domain == "esphome":
+            await self._start_intent_timer(timer)
 
-            if timer.status != TimerStatus.RUNNING:
-                await self.store.update_status(timer.id, TimerStatus.RUNNING)
+        if timer.status != TimerStatus.RUNNING:
+            await self.store.update_status(timer.id, TimerStatus.RUNNING)
 
-                # Fire event - done here to only fire if new timer started not
-                # existing timer restarted after HA restart
-                await self._fire_event(timer.id, TimerEvent.STARTED)
+            # Fire event - done here to only fire if new timer started not
+            # existing timer restarted after HA restart
+            await self._fire_event(timer.id, TimerEvent.STARTED)
 
     async def snooze_timer(
         self, timer_id: str, timer_info: TimerInfo
@@ -479,16 +1059,19 @@ class TimerManager:
         """Snooze expired timer.
 
         This will set the timer expire to now plus duration on an expired timer
-        and set the status to snooze.  Then re-run the timer.
+        and set the status to snooze.  Then re-run the timer.  A recurring timer
+        starts its next occurrence when dismissed after the snooze expires.
         """
         timer = self.store.timers.get(timer_id)
         if timer and timer.status == TimerStatus.EXPIRED:
-            expiry = dt.datetime.now() + dt.timedelta(
-                hours=timer_info.hours,
-                minutes=timer_info.minutes,
-                seconds=timer_info.seconds,
+            timer.expires_at = int(
+                self.clock()
+                + dt.timedelta(
+                    hours=timer_info.hours,
+                    minutes=timer_info.minutes,
+                    seconds=timer_info.seconds,
+                ).total_seconds()
             )
-            timer.expires_at = time.mktime(expiry.timetuple())
             timer.extra_info["snooze_duration"] = timer_info.sentence
             await self.store.update_status(timer_id, TimerStatus.SNOOZED)
             await self.start_timer(timer)
@@ -512,45 +1095,65 @@ class TimerManager:
         cancel_all: bool = False,
         just_expired: bool = False,
     ) -> bool:
-        """Cancel timer by timer id, device id or all."""
+        """Cancel timer by timer id, device id or all.
+
+        Every timer matched is cancelled, as the service describes, and True
+        returned if any were.  This used to return after cancelling the
+        first timer of a device or entity, or of all timers.
+        """
+        timer_ids = []
         if timer_id:
             timer_ids = [timer_id] if self.store.timers.get(timer_id) else []
         elif device_id or entity_id:
             if not entity_id:
                 entity_id = self._get_entity_id(device_id)
             if entity_id:
-                timer_ids = [
-                    timer_id
-                    for timer_id, timer in self.store.timers.items()
-                    if timer.entity_id == entity_id
-                ]
-            else:
-                timer_ids = []
+                timer_ids = self.store.get_timer_ids(entity_id=entity_id)
         elif cancel_all:
-            timer_ids = self.store.timers.copy().keys()
-
-        if timer_ids:
-            for timerid in timer_ids:
-                if (
-                    just_expired
-                    and self.store.timers[timerid].status != TimerStatus.EXPIRED
-                ):
-                    continue
+            timer_ids = self.store.timers.keys()
 
-                if timer := self.store.timers.get(timerid):
-                    device_domain = get_mic_device_domain(self.hass, timer.entity_id)
-                    if device_domain == "esphome":
-                        await self._cancel_intent_timer(timerid)
+        if just_expired:
+            timer_ids = [
+                timerid
+                for timerid in timer_ids
+                if self.store.timers[timerid].status == TimerStatus.EXPIRED
+            ]
 
-                if await self.store.cancel_timer(timerid):
-                    _LOGGER.debug("Cancelled timer: %s", timerid)
-                    if timer_task := self.timer_tasks.pop(timerid, None):
-                        if not timer_task.done():
-                            timer_task.cancel()
+        return bool(await self.cancel_timers(list(timer_ids)))
 
-                    return True
+    async def cancel_timers(self, timer_ids: list[str]) -> list[str]:
+        """Cancel timers by id as one store change.
 
-        return False
+        Cancelling an expired recurring timer dismisses that occurrence and
+        starts the next one, so it is not removed.  Returns the ids of timers
+        cancelled or dismissed.  Unknown ids are ignored.
+        """
+        timer_ids = [
+            timerid
+            for timerid in dict.fromkeys(timer_ids)
+            if timerid in self.store.timers
+        ]
+        dismissed = [
+            timerid
+            for timerid in timer_ids
+            if self.store.timers[timerid].recurrence
+            and self.store.timers[timerid].status == TimerStatus.EXPIRED
+        ]
+        for timerid in dismissed:
+            await self._start_next_occurrence(self.store.timers[timerid])
+
+        timer_ids = [timerid for timerid in timer_ids if timerid not in dismissed]
+        for timerid in timer_ids:
+            timer = self.store.timers[timerid]
+            device_domain = self._get_mic_device_domain(timer.entity_id)
+            if device_domain == "esphome":
+                await self._cancel_intent_timer(timerid)
+            self.scheduler.cancel(timerid)
+            self._output_cache.pop(timerid, None)
+
+        removed = await self.store.remove_timers(timer_ids)
+        _LOGGER.debug("Cancelled timers: %s", [timer.id for timer in removed])
+        return dismissed + [timer.id for timer in removed]
 
     def get_timers(
         self,
@@ -563,47 +1166,59 @@ class TimerManager:
     ) -> list[Timer]:
         """Get list of timers.
 
-        Optionally supply timer_id, device_id or entity id to filter the returned list
+        Optionally supply timer_id, device_id or entity id to filter the returned list.
+        A timer_id with a device or entity id only returns the timer if it
+        belongs to that entity.
         """
 
-        # Get list of all or active only timers
-        if include_expired:
-            timers = [
-                {"id": tid, **self.format_timer_output(timer)}
-                for tid, timer in self.store.timers.items()
-            ]
+        # Get ids of matching timers from the store indexes
+        if device_id or entity_id:
+            if not entity_id:
+                entity_id = self._get_entity_id(device_id)
+            if not entity_id:
+                # Unknown device, so has no timers
+                return []
+            if timer_id:
+                timer = self.store.timers.get(timer_id)
+                timer_ids = (
+                    {timer_id} if timer and timer.entity_id == entity_id else set()
+                )
+            else:
+                timer_ids = self.store.get_timer_ids(entity_id=entity_id)
+        elif timer_id:
+            timer_ids = {timer_id} if timer_id in self.store.timers else set()
         else:
-            timers = [
-                {"id": tid, **self.format_timer_output(timer)}
-                for tid, timer in self.store.timers.items()
-                if timer.status != TimerStatus.EXPIRED
-            ]
+            timer_ids = self.store.get_timer_ids()
 
-        if timer_id:
-            timers = [timer for timer in timers if timer["id"] == timer_id]
+        # Remove expired timers unless requested
+        if not include_expired:
+            timer_ids -= self.store.get_timer_ids(status=TimerStatus.EXPIRED)
 
-        elif device_id or entity_id:
-            if not entity_id:
-                entity_id = self._get_entity_id(device_id)
-            timers = [timer for timer in timers if timer["entity_id"] == entity_id]
+        # Ids are ulids, so sort in creation order
+        timers = [
+            {"id": tid, **self.format_timer_output(self.store.timers[tid])}
+            for tid in sorted(timer_ids)
+        ]
 
+        if device_id or entity_id:
             # If esphome device, filter by timers registered with timer manager
             # If using stop to cancel alarm on HAVPE, does not use the cancel service
             # and therefore the alarm is left behind in expired state.  So filter out any timers
             # that are not still registered with the intent timer manager
-            device_domain = get_mic_device_domain(self.hass, entity_id)
+            device_domain = self._get_mic_device_domain(entity_id)
             tm: IntentTimerManager = self.hass.data[TIMER_DATA]
             if device_domain == "esphome":
                 timers = [timer for timer in timers if timer["id"] in tm.timers]
 
             # Filter by name if supplied
             if name:
-                # Match on name or plural of name
+                # Match on name, ignoring case, or plural of name
                 name = str(name).strip()
+                named = self.store.get_timer_ids(name=name)
                 timers = [
                     timer
                     for timer in timers
-                    if timer["name"] == name
+                    if timer["id"] in named
                     or str(timer["duration"]).startswith(name)
                     or timer["time"] == name
                 ]
@@ -613,6 +1228,10 @@ class TimerManager:
 
         return timers
 
+    def _now(self) -> dt.datetime:
+        """Return the current time from the clock in the HA time zone."""
+        return dt.datetime.fromtimestamp(self.clock(), self.tz)
+
     def get_expiry_from_timerinfo(
         self, timerinfo: TimerInfo | None
     ) -> dt.datetime | None:
@@ -625,9 +1244,7 @@ class TimerManager:
             if timerinfo.timeofday == "pm" and timerinfo.hours < 12:
                 timerinfo.hours += 12
 
-            expiry = dt.datetime.now(tz=self.tz).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+            expiry = self._now().replace(hour=0, minute=0, second=0, microsecond=0)
             expiry += dt.timedelta(
                 hours=timerinfo.hours,
                 minutes=timerinfo.minutes,
@@ -635,15 +1252,6 @@ class TimerManager:
             )
 
             # Add days part to datetime
-            WEEKDAYS = [
-                "monday",
-                "tuesday",
-                "wednesday",
-                "thursday",
-                "friday",
-                "saturday",
-                "sunday",
-            ]
             if timerinfo.dayofweek:
                 if timerinfo.dayofweek == "tomorrow":
                     expiry += dt.timedelta(days=1)
@@ -651,18 +1259,13 @@ class TimerManager:
                     days_ahead = (
                         WEEKDAYS.index(timerinfo.dayofweek) - expiry.weekday() + 7
                     ) % 7
-                    if days_ahead == 0 and (
-                        timerinfo.hours < expiry.hour
-                        or (
-                            timerinfo.hours == expiry.hour
-                            and timerinfo.minutes <= expiry.minute
-                        )
-                    ):
+                    # If today and time has passed, use next week
+                    if days_ahead == 0 and expiry <= self._now():
                         days_ahead = 7
                     expiry += dt.timedelta(days=days_ahead)
 
             # If time is less than now, add 12 hours if no meridiem or 24 hours if am/pm
-            if expiry < dt.datetime.now(tz=self.tz):
+            if expiry < self._now():
                 if timerinfo.timeofday:
                     expiry += dt.timedelta(days=1)
                 else:
@@ -671,13 +1274,75 @@ class TimerManager:
             return expiry
 
         # TimeInfo is interval.  Make timedelta from parts
-        return dt.datetime.now(tz=self.tz) + dt.timedelta(
+        return self._now() + dt.timedelta(
             days=timerinfo.days,
             hours=timerinfo.hours,
             minutes=timerinfo.minutes,
             seconds=timerinfo.seconds,
         )
 
+    def get_next_occurrence(
+        self, recurrence: dict[str, Any] | None, anchor: float
+    ) -> dt.datetime | None:
+        """Get the next occurrence of a recurrence rule after now.
+
+        Day based rules occur at the recurrence time of day on their days of
+        week, in the current time zone.  Hours rules occur every n hours from
+        the anchor timestamp.
+        """
+        if not recurrence:
+            return None
+
+        if recurrence["rule"] == TimerRecurrence.HOURS:
+            period = int(recurrence["hours"]) * 3600
+            now = self._now().timestamp()
+            periods = max(0, math.floor((now - anchor) / period)) + 1
+            return dt.datetime.fromtimestamp(anchor + periods * period, self.tz)
+
+        hours, minutes, seconds = (int(p) for p in recurrence["time"].split(":"))
+        days = RECURRENCE_DAYS.get(recurrence["rule"], recurrence.get("days"))
+        return min(
+            self.get_expiry_from_timerinfo(
+                TimerInfo(
+                    hours=hours,
+                    minutes=minutes,
+                    seconds=seconds,
+                    dayofweek=day,
+                    # Set so a passed time moves a day, not 12 hours
+                    timeofday="am" if hours < 12 else "pm",
+                    is_time=True,
+                )
+            )
+            for day in days
+        )
+
+    async def _start_next_occurrence(self, timer: Timer) -> None:
+        """Start the next occurrence of a recurring timer."""
+        if next_occurrence := self.get_next_occurrence(
+            timer.recurrence, timer.original_expires_at
+        ):
+            timer.expires_at = round(next_occurrence.timestamp())
+            await self.start_timer(timer)
+
+    async def _async_time_zone_changed(self, *args) -> None:
+        """Recalculate day based recurring timers if the time zone changed."""
+        if self.hass.config.time_zone == str(self.tz):
+            return
+
+        self.tz = zoneinfo.ZoneInfo(self.hass.config.time_zone)
+
+        # Formatted output has times in the old time zone
+        self._output_cache.clear()
+
+        for timer in list(self.store.timers.values()):
+            if (
+                timer.recurrence
+                and timer.recurrence["rule"] != TimerRecurrence.HOURS
+                and timer.status == TimerStatus.RUNNING
+            ):
+                await self._start_next_occurrence(timer)
+                await self.store.updated(timer.id)
+
     async def _fire_event(self, timer_id: int, event_type: TimerEvent):
         """Fire timer event on the event bus."""
         if timer := self.store.timers.get(timer_id):
@@ -694,7 +1359,72 @@ class TimerManager:
     def _get_entity_id(self, device_id: str) -> str:
         """Ensure entity id."""
         # ensure entity id
-        return get_entity_id_from_conversation_device_id(self.hass, device_id)
+        if device_id not in self._device_entities:
+            self._device_entities[device_id] = (
+                get_entity_id_from_conversation_device_id(self.hass, device_id)
+            )
+        return self._device_entities[device_id]
+
+    def _get_mic_device_domain(self, entity_id: str) -> str | None:
+        """Get the mic device domain of a VA entity."""
+        if entity_id not in self._mic_domains:
+            self._mic_domains[entity_id] = get_mic_device_domain(self.hass, entity_id)
+        return self._mic_domains[entity_id]
+
+    @callback
+    def _clear_resolution_cache(self, event: Event | None = None) -> None:
+        """Clear resolved mic domains and entities."""
+        self._mic_domains.clear()
+        self._device_entities.clear()
+
+    @callback
+    def _config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Clear resolved mic domains and entities if a VA entry changed."""
+        if entry.domain == DOMAIN:
+            self._clear_resolution_cache()
+
+    def get_lateness(self, event: TimerEvent) -> dict[str, dict[str, Any]]:
+        """Return lateness histograms of an event by timer class."""
+        return {
+            timer_class: histogram.as_dict()
+            for timer_class, histogram in self.lateness.get(event, {}).items()
+        }
+
+    def get_mean_lateness(self, event: TimerEvent) -> float | None:
+        """Return mean lateness in ms of an event over all timer classes."""
+        histograms = self.lateness.get(event, {}).values()
+        if count := sum(histogram.count for histogram in histograms):
+            return round(sum(histogram.total for histogram in histograms) / count, 1)
+        return None
+
+    @property
+    def status_counts(self) -> dict[str, int]:
+        """Return number of timers in each status."""
+        return {
+            status: len(self.store.by_status.get(status, ())) for status in TimerStatus
+        }
+
+    @property
+    def scheduling_stats(self) -> dict[str, Any]:
+        """Return timer scheduling accuracy and queue statistics."""
+        return {
+            "timers_by_status": self.status_counts,
+            "scheduler": self.scheduler.stats,
+            "lateness": {
+                event: self.get_lateness(event)
+                for event in [TimerEvent.WARNING, TimerEvent.EXPIRED]
+            },
+        }
+
+    @property
+    def resolution_cache_stats(self) -> dict[str, int]:
+        """Return number of resolved mic domains and entities."""
+        return {
+            "mic_domains": len(self._mic_domains),
+            "device_entities": len(self._device_entities),
+        }
 
     def is_duplicate_timer(
         self, entity_id: str, name: str, expires_at: int
@@ -702,11 +1432,7 @@ class TimerManager:
         """Return if same timer already exists."""
 
         # Get timers for device_id
-        existing_device_timers = [
-            timer_id
-            for timer_id, timer in self.store.timers.items()
-            if timer.entity_id == entity_id
-        ]
+        existing_device_timers = self.store.get_timer_ids(entity_id=entity_id)
 
         if not existing_device_timers:
             return None
@@ -718,13 +1444,15 @@ class TimerManager:
         return None
 
     def format_timer_output(self, timer: Timer) -> dict[str, Any]:
-        """Format timer output."""
+        """Format timer output.
+
+        Fields that only change when the timer is updated are cached by
+        timer, and only the time remaining fields are calculated each call.
+        """
 
         def expires_in_seconds(expires_at: int) -> int:
             """Get expire in time in seconds."""
-            return (
-                dt.datetime.fromtimestamp(expires_at) - dt.datetime.now()
-            ).total_seconds()
+            return expires_at - self.clock()
 
         def expires_in_interval(expires_at: int) -> dict[str, Any]:
             """Get expire in time in days, hours, mins, secs tuple."""
@@ -745,6 +1473,44 @@ class TimerManager:
                 timer_type, dt.datetime.fromtimestamp(expires_at, self.tz), self.tz
             )
 
+        def speak_remaining(timer: Timer, speak_name: str, remaining: str) -> str:
+            """Generate speech status."""
+            output = speak_name
+            if timer.timer_type == "time":
+                output += f"for {remaining}"
+            elif timer.timer_type == "interval":
+                output += f"with {remaining} remaining"
+
+            return output.strip()
+
+        key = (timer.updated_at, timer.expires_at)
+        cached = self._output_cache.get(timer.id)
+        if cached is None or cached[0] != key:
+            cached = (key, *self._format_static_output(timer))
+            self._output_cache[timer.id] = cached
+        _, output, speak_name = cached
+
+        remaining = dynamic_remaining(timer.timer_type, timer.expires_at)
+        return {
+            **output,
+            "expiry": {
+                "seconds": math.ceil(expires_in_seconds(timer.expires_at)),
+                "interval": expires_in_interval(timer.expires_at),
+                "time": output["expiry"]["time"],
+                "day": get_named_day(output["expires"], self._now()),
+                "text": remaining,
+                "speak": speak_remaining(timer, speak_name, remaining),
+            },
+            "status": timer.status,
+            "extra_info": timer.extra_info,
+        }
+
+    def _format_static_output(self, timer: Timer) -> tuple[dict[str, Any], str]:
+        """Format timer output fields that only change when timer is updated.
+
+        Returns the output and the name part of the spoken status.
+        """
+
         def make_duration_text(timer_info: dict | TimerInfo) -> str:
             """Generate duration from timer info."""
             if isinstance(timer_info, TimerInfo):
@@ -764,31 +1530,20 @@ class TimerManager:
                     out += ", "
             return out
 
-        def speak_remaining(timer: Timer) -> str:
-            """Generate speech status."""
-
-            # Generate name and class
+        def speak_name(timer: Timer) -> str:
+            """Generate name and class for speech status."""
             name_class = timer.timer_class
             if timer.name:
                 name_class = f"{timer.name} {name_class}"
             elif timer.timer_type == "interval":
                 name_class = f"{timer.extra_info.get('sentence')} {name_class}"
 
-            output = (
-                f"{'an' if name_class[0].lower() in 'aeiou' else 'a'} {name_class} "
-            )
-
-            if timer.timer_type == "time":
-                output += f"for {dynamic_remaining(timer.timer_type, timer.expires_at)}"
-            elif timer.timer_type == "interval":
-                output += f"with {dynamic_remaining(timer.timer_type, timer.expires_at)} remaining"
-
-            return output.strip()
+            return f"{'an' if name_class[0].lower() in 'aeiou' else 'a'} {name_class} "
 
-        # dt_now = dt.datetime.now(self.tz)
+        # dt_now = self._now()
         dt_expiry = dt.datetime.fromtimestamp(timer.expires_at, self.tz)
 
-        return {
+        output = {
             "id": timer.id,
             "entity_id": timer.entity_id,
             "device_id": timer.conversation_device_id,
@@ -806,61 +1561,44 @@ class TimerManager:
                 timer.original_expires_at, self.tz
             ),
             "pre_expire_warning": timer.pre_expire_warning,
-            "expiry": {
-                "seconds": math.ceil(expires_in_seconds(timer.expires_at)),
-                "interval": expires_in_interval(timer.expires_at),
-                # "day": get_named_day(dt_expiry, dt_now),
-                "time": get_formatted_time(dt_expiry),
-                "day": get_named_day(dt_expiry, dt.datetime.now(self.tz)),
-                "text": dynamic_remaining(timer.timer_type, timer.expires_at),
-                "speak": speak_remaining(timer),
-            },
+            "expiry": {"time": get_formatted_time(dt_expiry)},
             "created_at": dt.datetime.fromtimestamp(timer.created_at, self.tz),
             "updated_at": dt.datetime.fromtimestamp(timer.updated_at, self.tz),
             "status": timer.status,
+            "recurrence": timer.recurrence,
             "extra_info": timer.extra_info,
         }
+        return output, speak_name(timer)
 
-    async def _wait_for_timer(
-        self, timer_id: str, seconds: int, expires_at: int, fire_warning: bool = True
+    async def _timer_deadline(
+        self, timer_id: str, event: TimerEvent, deadline: float
     ) -> None:
-        """Sleep until timer is up. Timer is only finished if it hasn't been updated."""
-        try:
-            await asyncio.sleep(seconds)
-            timer = self.store.timers.get(timer_id)
-            _LOGGER.debug("Timer finished: %s", timer)
-            _LOGGER.debug(
-                "Details: %s, %s, %s",
-                int(expires_at),
-                fire_warning,
-                timer.pre_expire_warning,
-            )
-            if timer and int(timer.expires_at) == int(expires_at):
-                if fire_warning and timer.pre_expire_warning:
-                    await self._pre_expire_warning(timer_id)
-                else:
-                    await self._timer_finished(timer_id)
-        except asyncio.CancelledError:
-            pass  # expected when timer is updated
-
-    async def _pre_expire_warning(self, timer_id: str) -> None:
-        """Call event on timer pre_expire_warning and then call expire."""
-        timer = self.store.timers[timer_id]
-
-        if timer and timer.status == TimerStatus.RUNNING:
-            await self._fire_event(timer_id, TimerEvent.WARNING)
-
-            await asyncio.sleep(timer.pre_expire_warning)
+        """Handle a scheduled timer deadline."""
+        lateness = (self.clock() - deadline) * 1000
+        timer = self.store.timers.get(timer_id)
+        _LOGGER.debug("Timer deadline: %s - %s", event, timer)
+        if not timer:
+            return
+
+        self.lateness.setdefault(event, {}).setdefault(
+            timer.timer_class, LatenessHistogram()
+        ).record(lateness)
+
+        if event == TimerEvent.WARNING:
+            if timer.status == TimerStatus.RUNNING:
+                await self._fire_event(timer_id, TimerEvent.WARNING)
+                self.scheduler.schedule(timer_id, timer.expires_at, TimerEvent.EXPIRED)
+        else:
             await self._timer_finished(timer_id)
 
     async def _timer_finished(self, timer_id: str) -> None:
         """Call event handlers when a timer finishes."""
         _LOGGER.debug("Timer expired: %s", timer_id)
         await self.store.update_status(timer_id, TimerStatus.EXPIRED)
-        self.timer_tasks.pop(timer_id, None)
+        self.scheduler.cancel(timer_id)
 
         timer = self.store.timers.get(timer_id)
-        device_domain = get_mic_device_domain(self.hass, timer.entity_id)
+        device_domain = self._get_mic_device_domain(timer.entity_id)
         if device_domain == "esphome":
             await self._finish_intent_timer(timer_id)
         else:
@@ -870,9 +1608,7 @@ class TimerManager:
         """Send intent to VA intent handler."""
         device_id = get_mic_device_id_from_entity_id(self.hass, timer.entity_id)
         orig_total_seconds = round(timer.expires_at - timer.created_at)
-        total_seconds = round(
-            timer.expires_at - dt.datetime.now(tz=self.tz).timestamp()
-        )
+        total_seconds = round(timer.expires_at - self._now().timestamp())
         _LOGGER.debug(
             "Sending intent timer for device id: %s for %s seconds",
             device_id,
@@ -950,6 +1686,10 @@ class TimerManagerServices:
     """Class to hold timer manager service names."""
 
     ATTR_JUST_EXPIRED = "just_expired"
+    ATTR_RECURRENCE = "recurrence"
+    ATTR_SENTENCES = "sentences"
+    ATTR_TIMERS = "timers"
+    ATTR_TIMER_IDS = "timer_ids"
 
     SET_TIMER_SERVICE_SCHEMA = vol.Schema(
         {
@@ -960,6 +1700,16 @@ class TimerManagerServices:
             vol.Optional(ATTR_LANGUAGE): str,
             vol.Required(ATTR_TIME): str,
             vol.Optional(ATTR_EXTRA): vol.Schema({}, extra=vol.ALLOW_EXTRA),
+            vol.Optional(ATTR_RECURRENCE): vol.All(
+                {
+                    vol.Required("rule"): vol.Coerce(TimerRecurrence),
+                    vol.Optional("days"): vol.All(
+                        cv.ensure_list, [vol.All(vol.Lower, vol.In(WEEKDAYS))]
+                    ),
+                    vol.Optional("hours"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                },
+                valid_recurrence,
+            ),
         }
     )
 
@@ -973,6 +1723,21 @@ class TimerManagerServices:
         }
     )
 
+    SET_TIMERS_SERVICE_SCHEMA = vol.Schema(
+        {
+            vol.Required(ATTR_TIMERS): vol.All(
+                cv.ensure_list, [SET_TIMER_SERVICE_SCHEMA]
+            ),
+            vol.Optional(ATTR_LANGUAGE): str,
+        }
+    )
+
+    CANCEL_TIMERS_SERVICE_SCHEMA = vol.Schema(
+        {
+            vol.Required(ATTR_TIMER_IDS): vol.All(cv.ensure_list, [str]),
+        }
+    )
+
     SNOOZE_TIMER_SERVICE_SCHEMA = vol.Schema(
         {
             vol.Required(ATTR_TIMER_ID): str,
@@ -990,6 +1755,28 @@ class TimerManagerServices:
         }
     )
 
+    DECODE_TIME_SENTENCES_SERVICE_SCHEMA = vol.Schema(
+        {
+            vol.Required(ATTR_SENTENCES): vol.All(
+                cv.ensure_list,
+                [
+                    vol.Any(
+                        str,
+                        vol.Schema(
+                            {
+                                vol.Required(ATTR_TIME): str,
+                                vol.Optional(ATTR_LANGUAGE): str,
+                                vol.Optional(ATTR_TYPE): str,
+                            }
+                        ),
+                    )
+                ],
+            ),
+            vol.Optional(ATTR_LANGUAGE): str,
+            vol.Optional(ATTR_TYPE): str,
+        }
+    )
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the menu manager services."""
         self.hass = hass
@@ -1021,6 +1808,22 @@ class TimerManagerServices:
             supports_response=SupportsResponse.OPTIONAL,
         )
 
+        self.hass.services.async_register(
+            DOMAIN,
+            "set_timers",
+            self._async_handle_set_timers,
+            schema=self.SET_TIMERS_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        self.hass.services.async_register(
+            DOMAIN,
+            "cancel_timers",
+            self._async_handle_cancel_timers,
+            schema=self.CANCEL_TIMERS_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
         self.hass.services.async_register(
             DOMAIN,
             "get_timers",
@@ -1029,19 +1832,44 @@ class TimerManagerServices:
             supports_response=SupportsResponse.ONLY,
         )
 
+        self.hass.services.async_register(
+            DOMAIN,
+            "decode_time_sentences",
+            self._async_handle_decode_time_sentences,
+            schema=self.DECODE_TIME_SENTENCES_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
     def unregister(self):
         """Unregister menu manager services."""
-        for service in ["set_timer", "snooze_timer", "cancel_timer", "get_timers"]:
+        for service in [
+            "set_timer",
+            "snooze_timer",
+            "cancel_timer",
+            "set_timers",
+            "cancel_timers",
+            "get_timers",
+            "decode_time_sentences",
+        ]:
             self.hass.services.async_remove(DOMAIN, service)
 
     async def decode_time_sentence(
-        self, sentence: str, language: str = "en", time_type: str = "time"
+        self,
+        sentence: str,
+        language: str = "en",
+        time_type: str = "time",
+        trace: DecodeTrace | None = None,
     ) -> tuple[None, None]:
-        """Decode a time sentence into TimerTime or TimerInterval object."""
+        """Decode a time sentence into TimerTime or TimerInterval object.
+
+        A trace is started if tracing is enabled and none is given.
+        """
         translator = Translator.get(self.hass)
-        normaliser = Normaliser(self.hass, locale=language)
-        en = await translator.translate_time(sentence, language)
-        n = await normaliser.normalise(en, type_hint=time_type)
+        if trace is None:
+            trace = translator.tracer.start(sentence, language, time_type)
+        en, n = await translator.decode_time(
+            sentence, language, type_hint=time_type, trace=trace
+        )
 
         if n:
             _LOGGER.debug(
@@ -1073,6 +1901,13 @@ class TimerManagerServices:
             }
         return await translator.translate_time_response(response_id, params, language)
 
+    def _get_timer_class_and_time_type(self, timer_type: str) -> tuple[str, str]:
+        """Get timer class and time sentence type from service timer type."""
+        if timer_type and str(timer_type).lower() in ["reminder", "alarm"]:
+            # TODO: What is this for?
+            return TimerClass.REMINDER, "time"
+        return timer_type, "interval"
+
     async def _async_handle_set_timer(self, call: ServiceCall) -> ServiceResponse:
         """Handle a set timer service call."""
         entity_id = call.data.get(ATTR_ENTITY_ID)
@@ -1083,15 +1918,12 @@ class TimerManagerServices:
         language = call.data.get(ATTR_LANGUAGE, "en")
         extra_data = call.data.get(ATTR_EXTRA)
 
-        if timer_type and str(timer_type).lower() in ["reminder", "alarm"]:
-            # TODO: What is this for?
-            timer_type = TimerClass.REMINDER
-            time_type = "time"
-        else:
-            time_type = "interval"
+        timer_type, time_type = self._get_timer_class_and_time_type(timer_type)
 
+        # Trace covers the expiry calculation when the timer is added
+        trace = Translator.get(self.hass).tracer.start(timer_time, language, time_type)
         sentence, timer_info = await self.decode_time_sentence(
-            timer_time, language=language, time_type=time_type
+            timer_time, language=language, time_type=time_type, trace=trace
         )
 
         if not timer_info:
@@ -1122,6 +1954,8 @@ class TimerManagerServices:
                 timer_info=timer_info,
                 name=name,
                 extra_info=extra_info,
+                recurrence=call.data.get(self.ATTR_RECURRENCE),
+                trace=trace,
             )
 
             response = await self.create_response(response_id, timer, language)
@@ -1135,6 +1969,75 @@ class TimerManagerServices:
         response = await self.create_response("timer_error", language=language)
         return {"response": response}
 
+    async def _async_handle_set_timers(self, call: ServiceCall) -> ServiceResponse:
+        """Handle a set timers service call.
+
+        Sentences are decoded as one batch and the timers added as one store
+        change.  The response has a result for each timer, in order.
+        """
+        language = call.data.get(ATTR_LANGUAGE, "en")
+
+        entries = []
+        sentences = []
+        for entry in call.data[self.ATTR_TIMERS]:
+            timer_type, time_type = self._get_timer_class_and_time_type(
+                entry.get(ATTR_TYPE)
+            )
+            entry_language = entry.get(ATTR_LANGUAGE, language)
+            entries.append((entry, timer_type, entry_language))
+            sentences.append((entry[ATTR_TIME], entry_language, time_type))
+
+        translator = Translator.get(self.hass)
+        decoded = await translator.decode_time_batch(sentences)
+
+        mimic_device = get_mimic_entity_id(self.hass)
+        items = []
+        for (entry, timer_type, _), (_, timer_info) in zip(
+            entries, decoded, strict=True
+        ):
+            entity_id = entry.get(ATTR_ENTITY_ID)
+            device_id = entry.get(ATTR_DEVICE_ID)
+            if entity_id is None and device_id is None:
+                entity_id = mimic_device
+
+            extra_info = {"sentence": entry[ATTR_TIME]}
+            if extra_data := entry.get(ATTR_EXTRA):
+                extra_info.update(extra_data)
+
+            items.append(
+                {
+                    "timer_class": timer_type,
+                    "device_id": device_id,
+                    "entity_id": entity_id,
+                    "timer_info": timer_info,
+                    "name": entry.get(ATTR_NAME),
+                    "extra_info": extra_info,
+                    "recurrence": entry.get(self.ATTR_RECURRENCE),
+                }
+            )
+
+        tm = TimerManager.get(self.hass)
+        added = await tm.add_timers(items)
+
+        responses = await asyncio.gather(
+            *[
+                self.create_response(response_id, timer, entry_language)
+                for (response_id, timer), (_, _, entry_language) in zip(
+                    added, entries, strict=True
+                )
+            ]
+        )
+        return {
+            "results": [
+                {
+                    "timer_id": timer["id"] if timer else None,
+                    "timer": timer,
+                    "response": response,
+                }
+                for (_, timer), response in zip(added, responses, strict=True)
+            ]
+        }
+
     async def _async_handle_snooze_timer(self, call: ServiceCall) -> ServiceResponse:
         """Handle a set timer service call."""
         timer_id = call.data.get(ATTR_TIMER_ID)
@@ -1189,6 +2092,32 @@ class TimerManagerServices:
             return {"response": response}
         return {"error": "no attribute supplied"}
 
+    async def _async_handle_cancel_timers(self, call: ServiceCall) -> ServiceResponse:
+        """Handle a cancel timers service call.
+
+        Timers are removed as one store change.  The response has a result
+        for each timer id, in order.
+        """
+        timer_ids = call.data[self.ATTR_TIMER_IDS]
+
+        tm = TimerManager.get(self.hass)
+        cancelled = set(await tm.cancel_timers(timer_ids))
+
+        responses = {
+            True: await self.create_response("timer_cancelled"),
+            False: await self.create_response("timer_not_found"),
+        }
+        return {
+            "results": [
+                {
+                    "timer_id": timer_id,
+                    "cancelled": timer_id in cancelled,
+                    "response": responses[timer_id in cancelled],
+                }
+                for timer_id in timer_ids
+            ]
+        }
+
     async def _async_handle_get_timers(self, call: ServiceCall) -> ServiceResponse:
         """Handle a cancel timer service call."""
         entity_id = call.data.get(ATTR_ENTITY_ID)
@@ -1206,3 +2135,51 @@ class TimerManagerServices:
             include_expired=include_expired,
         )
         return {"result": result}
+
+    async def _async_handle_decode_time_sentences(
+        self, call: ServiceCall
+    ) -> ServiceResponse:
+        """Handle a decode time sentences service call."""
+        language = call.data.get(ATTR_LANGUAGE, "en")
+        timer_type = call.data.get(ATTR_TYPE)
+
+        sentences = []
+        for entry in call.data[self.ATTR_SENTENCES]:
+            if isinstance(entry, str):
+                entry = {ATTR_TIME: entry}
+            entry_type = entry.get(ATTR_TYPE, timer_type)
+            if entry_type is None:
+                time_type = None
+            elif str(entry_type).lower() in ["reminder", "alarm"]:
+                time_type = "time"
+            else:
+                time_type = "interval"
+            sentences.append(
+                (entry[ATTR_TIME], entry.get(ATTR_LANGUAGE, language), time_type)
+            )
+
+        translator = Translator.get(self.hass)
+        decoded = await translator.decode_time_batch(sentences)
+
+        tm = TimerManager.get(self.hass)
+        results = []
+        for (sentence, locale, _), (translated, timer_info) in zip(
+            sentences, decoded, strict=True
+        ):
+            result = {
+                "sentence": sentence,
+                "language": locale,
+                "translated": translated,
+                "timer_info": asdict(timer_info) if timer_info else None,
+                "timer_type": None,
+                "expires": None,
+                "time": None,
+            }
+            if expiry := tm.get_expiry_from_timerinfo(timer_info):
+                result["timer_type"] = (
+                    TimerType.TIME if timer_info.is_time else TimerType.INTERVAL
+                )
+                result["expires"] = expiry
+                result["time"] = get_formatted_time(expiry)
+            results.append(result)
+        return {"results": results}
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from pathlib import Path
 from typing import Any
 
 from homeassistant.components import conversation
@@ -9,9 +12,19 @@ from homeassistant.core import HomeAssistant
 
 from ...const import DOMAIN  # noqa: TID252
 from ...typed import VAConfigEntry  # noqa: TID252
+from .cache import TimerInfoCache
+from .executor import DecodeExecutor, DecodeTimeoutError
+from .fastpath import FastPathDecoder
+from .langpack import LANGUAGE_PACKS
 from .normaliser import Normaliser, TimerInfo
+from .tracing import DecodeTrace, DecodeTracer
 from .translator import ConversationAgentTranslator, TimeSentenceTranslator
 
+_LOGGER = logging.getLogger(__name__)
+
+# Cache directory for compiled language packs, within the VA config dir
+COMPILED_PACKS_DIR = "compiled_packs"
+
 __all__ = [
     "DOMAIN",
     "ConversationAgentTranslator",
@@ -35,6 +48,11 @@ class Translator:
         self.hass = hass
         self.config = config
         self.translator = None
+        self.decode_cache = TimerInfoCache()
+        self.fast_path = FastPathDecoder()
+        self.tracer = DecodeTracer()
+        self.decode_executor = DecodeExecutor(hass)
+        self._remove_pack_listener = None
 
     async def async_setup(self) -> bool:
         """Set up the Translator."""
@@ -45,11 +63,38 @@ class Translator:
         else:
             self.translator = ConversationAgentTranslator(self.hass, self.config)
 
+        # Clear decode cache if any language pack is reloaded
+        self._remove_pack_listener = LANGUAGE_PACKS.add_listener(
+            self.decode_cache.clear
+        )
+
+        # Load compiled packs for the default language in the background
+        LANGUAGE_PACKS.cache_dir = Path(
+            self.hass.config.path(DOMAIN, COMPILED_PACKS_DIR)
+        )
+
+        async def _async_preload() -> None:
+            await self.hass.async_add_executor_job(self._preload_language_packs)
+
+        self.config.async_create_background_task(
+            self.hass, _async_preload(), name="VA preload language packs"
+        )
+
         return True
 
+    def _preload_language_packs(self) -> None:
+        """Load normaliser and default language packs, if they exist."""
+        for name in ["normaliser", self.hass.config.language.split("-")[0]]:
+            path = LANGUAGE_PACKS.get_pack_path(self.hass, name)
+            if path.exists():
+                LANGUAGE_PACKS.load(path, name)
+
     async def async_unload(self) -> bool:
         """Unload the Translator."""
-        # Currently nothing to unload
+        if self._remove_pack_listener:
+            self._remove_pack_listener()
+            self._remove_pack_listener = None
+        self.decode_cache.clear()
         return True
 
     async def translate_time(self, text: str, locale: str = "en") -> str:
@@ -59,6 +104,187 @@ class Translator:
 
         return await self.translator.translate(text, locale=locale)
 
+    def _end_trace(
+        self,
+        trace: DecodeTrace | None,
+        path: str,
+        decoded: tuple[str | None, TimerInfo | None],
+        stage: str | None = None,
+    ) -> None:
+        """Record decode result and final stage on a trace."""
+        if trace:
+            trace.mark(stage or path)
+            trace.path = path
+            trace.translated = decoded[0]
+            if decoded[1]:
+                trace.pattern = decoded[1].pattern
+            self.tracer.record(trace)
+
+    async def decode_time(
+        self,
+        text: str,
+        locale: str = "en",
+        type_hint: str | None = None,
+        trace: DecodeTrace | None = None,
+    ) -> tuple[str | None, TimerInfo | None]:
+        """Translate and normalise a time sentence to a TimerInfo.
+
+        Returns the translated sentence and TimerInfo.  Canonical english
+        sentences are decoded by the fast path, otherwise the decode cache is
+        used if the same sentence has been decoded before.  Long sentences
+        are decoded in the bounded decode executor.  If tracing is
+        enabled, stage timings are recorded on trace or a new trace.
+        """
+        trace = trace or self.tracer.start(text, locale, type_hint)
+
+        if isinstance(self.translator, TimeSentenceTranslator) and (
+            decoded := self.fast_path.decode(text, locale)
+        ):
+            self._end_trace(trace, "fast_path", decoded)
+            return decoded
+
+        key = self.decode_cache.make_key(text, locale, type_hint)
+        if cached := self.decode_cache.get(key):
+            self._end_trace(trace, "cache", cached)
+            return cached
+
+        sentence = text
+        if isinstance(self.translator, TimeSentenceTranslator):
+            # Use own translator as decode may run in the executor
+            translator = TimeSentenceTranslator(self.hass, self.config)
+            loaded = await translator.async_load_language_pack(locale)
+            if trace:
+                trace.mark("load_language_pack")
+        else:
+            translator = None
+            loaded = False
+            sentence = await self.translate_time(text, locale)
+            if trace:
+                trace.mark("agent_translation")
+
+        normaliser = Normaliser(self.hass, locale=locale)
+        normalise = await normaliser.async_load_language_packs()
+        if trace:
+            trace.mark("load_normaliser_packs")
+
+        def decode() -> tuple[str | None, TimerInfo | None]:
+            translated = (
+                translator.translate_sentence(sentence, trace=trace)
+                if loaded
+                else sentence
+            )
+            if not normalise:
+                return translated, None
+            return translated, normaliser.normalise_sentence(
+                translated, type_hint, trace
+            )
+
+        try:
+            translated, timer_info = await self.decode_executor.run(
+                decode, len(sentence or "")
+            )
+        except DecodeTimeoutError as ex:
+            _LOGGER.warning("Unable to decode '%s' - %s", sentence, ex)
+            translated, timer_info = sentence, None
+        if timer_info:
+            self.decode_cache.set(key, translated, timer_info)
+        self._end_trace(trace, "full", (translated, timer_info), "cache_store")
+        return translated, timer_info
+
+    async def decode_time_batch(
+        self, sentences: list[tuple[str, str, str | None]]
+    ) -> list[tuple[str | None, TimerInfo | None]]:
+        """Translate and normalise a list of time sentences.
+
+        Each entry is (sentence, locale, type_hint).  Language packs are
+        loaded once per locale and large batches are decoded in the bounded
+        decode executor.  With a conversation agent translator, sentences are
+        decoded concurrently.
+        """
+        if not isinstance(self.translator, TimeSentenceTranslator):
+            return list(
+                await asyncio.gather(
+                    *[
+                        self.decode_time(text, locale, type_hint)
+                        for text, locale, type_hint in sentences
+                    ]
+                )
+            )
+
+        results: list[tuple[str | None, TimerInfo | None]] = [
+            (None, None) for _ in sentences
+        ]
+        traces = [self.tracer.start(*sentence) for sentence in sentences]
+        to_decode: list[int] = []
+        for idx, (text, locale, type_hint) in enumerate(sentences):
+            key = self.decode_cache.make_key(text, locale, type_hint)
+            if decoded := self.fast_path.decode(text, locale):
+                results[idx] = decoded
+                self._end_trace(traces[idx], "fast_path", decoded)
+            elif cached := self.decode_cache.get(key):
+                results[idx] = cached
+                self._end_trace(traces[idx], "cache", cached)
+            else:
+                to_decode.append(idx)
+
+        if not to_decode:
+            return results
+
+        # Load language packs once per locale
+        decoders: dict[str, tuple[TimeSentenceTranslator, Normaliser] | None] = {}
+        for idx in to_decode:
+            locale = sentences[idx][1]
+            if locale in decoders:
+                continue
+            translator = TimeSentenceTranslator(self.hass, self.config)
+            normaliser = Normaliser(self.hass, locale=locale)
+            loaded = await translator.async_load_language_pack(locale)
+            loaded = loaded and await normaliser.async_load_language_packs()
+            decoders[locale] = (translator, normaliser) if loaded else None
+
+        def decode() -> list[tuple[str | None, TimerInfo | None]]:
+            output = []
+            for idx in to_decode:
+                text, locale, type_hint = sentences[idx]
+                if trace := traces[idx]:
+                    trace.mark("batch_wait")
+                if not (decoder := decoders[locale]):
+                    output.append((text, None))
+                    continue
+                translated = decoder[0].translate_sentence(text, trace=trace)
+                try:
+                    timer_info = decoder[1].normalise_sentence(
+                        translated, type_hint, trace
+                    )
+                except ValueError as ex:
+                    # Do not fail the whole batch for one bad sentence
+                    _LOGGER.warning("Unable to decode '%s' - %s", translated, ex)
+                    timer_info = None
+                output.append((translated, timer_info))
+            return output
+
+        try:
+            decoded = await self.decode_executor.run(
+                decode,
+                sum(len(sentences[idx][0]) for idx in to_decode),
+                len(to_decode),
+            )
+        except DecodeTimeoutError as ex:
+            _LOGGER.warning("Unable to decode batch of sentences - %s", ex)
+            decoded = [(sentences[idx][0], None) for idx in to_decode]
+
+        for idx, (translated, timer_info) in zip(to_decode, decoded, strict=True):
+            if timer_info:
+                text, locale, type_hint = sentences[idx]
+                self.decode_cache.set(
+                    self.decode_cache.make_key(text, locale, type_hint),
+                    translated,
+                    timer_info,
+                )
+            results[idx] = (translated, timer_info)
+            self._end_trace(traces[idx], "full", results[idx], "cache_store")
+        return results
+
     async def translate_time_response(
         self, sentence_id: str, params: dict[str, Any] | None = None, locale: str = "en"
     ) -> str | None:
@@ -0,0 +1,68 @@
+"""Result cache for decoded time sentences."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import dataclasses
+import threading
+from typing import Any
+
+from .normaliser import TimerInfo
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class TimerInfoCache:
+    """Bounded LRU cache of decoded TimerInfo results.
+
+    TimerInfo is relative to when it is used (expiry is calculated from it),
+    so the same sentence always decodes to the same TimerInfo for a language
+    pack.  Copies are stored and returned, as users of TimerInfo may modify it.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialise."""
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, tuple[str, TimerInfo]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(sentence: str, locale: str, type_hint: str | None) -> tuple:
+        """Make cache key from a sentence."""
+        return (locale, " ".join(sentence.lower().split()), type_hint)
+
+    def get(self, key: tuple) -> tuple[str, TimerInfo] | None:
+        """Get cached result, recording a hit or miss."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        translated, timer_info = entry
+        return translated, dataclasses.replace(timer_info)
+
+    def set(self, key: tuple, translated: str, timer_info: TimerInfo) -> None:
+        """Add a result to the cache."""
+        with self._lock:
+            self._entries[key] = (translated, dataclasses.replace(timer_info))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self, *args: Any) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,109 @@
+"""Bounded executor for time sentence decoding.
+
+Short sentences are decoded on the event loop as the regex work is quicker
+than a hop to the executor.  Long sentences and large batches are decoded
+in the executor, with a limit on concurrent decodes and a time budget so a
+pathological sentence cannot hold up other decodes for long.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+# Sentences, or batches, with more characters than this are decoded in the
+# executor
+DECODE_EXECUTOR_THRESHOLD = 120
+
+# Max decodes running at once
+MAX_CONCURRENT_DECODES = 4
+
+# Time budget in seconds for each sentence decoded in the executor
+DECODE_TIME_BUDGET = 2.0
+
+
+class DecodeTimeoutError(Exception):
+    """Decode exceeded its time budget."""
+
+
+class DecodeExecutor:
+    """Run decodes with a concurrency limit and time budget."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = MAX_CONCURRENT_DECODES,
+        threshold: int = DECODE_EXECUTOR_THRESHOLD,
+        time_budget: float = DECODE_TIME_BUDGET,
+    ) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.threshold = threshold
+        self.time_budget = time_budget
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+        self.queued = 0
+        self.max_queued = 0
+        self.running = 0
+        self.inline = 0
+        self.offloaded = 0
+        self.timeouts = 0
+
+    def should_offload(self, size: int) -> bool:
+        """Return if work of size characters should run in the executor."""
+        return size > self.threshold
+
+    async def run(self, func: Callable[[], Any], size: int, sentences: int = 1) -> Any:
+        """Run a decode function, in the executor if size is over threshold.
+
+        Raises DecodeTimeoutError if an executor decode takes longer than the
+        time budget for the number of sentences.  The executor thread cannot
+        be stopped, so its result is discarded but it keeps its slot in the
+        concurrency limit until it finishes.
+        """
+        if not self.should_offload(size):
+            self.inline += 1
+            return func()
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        self.offloaded += 1
+        future = self.hass.async_add_executor_job(func)
+        future.add_done_callback(self._release)
+        try:
+            async with asyncio.timeout(self.time_budget * sentences):
+                return await asyncio.shield(future)
+        except TimeoutError as ex:
+            self.timeouts += 1
+            raise DecodeTimeoutError(
+                f"Decode exceeded {self.time_budget * sentences}s"
+            ) from ex
+
+    def _release(self, future: asyncio.Future) -> None:
+        """Release a concurrency slot when an executor decode finishes."""
+        # Retrieve any exception from a timed out decode, so it is not logged
+        if not future.cancelled():
+            future.exception()
+        self.running -= 1
+        self._semaphore.release()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return decode executor statistics."""
+        return {
+            "queue_depth": self.queued,
+            "max_queue_depth": self.max_queued,
+            "running": self.running,
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "timeouts": self.timeouts,
+        }
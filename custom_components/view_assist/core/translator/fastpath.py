@@ -0,0 +1,89 @@
+"""Fast path decoding of canonical english time sentences.
+
+Most timer requests are simple english durations or clock times, such as
+"5 minutes", "1 hour 20 minutes" or "7:30 pm".  These are recognised by one
+precompiled regex and decoded straight to a TimerInfo, giving the same
+result as the full translate and normalise pipeline.  Anything not fully
+matched returns None and is decoded by the full pipeline.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from .normaliser import TimerInfo
+
+# Locales the fast path is used for
+FAST_PATH_LOCALES = ["en"]
+
+DURATION = re.compile(
+    r"^(?=\d)"
+    r"(?:(?P<days>\d{1,2}) days?(?: |$))?"
+    r"(?:(?P<hours>\d{1,2}) hours?(?: |$))?"
+    r"(?:(?P<minutes>\d{1,2}) minutes?(?: |$))?"
+    r"(?:(?P<seconds>\d{1,2}) seconds?)?$"
+)
+
+CLOCK_TIME = re.compile(
+    r"^(?P<hours>[01]?\d|2[0-3]):(?P<minutes>[0-5]\d)"
+    r"(?P<sep> ?)(?P<time_of_day>am|pm)?$"
+)
+
+
+class FastPathDecoder:
+    """Decode canonical english durations and clock times."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.hits = 0
+        self.misses = 0
+
+    def decode(self, sentence: str, locale: str) -> tuple[str, TimerInfo] | None:
+        """Decode sentence if it is a canonical form, recording a hit or miss."""
+        if locale.split("-")[0] not in FAST_PATH_LOCALES:
+            return None
+
+        s = " ".join(sentence.lower().split())
+        if timer_info := self._decode(s):
+            self.hits += 1
+            return s, timer_info
+        self.misses += 1
+        return None
+
+    def _decode(self, s: str) -> TimerInfo | None:
+        """Decode a cleaned sentence."""
+        if m := DURATION.match(s):
+            return TimerInfo(
+                days=int(m["days"] or 0),
+                hours=int(m["hours"] or 0),
+                minutes=int(m["minutes"] or 0),
+                seconds=int(m["seconds"] or 0),
+                sentence=s,
+                pattern="durations",
+            )
+
+        if m := CLOCK_TIME.match(s):
+            if m["time_of_day"]:
+                pattern = "{std_time}" + m["sep"] + "{time_of_day}"
+            else:
+                pattern = "{std_time}"
+            return TimerInfo(
+                hours=int(m["hours"]),
+                minutes=int(m["minutes"]),
+                timeofday=m["time_of_day"] or "",
+                is_time=True,
+                sentence=s,
+                pattern=pattern,
+            )
+        return None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return fast path statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "percent": round(self.hits / total * 100, 1) if total else 0,
+        }
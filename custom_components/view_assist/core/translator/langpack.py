@@ -0,0 +1,455 @@
+"""Shared registry of timer language packs.
+
+Language packs are loaded from disk once per process and held along with any
+structures derived from them.  A cached pack is re-validated against its file
+modification time at most every MTIME_CHECK_INTERVAL seconds, so normal use
+needs no file access or executor job.
+
+If a cache directory is set, the derived structures of each pack are also
+saved there, keyed by a hash of the pack file and COMPILED_CACHE_VERSION, so
+packs do not need to be recompiled after a restart.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import contextlib
+from dataclasses import dataclass, field
+from enum import StrEnum
+import hashlib
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import save_json
+
+from . import DOMAIN
+from .replacer import WordReplacer
+from .structures import StructureMatcher
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between checks of a cached pack against its file mtime
+MTIME_CHECK_INTERVAL = 30
+
+# Increment if the saved format of compiled packs changes
+COMPILED_CACHE_VERSION = 2
+
+# Pack entries that are not word collections
+NON_COLLECTION_KEYS = ["compound_words", "responses", "structures"]
+
+# Compound word template parameters, ie {a:numbers}
+COMPOUND_PARAM = re.compile(r"\{(.*?)\}")
+
+
+class LangPackKeys(StrEnum):
+    """Keys for language pack entries."""
+
+    NUMBERS = "numbers"
+    DAYS = "days"
+    DURATIONS = "durations"
+    OPERATORS = "operators"
+    TIME_OF_DAY = "time_of_day"
+    FRACTIONS = "fractions"
+    DIRECT_TRANSLATIONS = "direct_translations"
+    COMPOUND_WORDS = "compound_words"
+    OTHER_WORDS = "other_words"
+
+
+class LangPackKeys2(StrEnum):
+    """Keys for language pack entries."""
+
+    DECIMAL_SEPARATOR = "decimal_separator"
+
+
+# Collections that can be used as a typed compound word parameter
+COMPOUND_PARAM_TYPES = [
+    LangPackKeys.NUMBERS,
+    LangPackKeys.DAYS,
+    LangPackKeys.TIME_OF_DAY,
+]
+
+
+def flatten(lst) -> list[str]:
+    """Flatten a list of strings and lists into a single list of strings."""
+    flattened = []
+    for item in lst:
+        if isinstance(item, list):
+            flattened.extend(flatten(item))
+        else:
+            flattened.append(item)
+    return list(filter(None, flattened))
+
+
+@dataclass(frozen=True)
+class CompoundWord:
+    """Compiled compound word template.
+
+    params maps each template placeholder, ie {a}, to its regex group name.
+    """
+
+    pattern: re.Pattern
+    template: str
+    params: dict[str, str]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CompoundWord:
+        """Restore a compound word saved with as_dict."""
+        return cls(re.compile(data["pattern"]), data["template"], data["params"])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return compound word as a json serialisable dict."""
+        return {
+            "pattern": self.pattern.pattern,
+            "template": self.template,
+            "params": self.params,
+        }
+
+    def unpack(self, string: str) -> str:
+        """Replace all matches of the compound in string with the template."""
+        for match in self.pattern.finditer(string):
+            replacement = self.template
+            groups = match.groupdict()
+            for placeholder, name in self.params.items():
+                if name in groups:
+                    replacement = replacement.replace(placeholder, match.group(name))
+            string = self.pattern.sub(f" {replacement} ", string, count=1)
+        return string
+
+
+@dataclass
+class CollectionIndex:
+    """Precompiled word replacers for a language pack collection.
+
+    replacer matches multi word phrases first and then longest first.
+    entry_replacer matches in the order entries are listed in the pack.
+    """
+
+    replacer: WordReplacer
+    entry_replacer: WordReplacer
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CollectionIndex:
+        """Restore a collection index saved with as_dict."""
+        return cls(
+            WordReplacer.from_dict(data["replacer"]),
+            WordReplacer.from_dict(data["entry_replacer"]),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return collection index as a json serialisable dict."""
+        return {
+            "replacer": self.replacer.as_dict(),
+            "entry_replacer": self.entry_replacer.as_dict(),
+        }
+
+
+@dataclass
+class LanguagePack:
+    """Loaded language pack and its derived structures."""
+
+    name: str
+    path: Path
+    mtime: float
+    data: dict[str, Any]
+    collections: dict[str, CollectionIndex] = field(default_factory=dict)
+    structures: StructureMatcher | None = None
+    compounds: list[CompoundWord] = field(default_factory=list)
+    known_words: frozenset[str] = frozenset()
+    ordered_entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    checked_at: float = 0
+
+    def compile(self) -> None:
+        """Build derived structures for the pack."""
+        if "structures" in self.data:
+            self.structures = StructureMatcher(self.data["structures"])
+
+        self.compounds = self._compile_compounds(
+            self.data.get(LangPackKeys.COMPOUND_WORDS) or {}
+        )
+
+        # All supported words, for removing untranslated words
+        known_words = set()
+        for group in LangPackKeys:
+            if group_dict := self.data.get(group):
+                for key in group_dict:
+                    known_words.update(key.split())
+        self.known_words = frozenset(known_words)
+
+        for key, collection in self.data.items():
+            if key in NON_COLLECTION_KEYS:
+                continue
+            if isinstance(collection, list):
+                # List of words to remove
+                collection = {"": collection}
+            if isinstance(collection, dict) and all(
+                isinstance(v, (str, list)) for v in collection.values()
+            ):
+                self.collections[key] = self._index_collection(collection)
+                # Entries ordered by length of entry, longest first
+                self.ordered_entries[key] = {
+                    k: collection[k] for k in sorted(collection, key=len, reverse=True)
+                }
+
+    def load_compiled(self, compiled: dict[str, Any]) -> None:
+        """Restore derived structures saved with compiled_as_dict."""
+        self.structures = (
+            StructureMatcher.from_dict(compiled["structures"])
+            if compiled["structures"]
+            else None
+        )
+        self.compounds = [CompoundWord.from_dict(c) for c in compiled["compounds"]]
+        self.known_words = frozenset(compiled["known_words"])
+        self.ordered_entries = compiled["ordered_entries"]
+        self.collections = {
+            key: CollectionIndex.from_dict(index)
+            for key, index in compiled["collections"].items()
+        }
+
+    def compiled_as_dict(self) -> dict[str, Any]:
+        """Return derived structures as a json serialisable dict."""
+        return {
+            "structures": self.structures.as_dict() if self.structures else None,
+            "compounds": [compound.as_dict() for compound in self.compounds],
+            "known_words": sorted(self.known_words),
+            "ordered_entries": self.ordered_entries,
+            "collections": {
+                key: index.as_dict() for key, index in self.collections.items()
+            },
+        }
+
+    def _compile_compounds(self, compounds: dict[str, str]) -> list[CompoundWord]:
+        """Compile compound word templates with parameters to regexes."""
+        compiled = []
+        for compound, template in compounds.items():
+            if "{" not in compound or "}" not in compound:
+                continue
+
+            # It's a template with parameters, build search regex
+            params = {}
+            pattern = re.escape(compound)
+            for param in COMPOUND_PARAM.findall(compound):
+                if ":" in param:
+                    p_name, p_type = param.split(":", 1)
+                    values = (
+                        flatten(self.data.get(p_type, {}).values())
+                        if p_type in COMPOUND_PARAM_TYPES
+                        else []
+                    )
+                    if values:
+                        pattern = pattern.replace(
+                            r"\{" + param + r"\}",
+                            r"(?P<" + p_name + r">" + "|".join(values) + r")",
+                        )
+                else:
+                    p_name = param
+                    pattern = pattern.replace(
+                        r"\{" + param + r"\}", r"(?P<" + param + r">\S+)"
+                    )
+                params["{" + p_name + "}"] = p_name
+
+            try:
+                compiled.append(
+                    CompoundWord(
+                        pattern=re.compile(r"(?:^|\b)" + pattern + r"(?:\b|$)"),
+                        template=template,
+                        params=params,
+                    )
+                )
+            except re.PatternError as ex:
+                _LOGGER.error(
+                    "Invalid compound word %s in language pack %s - %s",
+                    compound,
+                    self.name,
+                    ex,
+                )
+        return compiled
+
+    def _index_collection(
+        self, collection: dict[str, list[str] | str]
+    ) -> CollectionIndex:
+        """Index collection words."""
+        words = []
+        entries = []
+        for translation, entry in collection.items():
+            for word in entry if isinstance(entry, list) else [entry]:
+                words.append(word)
+                entries.append((word, translation))
+
+        # Order by those with spaces first and then longer words first.
+        # First translation listing the word wins, as per dict order
+        words = sorted(words, key=lambda x: (-len(x.split()), -len(x)))
+        translations = {}
+        for word in words:
+            for translation, entry in collection.items():
+                if word in entry:
+                    translations.setdefault(word, translation)
+                    break
+
+        return CollectionIndex(
+            replacer=WordReplacer(
+                [(word, translations[word]) for word in words if word in translations]
+            ),
+            entry_replacer=WordReplacer(entries),
+        )
+
+    def get_collection(self, key: str) -> CollectionIndex | None:
+        """Get precompiled collection index."""
+        return self.collections.get(key)
+
+
+class LanguagePackRegistry:
+    """Process wide cache of loaded language packs."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self._packs: dict[Path, LanguagePack] = {}
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[str | None], None]] = []
+        self.cache_dir: Path | None = None
+
+    def add_listener(self, callback: Callable[[str | None], None]) -> Callable:
+        """Add listener called with pack name when a pack is (re)loaded.
+
+        Called with None when all packs are invalidated.  Listeners may be
+        called from the executor so must be thread safe.
+        """
+        self._listeners.append(callback)
+
+        def remove_listener():
+            with contextlib.suppress(ValueError):
+                self._listeners.remove(callback)
+
+        return remove_listener
+
+    def _notify(self, name: str | None) -> None:
+        """Notify listeners of a pack change."""
+        for callback in self._listeners.copy():
+            callback(name)
+
+    @staticmethod
+    def get_pack_path(hass: HomeAssistant, name: str) -> Path:
+        """Get path of a bundled timer language pack."""
+        return Path(
+            hass.config.path("custom_components", DOMAIN),
+            "translations",
+            "timers",
+            f"{name}.json",
+        )
+
+    def load(self, path: Path, name: str | None = None) -> LanguagePack | None:
+        """Load a language pack, reusing the cached pack if file is unchanged.
+
+        This does file io and so must be run in the executor if called from
+        the event loop.
+        """
+        name = name or path.stem
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            _LOGGER.error("No language pack found for %s -> %s", name, path)
+            with self._lock:
+                self._packs.pop(path, None)
+            return None
+
+        with self._lock:
+            pack = self._packs.get(path)
+            if pack and pack.mtime == mtime:
+                pack.checked_at = time.monotonic()
+                return pack
+
+        try:
+            raw = path.read_bytes()
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            _LOGGER.error("Error reading language pack for %s", name)
+            return None
+        except OSError:
+            _LOGGER.error("Error loading language pack for %s", name)
+            return None
+
+        pack = LanguagePack(name=name, path=path, mtime=mtime, data=data)
+        content_hash = hashlib.sha256(raw).hexdigest()
+        if not self._load_compiled(pack, content_hash):
+            pack.compile()
+            self._save_compiled(pack, content_hash)
+        pack.checked_at = time.monotonic()
+        _LOGGER.debug("Loaded language pack %s from %s", name, path)
+
+        with self._lock:
+            self._packs[path] = pack
+        self._notify(name)
+        return pack
+
+    def _get_cache_path(self, name: str) -> Path | None:
+        """Get path of compiled pack cache file."""
+        return Path(self.cache_dir, f"{name}.json") if self.cache_dir else None
+
+    def _load_compiled(self, pack: LanguagePack, content_hash: str) -> bool:
+        """Restore pack derived structures from the cache if not stale."""
+        if not (cache_path := self._get_cache_path(pack.name)):
+            return False
+        try:
+            with cache_path.open("r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (
+                cached.get("version") != COMPILED_CACHE_VERSION
+                or cached.get("hash") != content_hash
+            ):
+                _LOGGER.debug("Compiled language pack %s is stale", pack.name)
+                return False
+            pack.load_compiled(cached["pack"])
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError, re.PatternError) as ex:
+            _LOGGER.debug(
+                "Unable to load compiled language pack %s - %s", pack.name, ex
+            )
+            return False
+        _LOGGER.debug("Loaded compiled language pack %s from cache", pack.name)
+        return True
+
+    def _save_compiled(self, pack: LanguagePack, content_hash: str) -> None:
+        """Save pack derived structures to the cache."""
+        if not (cache_path := self._get_cache_path(pack.name)):
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            save_json(
+                str(cache_path),
+                {
+                    "version": COMPILED_CACHE_VERSION,
+                    "hash": content_hash,
+                    "pack": pack.compiled_as_dict(),
+                },
+            )
+        except (OSError, HomeAssistantError) as ex:
+            _LOGGER.warning(
+                "Unable to save compiled language pack %s - %s", pack.name, ex
+            )
+
+    async def async_get(self, hass: HomeAssistant, name: str) -> LanguagePack | None:
+        """Get a bundled language pack, loading in the executor if needed."""
+        path = self.get_pack_path(hass, name)
+        pack = self._packs.get(path)
+        if pack and time.monotonic() - pack.checked_at < MTIME_CHECK_INTERVAL:
+            return pack
+        return await hass.async_add_executor_job(self.load, path, name)
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Remove a pack, or all packs, from the cache."""
+        with self._lock:
+            if path is None:
+                self._packs.clear()
+            else:
+                self._packs.pop(path, None)
+        self._notify(path.stem if path else None)
+
+
+LANGUAGE_PACKS = LanguagePackRegistry()
@@ -13,16 +13,19 @@ Order of normalisation
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import EnumType, StrEnum
-import json
+from enum import StrEnum
 import logging
-from pathlib import Path
-import re
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from . import DOMAIN
+from .langpack import LANGUAGE_PACKS, LanguagePack
+from .structures import (
+    StructureMatcher,
+    make_duration_pattern,
+    make_template_regex_pattern,
+)
+from .tracing import DecodeTrace
 from .translator import LangPackKeys
 from .wordstonumbers import WordsToDigits
 
@@ -62,66 +65,6 @@ class NormaliserPackKeys(StrEnum):
     STRUCTURES = "structures"
 
 
-# TODO: Build regex patterns from normalisation language pack
-class RegexPatterns:
-    """Regex time patterns for matching."""
-
-    STDTIME = r"(?P<hours>\d{1,2})(?::|h|\s)?(?P<minutes>\d{1,2})?"
-    DAYS = r"(?P<days>\d+)"
-    HOURS = r"(?P<hours>\d{1,2})"
-    MINUTES = r"(?P<minutes>\d{1,2})"
-    FRACTIONS = r"(?P<fractions>half|quarter|threequarter)"
-    TIMEOFDAY = r"(?P<time_of_day>am|pm|morning|afternoon|evening|night|tonight)"
-    DAY = r"(?P<day>monday|tuesday|wednesday|thursday|friday|saturday|sunday|today|tomorrow)"
-    SPECIAL_HOUR = r"(?P<special_hour>noon|midnight)"
-    OPERATOR = r"(?P<operator>and|minus|after|before)"
-    JOINER_WORDS = r"(?:on|this|at|,)"
-
-
-class RegexDurationPatterns:
-    """Regex patterns for matching durations."""
-
-    DAYS = r"((?P<days>\d{1,2}(.\d+)?)(?:\s)?(?:days|day|d)\b)?"
-    HOURS = r"((?P<hours>\d{1,2}(.\d+)?)(?:\s)?(?:hours|hour|h)\b)?"
-    MINUTES = r"((?P<minutes>\d{1,2}(.\d+)?)(?:\s)?(?:minutes|minute|mins|min|m)\b)?"
-    SECONDS = r"((?P<seconds>\d{1,2})(?:\s)?(?:seconds|second|secs|sec|s)\b)?"
-    JOIN = r"(?:,\s|\sand\s|\s)?"
-
-
-REGEXLOOKUP = {
-    "std_time": RegexPatterns.STDTIME,
-    "days": RegexPatterns.DAYS,
-    "hours": RegexPatterns.HOURS,
-    "minutes": RegexPatterns.MINUTES,
-    "fractions": RegexPatterns.FRACTIONS,
-    "time_of_day": RegexPatterns.TIMEOFDAY,
-    "day": RegexPatterns.DAY,
-    "special_hour": RegexPatterns.SPECIAL_HOUR,
-    "operator": RegexPatterns.OPERATOR,
-    "joiner_words": RegexPatterns.JOINER_WORDS,
-}
-
-
-STD_TIME_PATTERNS = [
-    "{special_hour}",
-    "{std_time}",
-    "{std_time}{time_of_day}",
-    "{std_time} {time_of_day}",
-    "{std_time} {time_of_day} {day}",
-    "{std_time} {day}",
-    "{std_time} {day} {time_of_day}",
-    "{std_time} {joiner_words} {time_of_day}",
-    "{std_time} {joiner_words} {day}",
-    "{std_time} {joiner_words} {day} {time_of_day}",
-    "{day} {std_time}",
-    "{day} {std_time} {time_of_day}",
-    "{day} {joiner_words} {std_time}",
-    "{day} {joiner_words} {std_time} {time_of_day}",
-    "{day} {joiner_words} {time_of_day}",
-    "{day} {joiner_words} {special_hour}",
-]
-
-
 class Normaliser:
     """Normaliser class."""
 
@@ -133,59 +76,36 @@ class Normaliser:
         self.locale = locale
         self.normalisations: dict[str, Any] = {}
         self.lang: dict[str, Any] = {}
+        self.normaliser_pack: LanguagePack | None = None
+        self.lang_pack: LanguagePack | None = None
         self.debug = debug
 
-    def load_language_pack(self, lang: str) -> dict[str, Any]:
-        """Load language pack."""
-        # Get current path of this file
-        p = self.hass.config.path("custom_components", DOMAIN)
-
+    def _pack_name(self, lang: str) -> str:
+        """Get language pack name for a locale."""
         if lang != "normaliser":
             lang = lang.split("-")[0]
+        return lang
 
-        file = Path(p, "translations", "timers", f"{lang}.json")
-        if file.is_file():
-            try:
-                with file.open("r", encoding="utf-8") as f:
-                    try:
-                        return json.load(f)
-                    except json.JSONDecodeError:
-                        _LOGGER.error("Error reading language pack for %s", lang)
-                        return None
-            except OSError:
-                _LOGGER.error("Error reading language pack for %s", lang)
-                return None
-        return None
-
-    def inString(self, string: str, find: str | list[str] | EnumType) -> str | None:
-        """Check if a word or list of words is in a string."""
-        if isinstance(find, EnumType):
-            find = list(find)
-        if isinstance(find, list):
-            find = "|".join(re.escape(f) for f in find if f)
-        pattern = r"(?:^|\b)(" + find + r")(?:,|\b|$)"
-        if m := re.findall(pattern, string):
-            return m
+    def load_language_pack(self, lang: str) -> dict[str, Any]:
+        """Load language pack."""
+        lang = self._pack_name(lang)
+        if pack := LANGUAGE_PACKS.load(
+            LANGUAGE_PACKS.get_pack_path(self.hass, lang), lang
+        ):
+            return pack.data
         return None
 
-    def replaceInString(self, string: str, find: str, replace: str) -> str:
-        """Replace a word in a string."""
-        pattern = r"(^|\b)(" + find.strip() + r")(,|\W|\b|$)"
-        return re.sub(pattern, rf" {replace} ", string)
-
-    def run_regex(self, template: str, string: str) -> Any:
-        """Run a regex pattern on a string."""
-        pattern = self.make_template_regex_pattern(template)
-        if self.debug:
-            _LOGGER.debug(
-                "Running pattern: %s -> %s on string: %s", template, pattern, string
-            )
-        try:
-            if m := re.match(pattern, string):
-                return m.groupdict()
-        except re.PatternError:
-            pass
-        return None
+    async def async_load_language_packs(self) -> bool:
+        """Get normaliser and locale language packs from the pack registry."""
+        self.normaliser_pack = await LANGUAGE_PACKS.async_get(
+            self.hass, self._pack_name("normaliser")
+        )
+        self.lang_pack = await LANGUAGE_PACKS.async_get(
+            self.hass, self._pack_name(self.locale)
+        )
+        self.normalisations = self.normaliser_pack.data if self.normaliser_pack else {}
+        self.lang = self.lang_pack.data if self.lang_pack else {}
+        return bool(self.normalisations and self.lang)
 
     def handle_floats(self, value: str | None) -> tuple[int, float]:
         """Handle float values in strings."""
@@ -281,103 +201,82 @@ class Normaliser:
             NormaliserPackKeys.FRACTIONS,
             NormaliserPackKeys.SPECIAL_HOURS,
         ]
+        if not self.normaliser_pack:
+            return string
+
         for col in collections:
-            for word, values in self.normalisations.get(col, {}).items():
-                if values:
-                    if m := self.inString(string, values):
-                        for match in m:
-                            string = self.replaceInString(string, match, word)
+            if index := self.normaliser_pack.get_collection(col):
+                string = index.entry_replacer.replace(string)
         return string
 
-    async def normalise(self, string: str, type_hint: str | None = None) -> TimerInfo:
+    async def normalise(
+        self,
+        string: str,
+        type_hint: str | None = None,
+        trace: DecodeTrace | None = None,
+    ) -> TimerInfo:
         """Normalise a time/interval string."""
-        self.normalisations = await self.hass.async_add_executor_job(
-            self.load_language_pack, "normaliser"
-        )
-        self.lang = await self.hass.async_add_executor_job(
-            self.load_language_pack, self.locale
-        )
+        loaded = await self.async_load_language_packs()
+        if trace:
+            trace.mark("load_normaliser_packs")
+        if loaded:
+            return self.normalise_sentence(string, type_hint, trace)
+        return None
 
+    def normalise_sentence(
+        self,
+        string: str,
+        type_hint: str | None = None,
+        trace: DecodeTrace | None = None,
+    ) -> TimerInfo | None:
+        """Normalise a time/interval string using the loaded language packs.
+
+        Does no io so can be run in the executor once the packs are loaded.
+        """
         if self.normalisations and self.lang:
             s = self.normalise_words(string)
+            if trace:
+                trace.mark("normalise_words")
 
             # Remove any unwanted words
-            for word in self.normalisations.get(NormaliserPackKeys.REMOVE_WORDS, []):
-                if m := self.inString(s, word):
-                    for match in m:
-                        s = self.replaceInString(s, match, "")
+            if index := self.normaliser_pack.get_collection(
+                NormaliserPackKeys.REMOVE_WORDS
+            ):
+                s = index.entry_replacer.replace(s)
+            if trace:
+                trace.mark("remove_words")
 
             # Convert any text words to digits
             if any(n for n in self.lang[LangPackKeys.NUMBERS] if n in s):
                 s = WordsToDigits.convert(" ".join(s.split()))
-
-            # If basic time structure then ensure in 00:00 format
-            for std_time_pattern in STD_TIME_PATTERNS:
-                s = " ".join(s.replace("oclock", "").split())
-                if m := self.run_regex(std_time_pattern, s):
-                    return self.build_timer_info(
-                        m,
-                        sentence=string,
-                        pattern=std_time_pattern,
-                        type_hint="time",
-                    )
-
-            # Load the language pack structures and evaluate them
-            # Advanced may ref basic to create more complex patterns
-            structures = self.lang.get(NormaliserPackKeys.STRUCTURES, {})
-            for patterns in structures.values():
-                for str_pattern in patterns:
-                    if "{basic_time}" in str_pattern:
-                        basic_time_patterns = structures.get("basic_time", [])
-                        for basic_time_pattern in basic_time_patterns:
-                            if m := self.run_regex(
-                                str(str_pattern).replace(
-                                    "{basic_time}", basic_time_pattern
-                                ),
-                                s,
-                            ):
-                                return self.build_timer_info(
-                                    m,
-                                    sentence=string,
-                                    pattern=basic_time_pattern,
-                                    type_hint=type_hint,
-                                )
-                        continue
-                    if m := self.run_regex(str_pattern, s):
-                        return self.build_timer_info(
-                            m, sentence=string, pattern=str_pattern, type_hint=type_hint
-                        )
-
-            # Look for interval duratons
-            duration_pattern = self.make_duration_pattern()
-            if m := self.run_regex(duration_pattern, s):
+            if trace:
+                trace.mark("words_to_digits")
+
+            # Match standard time patterns, language pack structures and
+            # durations in one pass.  Advanced structures may ref basic to
+            # create more complex patterns
+            s = " ".join(s.replace("oclock", "").split())
+            matcher = self.lang_pack.structures or StructureMatcher.default()
+            m = matcher.match(s)
+            if trace:
+                trace.mark("match_structures")
+                trace.pattern = m.pattern if m else None
+            if m:
+                if self.debug:
+                    _LOGGER.debug("Matched pattern: %s on string: %s", m.pattern, s)
                 return self.build_timer_info(
-                    m, sentence=string, pattern="durations", type_hint="interval"
+                    m.values,
+                    sentence=string,
+                    pattern=m.pattern,
+                    type_hint=m.type_hint or type_hint,
                 )
             _LOGGER.warning("Unable to decode '%s' to a time or interval", s)
         return None
 
     def make_template_regex_pattern(self, template: str) -> str:
         """Make a regex pattern from a structure pattern."""
-        pattern = template
-        # Find all matching {parameters}
-        for key, sub in REGEXLOOKUP.items():
-            pattern = pattern.replace("{" + key + "}", sub)
-
-        # Optional items are wrapped in []
-        optional_items: list[str] = re.findall(r"\[(.*?)\]", pattern)
-        for items in optional_items:
-            optional = [item.strip() for item in items.strip().split(",")]
-            pattern = pattern.replace(
-                f"[{items}] ", rf"(?:^|\b)(?:{'|'.join(optional)}\s)?"
-            )
-        return r"^" + pattern + r"$"
+        return make_template_regex_pattern(template)
 
     def make_duration_pattern(self) -> str:
         """Make a regex pattern for durations."""
-        days = RegexDurationPatterns.DAYS
-        hours = RegexDurationPatterns.HOURS
-        minutes = RegexDurationPatterns.MINUTES
-        seconds = RegexDurationPatterns.SECONDS
-        join = RegexDurationPatterns.JOIN
-        return f"^{days}{join}{hours}{join}{minutes}{join}{seconds}$"
+        return make_duration_pattern()
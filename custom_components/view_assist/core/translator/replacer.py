@@ -0,0 +1,75 @@
+"""Multi word replacement engine for language pack collections.
+
+Replaces whole words or phrases from a collection in a single scan of the
+string, using one regex of all the phrases in priority order, instead of
+running a regex per word.
+
+A phrase matches at a position if it starts at the start of the string or on
+a word boundary and ends at the end of the string, before a comma or on a word
+boundary.  Where more than one phrase matches at the same position, the one
+with the highest priority (lowest index in the entries list) is used, as the
+regex tries alternatives in order.  A match, plus any non word character
+following it, is replaced by the replacement padded with a space either side.
+
+Matches are found left to right in the original string, so a replacement is
+never matched again and a phrase inside a longer phrase that matched is not
+replaced.  The per word regex this replaced ran each match over the whole
+string in turn, so a shorter word found earlier in a sentence was also
+replaced inside a later longer phrase, ie "la" in "de la" with Spanish
+other_words.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+
+class WordReplacer:
+    """Replace collection phrases in a string in one pass."""
+
+    def __init__(self, entries: list[tuple[str, str]]) -> None:
+        """Initialise.
+
+        entries is a list of (phrase, replacement) tuples in priority order.
+        """
+        # Replacement by phrase, in priority order.  First listing wins
+        self.replacements: dict[str, str] = {}
+        for phrase, replacement in entries:
+            if phrase:
+                self.replacements.setdefault(phrase, replacement)
+        self.size = len(self.replacements)
+        self._pattern: re.Pattern | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WordReplacer:
+        """Restore a replacer saved with as_dict."""
+        return cls([tuple(entry) for entry in data["entries"]])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return replacer as a json serialisable dict."""
+        return {"entries": list(self.replacements.items())}
+
+    def __bool__(self) -> bool:
+        """Return if replacer has any phrases."""
+        return self.size > 0
+
+    def _get_pattern(self) -> re.Pattern:
+        """Return regex matching any phrase and one trailing non word char."""
+        if self._pattern is None:
+            self._pattern = re.compile(
+                r"(?:^|\b)("
+                + "|".join(re.escape(phrase) for phrase in self.replacements)
+                + r")(?=,|\b|$)\W?"
+            )
+        return self._pattern
+
+    def _replacement(self, match: re.Match) -> str:
+        """Return padded replacement for a match."""
+        return f" {self.replacements[match.group(1)]} "
+
+    def replace(self, s: str) -> str:
+        """Replace all phrases in string with their replacement."""
+        if not self.size:
+            return s
+        return self._get_pattern().sub(self._replacement, s)
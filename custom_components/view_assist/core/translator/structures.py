@@ -0,0 +1,229 @@
+"""Precompiled time and interval structure matching.
+
+All structure templates, the standard time patterns and the duration pattern
+are compiled, when a language pack is loaded, into one regex alternation with
+a tagged group per template.  A sentence is classified by a single match and,
+as the regex engine tries alternatives in order, the first template to match
+wins as if each template were tried in turn.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+import logging
+import re
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tag group prefix for each template in the combined regex
+TEMPLATE_TAG = "t{}"
+
+# Named group in a template regex
+NAMED_GROUP = re.compile(r"\(\?P<(\w+)>")
+
+
+# Sentences are translated to the canonical words of the normaliser pack
+# before matching, so these patterns match those words, not pack variants
+class RegexPatterns:
+    """Regex time patterns for matching."""
+
+    STDTIME = r"(?P<hours>\d{1,2})(?::|h|\s)?(?P<minutes>\d{1,2})?"
+    DAYS = r"(?P<days>\d+)"
+    HOURS = r"(?P<hours>\d{1,2})"
+    MINUTES = r"(?P<minutes>\d{1,2})"
+    FRACTIONS = r"(?P<fractions>half|quarter|threequarter)"
+    TIMEOFDAY = r"(?P<time_of_day>am|pm|morning|afternoon|evening|night|tonight)"
+    DAY = r"(?P<day>monday|tuesday|wednesday|thursday|friday|saturday|sunday|today|tomorrow)"
+    SPECIAL_HOUR = r"(?P<special_hour>noon|midnight)"
+    OPERATOR = r"(?P<operator>and|minus|after|before)"
+    JOINER_WORDS = r"(?:on|this|at|,)"
+
+
+class RegexDurationPatterns:
+    """Regex patterns for matching durations."""
+
+    DAYS = r"((?P<days>\d{1,2}(.\d+)?)(?:\s)?(?:days|day|d)\b)?"
+    HOURS = r"((?P<hours>\d{1,2}(.\d+)?)(?:\s)?(?:hours|hour|h)\b)?"
+    MINUTES = r"((?P<minutes>\d{1,2}(.\d+)?)(?:\s)?(?:minutes|minute|mins|min|m)\b)?"
+    SECONDS = r"((?P<seconds>\d{1,2})(?:\s)?(?:seconds|second|secs|sec|s)\b)?"
+    JOIN = r"(?:,\s|\sand\s|\s)?"
+
+
+REGEXLOOKUP = {
+    "std_time": RegexPatterns.STDTIME,
+    "days": RegexPatterns.DAYS,
+    "hours": RegexPatterns.HOURS,
+    "minutes": RegexPatterns.MINUTES,
+    "fractions": RegexPatterns.FRACTIONS,
+    "time_of_day": RegexPatterns.TIMEOFDAY,
+    "day": RegexPatterns.DAY,
+    "special_hour": RegexPatterns.SPECIAL_HOUR,
+    "operator": RegexPatterns.OPERATOR,
+    "joiner_words": RegexPatterns.JOINER_WORDS,
+}
+
+
+STD_TIME_PATTERNS = [
+    "{special_hour}",
+    "{std_time}",
+    "{std_time}{time_of_day}",
+    "{std_time} {time_of_day}",
+    "{std_time} {time_of_day} {day}",
+    "{std_time} {day}",
+    "{std_time} {day} {time_of_day}",
+    "{std_time} {joiner_words} {time_of_day}",
+    "{std_time} {joiner_words} {day}",
+    "{std_time} {joiner_words} {day} {time_of_day}",
+    "{day} {std_time}",
+    "{day} {std_time} {time_of_day}",
+    "{day} {joiner_words} {std_time}",
+    "{day} {joiner_words} {std_time} {time_of_day}",
+    "{day} {joiner_words} {time_of_day}",
+    "{day} {joiner_words} {special_hour}",
+]
+
+
+def make_template_regex_pattern(template: str) -> str:
+    """Make a regex pattern from a structure pattern."""
+    pattern = template
+    # Find all matching {parameters}
+    for key, sub in REGEXLOOKUP.items():
+        pattern = pattern.replace("{" + key + "}", sub)
+
+    # Optional items are wrapped in []
+    optional_items: list[str] = re.findall(r"\[(.*?)\]", pattern)
+    for items in optional_items:
+        optional = [item.strip() for item in items.strip().split(",")]
+        pattern = pattern.replace(
+            f"[{items}] ", rf"(?:^|\b)(?:{'|'.join(optional)}\s)?"
+        )
+    return r"^" + pattern + r"$"
+
+
+def make_duration_pattern() -> str:
+    """Make a regex pattern for durations."""
+    days = RegexDurationPatterns.DAYS
+    hours = RegexDurationPatterns.HOURS
+    minutes = RegexDurationPatterns.MINUTES
+    seconds = RegexDurationPatterns.SECONDS
+    join = RegexDurationPatterns.JOIN
+    return f"^{days}{join}{hours}{join}{minutes}{join}{seconds}$"
+
+
+@dataclass
+class StructureMatch:
+    """Result of matching a sentence to a structure."""
+
+    values: dict[str, Any]
+    pattern: str
+    type_hint: str | None = None
+
+
+@dataclass
+class _Template:
+    """A compiled template in the combined regex."""
+
+    tag: str
+    pattern: str
+    type_hint: str | None
+    groups: list[tuple[str, str]]
+
+
+class StructureMatcher:
+    """Match a sentence against all structures in priority order.
+
+    Priority order is the standard time patterns, then the language pack
+    structures in listed order, with each {basic_time} template expanded for
+    every basic_time pattern, and finally durations.
+    """
+
+    def __init__(self, structures: dict[str, list[str]] | None) -> None:
+        """Initialise."""
+        self.templates: list[_Template] = []
+        alternatives: list[str] = []
+
+        for pattern, regex, type_hint in self._iter_templates(structures or {}):
+            # Templates that do not compile on their own can never match
+            try:
+                re.compile(regex)
+            except re.PatternError:
+                _LOGGER.debug("Ignoring invalid structure pattern: %s", regex)
+                continue
+
+            tag = TEMPLATE_TAG.format(len(self.templates))
+            groups = [(f"{tag}_{name}", name) for name in NAMED_GROUP.findall(regex)]
+            tagged = NAMED_GROUP.sub(rf"(?P<{tag}_\1>", regex)
+            alternatives.append(f"(?P<{tag}>{tagged})")
+            self.templates.append(_Template(tag, pattern, type_hint, groups))
+
+        self.regex = re.compile("|".join(alternatives)) if alternatives else None
+        self._by_tag = {template.tag: template for template in self.templates}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StructureMatcher:
+        """Restore a matcher saved with as_dict, without revalidating templates."""
+        matcher = cls.__new__(cls)
+        matcher.templates = [
+            _Template(tag, pattern, type_hint, [tuple(group) for group in groups])
+            for tag, pattern, type_hint, groups in data["templates"]
+        ]
+        matcher.regex = re.compile(data["regex"]) if data["regex"] else None
+        matcher._by_tag = {template.tag: template for template in matcher.templates}
+        return matcher
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return matcher as a json serialisable dict."""
+        return {
+            "regex": self.regex.pattern if self.regex else None,
+            "templates": [
+                [t.tag, t.pattern, t.type_hint, t.groups] for t in self.templates
+            ],
+        }
+
+    @staticmethod
+    @cache
+    def default() -> StructureMatcher:
+        """Get matcher for packs with no structures."""
+        return StructureMatcher(None)
+
+    def _iter_templates(self, structures: dict[str, list[str]]):
+        """Yield pattern name, regex and type hint of each template in order."""
+        for template in STD_TIME_PATTERNS:
+            yield template, make_template_regex_pattern(template), "time"
+
+        basic_time_patterns = structures.get("basic_time", [])
+        for patterns in structures.values():
+            for str_pattern in patterns:
+                if "{basic_time}" in str_pattern:
+                    for basic_time_pattern in basic_time_patterns:
+                        yield (
+                            basic_time_pattern,
+                            make_template_regex_pattern(
+                                str(str_pattern).replace(
+                                    "{basic_time}", basic_time_pattern
+                                )
+                            ),
+                            None,
+                        )
+                    continue
+                yield str_pattern, make_template_regex_pattern(str_pattern), None
+
+        yield "durations", make_duration_pattern(), "interval"
+
+    def __len__(self) -> int:
+        """Return number of compiled templates."""
+        return len(self.templates)
+
+    def match(self, string: str) -> StructureMatch | None:
+        """Match string to the first matching structure."""
+        if self.regex is None or not (m := self.regex.match(string)):
+            return None
+
+        template = self._by_tag[m.lastgroup]
+        return StructureMatch(
+            values={name: m.group(group) for group, name in template.groups},
+            pattern=template.pattern,
+            type_hint=template.type_hint,
+        )
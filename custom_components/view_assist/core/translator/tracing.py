@@ -0,0 +1,119 @@
+"""Opt-in per stage tracing of time sentence decoding."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass, field
+import statistics
+import time
+from typing import Any
+
+# Number of recent traces to keep
+DEFAULT_TRACE_BUFFER_SIZE = 50
+
+# Number of recent latency samples to keep per decode path and stage
+DEFAULT_SAMPLE_SIZE = 1000
+
+
+def summarise(samples: list[float]) -> dict[str, Any]:
+    """Summarise latency samples in ms."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "count": len(ordered),
+        "mean": round(total / len(ordered), 3),
+        "p50": round(statistics.median(ordered), 3),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+@dataclass
+class DecodeTrace:
+    """Timings for one time sentence decode.
+
+    Stages hold the time in ms since the previous mark, so each stage is the
+    time spent in the step named.
+    """
+
+    sentence: str
+    locale: str
+    type_hint: str | None = None
+    timestamp: float = field(default_factory=time.time)
+    path: str | None = None
+    translated: str | None = None
+    pattern: str | None = None
+    stages: dict[str, float] = field(default_factory=dict)
+    total: float = 0
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+    _last: float = field(default=0, repr=False)
+
+    def mark(self, stage: str) -> None:
+        """Record time spent in stage since the previous mark."""
+        now = time.perf_counter()
+        self.stages[stage] = round(
+            self.stages.get(stage, 0) + (now - (self._last or self._start)) * 1000, 3
+        )
+        self._last = now
+        self.total = round((now - self._start) * 1000, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return trace as a dict."""
+        return {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+
+
+class DecodeTracer:
+    """Ring buffer of recent decode traces."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_TRACE_BUFFER_SIZE,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ) -> None:
+        """Initialise."""
+        self.enabled = False
+        self.traces: deque[DecodeTrace] = deque(maxlen=size)
+        self.sample_size = sample_size
+        self.samples: dict[str, dict[str, deque[float]]] = {}
+
+    def start(
+        self, sentence: str, locale: str, type_hint: str | None = None
+    ) -> DecodeTrace | None:
+        """Start a trace if tracing is enabled."""
+        if not self.enabled:
+            return None
+        trace = DecodeTrace(sentence, locale, type_hint)
+        self.traces.append(trace)
+        return trace
+
+    def record(self, trace: DecodeTrace) -> None:
+        """Add latency samples for a completed trace."""
+        for name, value in {"total": trace.total, **trace.stages}.items():
+            self.samples.setdefault(trace.path, {}).setdefault(
+                name, deque(maxlen=self.sample_size)
+            ).append(value)
+
+    def record_stage(self, trace: DecodeTrace, stage: str, duration: float) -> None:
+        """Add a stage timed after the decode completed, ie timer expiry."""
+        trace.stages[stage] = round(duration, 3)
+        self.samples.setdefault(trace.path, {}).setdefault(
+            stage, deque(maxlen=self.sample_size)
+        ).append(trace.stages[stage])
+
+    def summary(self) -> dict[str, Any]:
+        """Return latency summary by decode path and stage."""
+        return {
+            path: {name: summarise(list(values)) for name, values in stages.items()}
+            for path, stages in self.samples.items()
+        }
+
+    def clear(self) -> None:
+        """Clear stored traces and latency samples."""
+        self.traces.clear()
+        self.samples.clear()
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return stored traces, most recent first."""
+        return [trace.as_dict() for trace in reversed(self.traces)]
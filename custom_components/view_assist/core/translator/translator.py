@@ -1,43 +1,35 @@
 """Translator module for handling different languages."""
 
-from enum import EnumType, StrEnum
-import json
+import asyncio
 import logging
 from os import environ
-from pathlib import Path
 import re
 from typing import Any
 
 from homeassistant.components.conversation import async_converse, get_agent_manager
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from ...helpers import get_config_entry_by_entity_id, get_key  # noqa: TID252
 from . import DOMAIN, VAConfigEntry
+from .langpack import (
+    LANGUAGE_PACKS,
+    LangPackKeys,
+    LangPackKeys2,
+    LanguagePack,
+    flatten,
+)
+from .tracing import DecodeTrace
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class LangPackKeys(StrEnum):
-    """Keys for language pack entries."""
-
-    NUMBERS = "numbers"
-    DAYS = "days"
-    DURATIONS = "durations"
-    OPERATORS = "operators"
-    TIME_OF_DAY = "time_of_day"
-    FRACTIONS = "fractions"
-    DIRECT_TRANSLATIONS = "direct_translations"
-    COMPOUND_WORDS = "compound_words"
-    OTHER_WORDS = "other_words"
-
-
-class LangPackKeys2(StrEnum):
-    """Keys for language pack entries."""
-
-    DECIMAL_SEPARATOR = "decimal_separator"
+PROJECT_ID = environ.get("PROJECT_ID", "")
 
+RESPONSES_STORE_NAME = f"{DOMAIN}.translated_responses"
 
-PROJECT_ID = environ.get("PROJECT_ID", "")
+# Response template param, ie {name}
+RESPONSE_PARAM = re.compile(r"\{(\w+)\}")
 
 
 # TODO: Add ability to use Conversation Engine (LLM) or Translation services like Google, DeepL, LibreTranslate etc.
@@ -53,6 +45,8 @@ class ConversationAgentTranslator:
 
     RESPONSE = """Translate the text in quotation marks into a time or interval sentence in a spoken style in the language of locale {}.  The text is '{}'."""
 
+    RESPONSE_TEMPLATE = """Translate the text in quotation marks into the language of locale {}.  Keep any text in double square brackets, such as [[0]], exactly as it is.  Only output the translated text.  The text is '{}'."""
+
     def __init__(self, hass: HomeAssistant, config: VAConfigEntry) -> None:
         """Initialise the conversation agent translator."""
         self.hass = hass
@@ -71,6 +65,18 @@ class ConversationAgentTranslator:
             "timer_error": "Unable to decode time or interval information",
         }
 
+        # Translated response templates by locale and english template
+        self.store = Store(hass, 1, RESPONSES_STORE_NAME)
+        self.translated_responses: dict[str, dict[str, str]] | None = None
+        self._load_lock = asyncio.Lock()
+
+        # Locks by (locale, template), so each is only sent to the agent once
+        # while other templates are translated in parallel
+        self._template_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+        # (locale, template) the agent could not translate this session
+        self._failed_templates: set[tuple[str, str]] = set()
+
     async def _agent_translation(self, sentence: str, locale: str) -> str:
         """Translate text using the conversation agent."""
         am = get_agent_manager(self.hass)
@@ -101,16 +107,74 @@ class ConversationAgentTranslator:
             self.INSTRUCTIONS.format(locale, sentence), locale
         )
 
+    async def _get_translated_template(self, template: str, locale: str) -> str | None:
+        """Get response template translated to locale.
+
+        Template params are swapped for [[n]] markers so the agent does not
+        translate them, and the translation is kept in the store so each
+        template is only sent to the agent once per locale.  Templates the
+        agent fails to translate are not sent again this session.
+        """
+        async with self._load_lock:
+            if self.translated_responses is None:
+                self.translated_responses = await self.store.async_load() or {}
+
+        key = (locale, template)
+        async with self._template_locks.setdefault(key, asyncio.Lock()):
+            if translated := self.translated_responses.get(locale, {}).get(template):
+                return translated
+            if key in self._failed_templates:
+                return None
+
+            if output := await self._translate_template(template, locale):
+                self.translated_responses.setdefault(locale, {})[template] = output
+                await self.store.async_save(self.translated_responses)
+            else:
+                self._failed_templates.add(key)
+            return output
+
+    async def _translate_template(self, template: str, locale: str) -> str | None:
+        """Translate response template with the agent, keeping its params."""
+        params = RESPONSE_PARAM.findall(template)
+        protected = template
+        for idx, param in enumerate(params):
+            protected = protected.replace(f"{{{param}}}", f"[[{idx}]]")
+
+        output = await self._agent_translation(
+            self.RESPONSE_TEMPLATE.format(locale, protected), locale
+        )
+        if not output:
+            return None
+
+        # Restore params, failing if the agent has not kept them all
+        output = output.strip().strip("'\"")
+        for idx, param in enumerate(params):
+            if f"[[{idx}]]" not in output:
+                _LOGGER.debug(
+                    "Translated response template is missing params - %s", output
+                )
+                return None
+            output = output.replace(f"[[{idx}]]", f"{{{param}}}")
+        return output
+
     async def translate_response(
         self, sentence_id: str, params: dict[str, Any] | None = None, locale: str = "en"
     ) -> str | None:
         """Translate a response sentence id with optional params."""
         if sentence_id in self.responses:
-            sentence = self.responses[sentence_id]
-
             # set time param to time_{lang} param
             params["time"] = params.get(f"time_{locale}", params.get("time_en"))
 
+            if template := await self._get_translated_template(
+                self.responses[sentence_id], locale
+            ):
+                for k, v in params.items():
+                    template = template.replace(f"{{{k}}}", str(v))
+                return template
+
+            # Fallback to translating the completed response
+            sentence = self.responses[sentence_id]
+
             # Replace params in sentence
             if params:
                 for k, v in params.items():
@@ -130,47 +194,35 @@ class TimeSentenceTranslator:
         self.hass = hass
         self.loaded_lang: str | None = None
         self.lang: dict[str, Any] = {}
+        self.pack: LanguagePack | None = None
         self.config = config
 
     def _two_char_locale(self, lang: str) -> str:
         """Convert locale to two character format."""
         return lang[:2]
 
+    def _set_language_pack(self, pack: LanguagePack | None) -> bool:
+        """Set the language pack in use."""
+        if pack is None:
+            return False
+        self.pack = pack
+        self.lang = pack.data
+        self.loaded_lang = pack.name
+        return True
+
     def load_language_pack(self, lang: str) -> bool:
         """Load language pack."""
-        # Get current path of this file
-        p = self.hass.config.path("custom_components", DOMAIN)
         # In case like de-DE, make de
         lang = self._two_char_locale(lang)
-        lang_file = Path(p, "translations", "timers", f"{lang}.json")
-
-        if lang_file.is_file():
-            try:
-                with lang_file.open("r", encoding="utf-8") as f:
-                    self.lang = json.load(f)
-                    self.loaded_lang = lang
-                    return True
-            except json.JSONDecodeError:
-                _LOGGER.error("Error reading language pack for %s", lang)
-        else:
-            _LOGGER.error("No language pack found for %s -> %s", lang, lang_file)
-        return False
-
-    def inString(self, string: str, find: str | list[str] | EnumType) -> str | None:
-        """Check if any of the find words are in the string."""
-        if isinstance(find, EnumType):
-            find = list(find)
-        if isinstance(find, list):
-            find = "|".join(re.escape(f) for f in find if f)
-        pattern = r"(?:^|\b)(" + find + r")(?:,|\b|$)"
-        if m := re.findall(pattern, string):
-            return m
-        return None
+        return self._set_language_pack(
+            LANGUAGE_PACKS.load(LANGUAGE_PACKS.get_pack_path(self.hass, lang), lang)
+        )
 
-    def replaceInString(self, string: str, find: str, replace: str) -> str:
-        """Replace find word in string with replace word."""
-        pattern = r"(^|\b)(" + find.strip() + r")(,|\W|\b|$)"
-        return re.sub(pattern, rf" {replace} ", string)
+    async def async_load_language_pack(self, lang: str) -> bool:
+        """Get language pack from the pack registry."""
+        # In case like de-DE, make de
+        lang = self._two_char_locale(lang)
+        return self._set_language_pack(await LANGUAGE_PACKS.async_get(self.hass, lang))
 
     def clean_sentence(self, s: str) -> str:
         """Preprocess sentence to remove and replace words/text/symbols."""
@@ -185,133 +237,65 @@ class TimeSentenceTranslator:
 
     def _order_lang_key_entries(self, lang_key: str) -> dict[str, Any]:
         """Order entries in lang_key by length of entry, longest first."""
-        if lang_key not in self.lang:
+        if not self.pack:
             return {}
-
-        sorted_keys = sorted(self.lang.get(lang_key), key=len, reverse=True)
-        return dict(
-            zip(
-                sorted_keys,
-                [self.lang.get(lang_key)[key] for key in sorted_keys],
-                strict=False,
-            )
-        )
+        return self.pack.ordered_entries.get(lang_key, {})
 
     def _translate_collection(self, string: str, collection_id: LangPackKeys) -> str:
         """Translate all entries in a collection."""
-        collection: dict[str, list[str] | str] = self.lang.get(collection_id)
-        if not collection:
+        if not self.pack or not (index := self.pack.get_collection(collection_id)):
             return string
-
-        # make into big list of words to match
-        collection_words = []
-        for entry in collection.values():
-            if isinstance(entry, list):
-                collection_words.extend(entry)
-            else:
-                collection_words.append(entry)
-
-        # Order by those with spaces first and then longer words first
-        collection_words = sorted(
-            collection_words, key=lambda x: (-len(x.split()), -len(x))
-        )
-
-        if m := self.inString(string, collection_words):
-            for match in m:
-                for translation, words in collection.items():
-                    if match in words:
-                        string = self.replaceInString(string, match, translation)
-                        break
-        return string
+        return index.replacer.replace(string)
 
     def _flatten(self, lst: list[str | list]) -> list[str]:
         """Flatten a list of strings and lists into a single list of strings."""
-        flattened = []
-        for item in lst:
-            if isinstance(item, list):
-                flattened.extend(self._flatten(item))
-            else:
-                flattened.append(item)
-        return list(filter(None, flattened))
+        return flatten(lst)
 
     def _unpack_compound_words(self, string: str) -> str:
         """Unpack compound words in a string."""
-
-        def get_params(fragment: str) -> list[str]:
-            params = re.findall(r"\{(.*?)\}", fragment)
-            return params if params else []
-
-        compounds: dict[str, str] | None = self.lang.get(LangPackKeys.COMPOUND_WORDS)
-        if not compounds:
+        if not self.pack:
             return string
-
-        for compound, template in compounds.items():
-            if "{" in compound and "}" in compound:
-                # It's a template with parameters, build search regex
-                params = get_params(compound)
-                pattern = re.escape(compound)
-                for param in params:
-                    if ":" in param:
-                        # TODO: Use langpack enum to allow any of these types
-                        p_name, p_type = param.split(":", 1)
-                        values = ""
-                        if p_type == "numbers":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.NUMBERS, {}).values()
-                            )
-
-                        elif p_type == "days":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.DAYS, {}).values()
-                            )
-
-                        elif p_type == "time_of_day":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.TIME_OF_DAY, {}).values()
-                            )
-
-                        if values:
-                            pattern = pattern.replace(
-                                r"\{" + param + r"\}",
-                                r"(?P<" + p_name + r">" + "|".join(values) + r")",
-                            )
-                    else:
-                        pattern = pattern.replace(
-                            r"\{" + param + r"\}", r"(?P<" + param + r">\S+)"
-                        )
-                pattern = r"(?:^|\b)" + pattern + r"(?:\b|$)"
-
-                # Replace matches by group name in template
-                if matches := re.finditer(pattern, string):
-                    for match in matches:
-                        replacement = template
-                        for param in params:
-                            if ":" in param:
-                                param = param.split(":", 1)[0]
-                            if param in match.groupdict():
-                                replacement = replacement.replace(
-                                    "{" + param + "}", match.group(param)
-                                )
-                        string = re.sub(pattern, f" {replacement} ", string, count=1)
+        for compound in self.pack.compounds:
+            string = compound.unpack(string)
         return string
 
     async def translate(
-        self, sentence: str, locale: str = "en", clean_untranslated: bool = False
+        self,
+        sentence: str,
+        locale: str = "en",
+        clean_untranslated: bool = False,
+        trace: DecodeTrace | None = None,
     ) -> str:
         """Load translation file and translate sentence."""
-        locale = self._two_char_locale(locale)
-        if not self.load_language_pack or self.loaded_lang != locale:
-            result = await self.hass.async_add_executor_job(
-                self.load_language_pack, locale
-            )
-            if not result:
-                return sentence
+        loaded = await self.async_load_language_pack(locale)
+        if trace:
+            trace.mark("load_language_pack")
+        if not loaded:
+            return sentence
+        return self.translate_sentence(sentence, clean_untranslated, trace)
+
+    def translate_sentence(
+        self,
+        sentence: str,
+        clean_untranslated: bool = False,
+        trace: DecodeTrace | None = None,
+    ) -> str:
+        """Translate sentence using the loaded language pack.
+
+        Does no io so can be run in the executor once the pack is loaded.
+        """
+        if not self.pack:
+            return sentence
 
         # Preprocess sentence to ensure structure
         s = self.clean_sentence(sentence)
+        if trace:
+            trace.mark("clean_sentence")
 
         # Perform any direct translations first
         s = self._unpack_compound_words(s)
+        if trace:
+            trace.mark("compound_words")
 
         # Convert basic numbers
         s = self._translate_collection(s, LangPackKeys.NUMBERS)
@@ -331,16 +315,13 @@ class TimeSentenceTranslator:
 
         for col in collections:
             s = self._translate_collection(s, col)
+        if trace:
+            trace.mark("translate_collections")
 
         if clean_untranslated:
             # Remove any non english words left (i.e. untranslatable words)
             sentence_words = s.split()
-            # Build all supported words list
-            known_words = []
-            for group in LangPackKeys:
-                if group_dict := self.lang.get(group):
-                    for key in group_dict:
-                        known_words.extend(key.split())
+            known_words = self.pack.known_words
             output = []
             for word in sentence_words:
                 # if number just add
@@ -354,6 +335,8 @@ class TimeSentenceTranslator:
                     if word in known_words:
                         output.append(word)
 
+            if trace:
+                trace.mark("clean_untranslated")
             return " ".join(output)
         return " ".join(s.split())
 
@@ -361,13 +344,8 @@ class TimeSentenceTranslator:
         self, sentence_id: str, params: dict[str, Any] | None = None, locale: str = "en"
     ) -> str | None:
         """Translate a response sentence id with optional params."""
-        language = self._two_char_locale(locale)
-        if not self.loaded_lang or self.loaded_lang != language:
-            result = await self.hass.async_add_executor_job(
-                self.load_language_pack, language
-            )
-            if not result:
-                return None
+        if not await self.async_load_language_pack(locale):
+            return None
 
         responses: dict[str, str] | None = self.lang.get("responses")
         if not responses:
@@ -1,7 +1,5 @@
 """Convert time words to numbers."""
 
-import re
-
 numbers = {
     "zero": "0",
     "one": "1",
@@ -38,36 +36,74 @@ numbers = {
 }
 
 
+SCALES = {"thousand": 1000, "million": 1000000, "billion": 1000000000}
+HUNDRED = "hundred"
+JOINER = "and"
+
+
 class WordsToDigits:
-    """Convert number words to digits in a string."""
+    """Convert number words to digits in a string.
+
+    Runs of number words are accumulated as they are read, so compound
+    numbers such as "twenty one", "one hundred and twenty" or
+    "two thousand five hundred" become single numbers.  Number words that
+    cannot form one number, such as "seven thirty", are kept separate.
+    """
+
+    @staticmethod
+    def _can_join(total: int, current: int, value: int) -> bool:
+        """Return if a number below 100 can be added to the current number."""
+        below_hundred = current % 100
+        if below_hundred == 0:
+            # After hundred, thousand etc but not zero
+            return current > 0 or total > 0
+        # Tens followed by units, ie twenty one
+        return below_hundred >= 20 and below_hundred % 10 == 0 and 0 < value < 10
 
     @staticmethod
     def convert(s: str, number_joiner: str | None = None) -> str:
         """Convert number words to digits in a string."""
-        s = s.lower()
-
-        # Handle "twenty one", "thirty two", etc.
-        tens = "twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety"
-
-        units = "one|two|three|four|five|six|seven|eight|nine"
-
-        word_pattern = rf"(?:^|\s)({tens}) ({units})(?:$|\s)"
-        if matches := re.findall(word_pattern, s):
-            for m in matches:
-                p = rf"(?:^|\s)({m[0]}) ({m[1]})(?:$|\s)"
-                s = re.sub(
-                    p,
-                    " " + str(int(numbers[m[0]]) + int(numbers[m[1]])) + " ",
-                    s,
-                )
+        output: list[str] = []
+        total = current = 0
+        in_number = has_scale = False
 
-        all_numbers = "|".join(numbers.keys())
-        word_pattern = rf"({all_numbers})\b"
-        if m := re.findall(word_pattern, s):
-            for group in m:
-                word_p = rf"(?:^|\s)({group})(?:$|\s)"
-                s = re.sub(word_p, " " + numbers[group] + " ", s)
+        def flush():
+            nonlocal total, current, in_number, has_scale
+            if in_number:
+                output.append(str(total + current))
+            total = current = 0
+            in_number = has_scale = False
 
-        # Clean up spaces
-        s = re.sub(r"\s+", " ", s)
-        return s.strip()
+        tokens = s.lower().split()
+        for idx, token in enumerate(tokens):
+            if token == HUNDRED:
+                if current % 100 or not in_number:
+                    current = (current or 1) * 100
+                else:
+                    flush()
+                    current = 100
+                in_number = has_scale = True
+            elif token in SCALES:
+                total += (current or 1) * SCALES[token]
+                current = 0
+                in_number = has_scale = True
+            elif token in numbers:
+                value = int(numbers[token])
+                if in_number and not WordsToDigits._can_join(total, current, value):
+                    flush()
+                current += value
+                in_number = True
+            elif (
+                token == JOINER
+                and has_scale
+                and idx + 1 < len(tokens)
+                and tokens[idx + 1] in numbers
+                and not current % 100
+            ):
+                # one hundred and twenty
+                continue
+            else:
+                flush()
+                output.append(token)
+        flush()
+        return " ".join(output)
@@ -13,6 +13,7 @@ from homeassistant.components.websocket_api import (
     async_register_command,
     async_response,
     event_message,
+    require_admin,
     websocket_command,
 )
 from homeassistant.core import HomeAssistant, callback
@@ -30,7 +31,8 @@ from ..helpers import (  # noqa: TID252
     get_mimic_entity_id,
 )
 from ..typed import VAConfigEntry, VAEvent, VAEventType, VAScreenMode  # noqa: TID252
-from .timers import TimerManager
+from .timers import TimerDeltaType, TimerManager
+from .translator import Translator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -201,6 +203,11 @@ class WebsocketListenerHandler:
     def _send_event(self, event: VAEvent):
         """Send event to connection."""
 
+        # Send changed timers if timer delta event.  Event is shared by all
+        # connections for the entity, so do not change its payload
+        if event.event_name == VAEventType.TIMER_DELTA:
+            event = VAEvent(event.event_name, self._get_timer_delta(event.payload))
+
         # Send timers if timer event
         if event.event_name == VAEventType.TIMER_UPDATE:
             if timers := TimerManager.get(self.hass):
@@ -228,6 +235,7 @@ class WebsocketListenerHandler:
             VAEventType.ASSIST_LISTENING,
             VAEventType.NAVIGATION,
             VAEventType.TIMER_UPDATE,
+            VAEventType.TIMER_DELTA,
             VAEventType.RELOAD,
         ]:
             _LOGGER.debug(
@@ -243,6 +251,34 @@ class WebsocketListenerHandler:
                 )
             )
 
+    def _get_timer_delta(self, delta: dict[str, Any]) -> dict[str, Any]:
+        """Get changed timers for a timer delta.
+
+        Only the changed timers are formatted.  Changed timers no longer
+        returned for this entity are sent as removed.
+        """
+        timers = []
+        if delta["type"] != TimerDeltaType.REMOVED and (
+            tm := TimerManager.get(self.hass)
+        ):
+            timers = [
+                timer
+                for timer_id in delta["timer_ids"]
+                for timer in tm.get_timers(
+                    timer_id=timer_id,
+                    entity_id=self.entity_id,
+                    include_expired=True,
+                    sort=False,
+                )
+            ]
+            timers.sort(key=lambda d: d["expiry"]["seconds"])
+        found = {timer["id"] for timer in timers}
+        return {
+            "type": delta["type"],
+            "timers": timers,
+            "removed": [tid for tid in delta["timer_ids"] if tid not in found],
+        }
+
     def _get_event_data(self) -> dict[str, Any]:
         output = {}
         config = self.config
@@ -409,8 +445,66 @@ def setup_websocket_commands(hass: HomeAssistant) -> None:
 
         connection.send_result(msg["id"], output)
 
+    # Get all timers for a browser, ie to resync after reconnecting
+    @websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/get_timers",
+            vol.Required("browser_id"): str,
+        }
+    )
+    @async_response
+    async def handle_get_timers(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        """Get all timers for the entity of a browser."""
+        output = []
+        entity_id = get_entity_id_by_browser_id(hass, msg["browser_id"])
+        if not entity_id:
+            entity_id = get_mimic_entity_id(hass)
+
+        if entity_id and (timers := TimerManager.get(hass)):
+            output = timers.get_timers(entity_id=entity_id, include_expired=True)
+
+        connection.send_result(msg["id"], output)
+
+    # Get time sentence decode traces, optionally enabling or disabling tracing
+    @require_admin
+    @websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/get_decode_traces",
+            vol.Optional("enable"): bool,
+            vol.Optional("clear", default=False): bool,
+        }
+    )
+    @async_response
+    async def handle_get_decode_traces(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        """Get recent time sentence decode traces."""
+        if not (translator := Translator.get(hass)):
+            connection.send_error(
+                msg["id"], "not_loaded", "Time sentence translator is not loaded"
+            )
+            return
+
+        if "enable" in msg:
+            translator.tracer.enabled = msg["enable"]
+        if msg["clear"]:
+            translator.tracer.clear()
+
+        connection.send_result(
+            msg["id"],
+            {
+                "enabled": translator.tracer.enabled,
+                "summary": translator.tracer.summary(),
+                "traces": translator.tracer.as_list(),
+            },
+        )
+
     # Register commands
     async_register_command(hass, handle_connect)
     async_register_command(hass, handle_get_entity_by_browser_id)
     async_register_command(hass, handle_get_server_time)
     async_register_command(hass, handle_get_timer_by_name)
+    async_register_command(hass, handle_get_timers)
+    async_register_command(hass, handle_get_decode_traces)
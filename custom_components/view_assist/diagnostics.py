@@ -0,0 +1,73 @@
+"""Diagnostics support for View Assist."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_TYPE
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_DEVELOPER_DEVICE,
+    CONF_DEVELOPER_MIMIC_DEVICE,
+    CONF_DISPLAY_DEVICE,
+    CONF_INTENT_DEVICE,
+    CONF_MEDIAPLAYER_DEVICE,
+    CONF_MIC_DEVICE,
+    CONF_MUSICPLAYER_DEVICE,
+    CONF_VA_BROWSER_IDS,
+)
+from .core.timers import TimerManager
+from .core.translator import Translator
+from .typed import VAConfigEntry, VAType
+
+# Device and browser identifiers in config entry data and options
+TO_REDACT = {
+    CONF_DEVELOPER_DEVICE,
+    CONF_DEVELOPER_MIMIC_DEVICE,
+    CONF_DISPLAY_DEVICE,
+    CONF_INTENT_DEVICE,
+    CONF_MEDIAPLAYER_DEVICE,
+    CONF_MIC_DEVICE,
+    CONF_MUSICPLAYER_DEVICE,
+    CONF_VA_BROWSER_IDS,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: VAConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    diagnostics = {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        }
+    }
+
+    # Core functions only run on the master config entry
+    if entry.data.get(CONF_TYPE) == VAType.MASTER_CONFIG and (
+        translator := Translator.get(hass)
+    ):
+        diagnostics["translator"] = {
+            "decode_cache": translator.decode_cache.stats,
+            "fast_path": translator.fast_path.stats,
+            "decode_executor": translator.decode_executor.stats,
+            "tracing_enabled": translator.tracer.enabled,
+            "decode_latency": translator.tracer.summary(),
+            "decode_traces": translator.tracer.as_list(),
+        }
+
+    if entry.data.get(CONF_TYPE) == VAType.MASTER_CONFIG and (
+        timer_manager := TimerManager.get(hass)
+    ):
+        diagnostics["timers"] = {
+            "count": len(timer_manager.store.timers),
+            "store": timer_manager.store.stats,
+            "resolution_cache": timer_manager.resolution_cache_stats,
+            "scheduling": timer_manager.scheduling_stats,
+        }
+
+    return diagnostics
@@ -568,6 +568,9 @@ class ViewAssist {
     }
 
     if (this.connected) {
+      // Resync timers as any timer deltas sent while disconnected are missed
+      await this.sync_timers();
+
       // Create time sync job with server - updates every 5 minutes
       await this.set_time_delta();
       var t = this;
@@ -614,6 +617,9 @@ class ViewAssist {
       case "timer_update":
         this.variables.config.timers = payload
         break;
+      case "timer_delta":
+        this.apply_timer_delta(payload);
+        break;
       case "navigate":
         if (!is_mimic) {
           if (payload["variables"]) {
@@ -632,6 +638,32 @@ class ViewAssist {
     }
   }
 
+  apply_timer_delta(payload) {
+    // Apply changed and removed timers to the current timer list
+    const changed = new Map(payload.timers.map(t => [t.id, t]));
+    const timers = (this.variables.config.timers || []).filter(
+      t => !changed.has(t.id) && !payload.removed.includes(t.id)
+    );
+    timers.push(...changed.values());
+    timers.sort((a, b) => new Date(a.expires) - new Date(b.expires));
+    this.variables.config.timers = timers;
+  }
+
+  async sync_timers() {
+    // Replace the timer list with the full list from the server
+    try {
+      const timers = await this._hass.callWS({
+        type: 'view_assist/get_timers',
+        browser_id: this.variables.browser_id,
+      })
+      if (this.variables.config) {
+        this.variables.config.timers = timers;
+      }
+    } catch (e) {
+      console.log("View Assist - Unable to sync timers: ", e.message);
+    }
+  }
+
   process_config(event, payload) {
     let reload = false;
     const old_config = this.variables?.config
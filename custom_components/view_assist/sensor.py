@@ -2,21 +2,30 @@
 
 import asyncio
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import CONF_TYPE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN, OPTION_KEY_MIGRATIONS
 from .core import TimerManager
+from .core.timers import TimerEvent
 from .devices import MenuManager
 from .helpers import get_device_id_from_entity_id, get_mute_switch_entity_id
 from .typed import (
@@ -25,6 +34,7 @@ from .typed import (
     VAEvent,
     VAEventType,
     VATimeFormat,
+    VAType,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,6 +45,13 @@ async def async_setup_entry(
 ):
     """Set up sensors from a config entry."""
 
+    if config_entry.data[CONF_TYPE] == VAType.MASTER_CONFIG:
+        async_add_entities(
+            TimerDiagnosticSensor(hass, config_entry, description)
+            for description in TIMER_DIAGNOSTIC_SENSORS
+        )
+        return
+
     sensors = [ViewAssistSensor(hass, config_entry)]
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
@@ -46,6 +63,85 @@ async def async_setup_entry(
     async_add_entities(sensors)
 
 
+@dataclass(frozen=True, kw_only=True)
+class TimerDiagnosticSensorDescription(SensorEntityDescription):
+    """Description of a timer diagnostic sensor."""
+
+    value_fn: Callable[[TimerManager], Any]
+    attributes_fn: Callable[[TimerManager], dict[str, Any]]
+
+
+TIMER_DIAGNOSTIC_SENSORS = [
+    TimerDiagnosticSensorDescription(
+        key="timer_expiry_lateness",
+        name="View Assist timer expiry lateness",
+        icon="mdi:timer-alert-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tm: tm.get_mean_lateness(TimerEvent.EXPIRED),
+        attributes_fn=lambda tm: tm.get_lateness(TimerEvent.EXPIRED),
+    ),
+    TimerDiagnosticSensorDescription(
+        key="timer_warning_lateness",
+        name="View Assist timer warning lateness",
+        icon="mdi:timer-alert-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tm: tm.get_mean_lateness(TimerEvent.WARNING),
+        attributes_fn=lambda tm: tm.get_lateness(TimerEvent.WARNING),
+    ),
+    TimerDiagnosticSensorDescription(
+        key="timers",
+        name="View Assist timers",
+        icon="mdi:timer-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tm: len(tm.store.timers),
+        attributes_fn=lambda tm: tm.status_counts,
+    ),
+    TimerDiagnosticSensorDescription(
+        key="timer_queue_depth",
+        name="View Assist timer queue depth",
+        icon="mdi:timer-sand",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tm: len(tm.scheduler),
+        attributes_fn=lambda tm: tm.scheduler.stats,
+    ),
+]
+
+
+class TimerDiagnosticSensor(SensorEntity):
+    """Timer scheduling metrics sensor.  Polled as metrics change often."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: TimerDiagnosticSensorDescription
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: VAConfigEntry,
+        description: TimerDiagnosticSensorDescription,
+    ) -> None:
+        """Initialise the sensor."""
+        self.hass = hass
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            name=config.title,
+        )
+
+    async def async_update(self) -> None:
+        """Update metrics from the timer manager."""
+        if tm := TimerManager.get(self.hass):
+            self._attr_native_value = self.entity_description.value_fn(tm)
+            self._attr_extra_state_attributes = self.entity_description.attributes_fn(
+                tm
+            )
+
+
 class ViewAssistSensor(SensorEntity):
     """Representation of a View Assist Sensor."""
 
@@ -107,6 +203,7 @@ class ViewAssistSensor(SensorEntity):
             if event.event_name in [
                 VAEventType.BACKGROUND_CHANGE,
                 VAEventType.TIMER_UPDATE,
+                VAEventType.TIMER_DELTA,
                 VAEventType.BROWSER_REGISTERED,
                 VAEventType.CONFIG_UPDATE,
             ]:
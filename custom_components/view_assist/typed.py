@@ -94,6 +94,8 @@ class IntegrationConfig:
 
     enable_updates: bool = True
     translation_engine: str | None = None
+    expired_timer_retention: int = 60
+    expired_timer_max: int = 10
 
 
 @dataclass
@@ -208,6 +210,7 @@ class VAEventType(StrEnum):
     BROWSER_REGISTERED = "registered"
     BROWSER_UNREGISTERED = "unregistered"
     TIMER_UPDATE = "timer_update"
+    TIMER_DELTA = "timer_delta"
     RELOAD = "reload"
 
 
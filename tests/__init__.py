@@ -0,0 +1 @@
+"""Tests for View Assist."""
@@ -0,0 +1,4 @@
+"""Benchmarks for View Assist.
+
+Run from the repository root, ie python -m tests.benchmarks.bench_replacer
+"""
@@ -0,0 +1,72 @@
+"""Load translator modules from the baseline commit, for comparison.
+
+Sources are read with git show from BASELINE_COMMIT, the tree before the
+decode optimisations, and loaded under a separate baseline package so they
+run unmodified beside the current modules.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import types
+
+from ..ha_stubs import PACKAGE, REPO_ROOT, _load, _module
+
+BASELINE_COMMIT = "d93d38d"
+
+BASELINE_PACKAGE = f"{PACKAGE}_baseline"
+
+# Baseline translator modules, in dependency order
+TRANSLATOR_MODULES = ["translator", "wordstonumbers", "normaliser"]
+
+
+def read_baseline_source(path: str) -> str:
+    """Return source of a repository path at the baseline commit."""
+    try:
+        return subprocess.run(
+            ["git", "show", f"{BASELINE_COMMIT}:{path}"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError) as ex:
+        raise RuntimeError(
+            f"Unable to read {path} at baseline commit {BASELINE_COMMIT} - {ex}"
+        ) from ex
+
+
+def load_baseline_translator() -> types.ModuleType:
+    """Load and return the baseline core.translator package.
+
+    Has the baseline translator, wordstonumbers and normaliser modules as
+    attributes, and the classes the package exports.
+    """
+    name = f"{BASELINE_PACKAGE}.core.translator"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    # Current package provides the stubbed helpers and the constants
+    current = _load("const")
+    _module(BASELINE_PACKAGE, __path__=[])
+    _module(f"{BASELINE_PACKAGE}.helpers", **vars(sys.modules[f"{PACKAGE}.helpers"]))
+    _module(f"{BASELINE_PACKAGE}.core", __path__=[])
+    package = _module(name, __path__=[], DOMAIN=current.DOMAIN, VAConfigEntry=object)
+
+    for module_name in TRANSLATOR_MODULES:
+        path = f"custom_components/view_assist/core/translator/{module_name}.py"
+        module = types.ModuleType(f"{name}.{module_name}")
+        module.__package__ = name
+        module.__file__ = f"{BASELINE_COMMIT}:{path}"
+        sys.modules[module.__name__] = module
+        exec(  # noqa: S102
+            compile(read_baseline_source(path), module.__file__, "exec"),
+            module.__dict__,
+        )
+        setattr(package, module_name, module)
+
+    package.Normaliser = package.normaliser.Normaliser
+    package.TimerInfo = package.normaliser.TimerInfo
+    package.TimeSentenceTranslator = package.translator.TimeSentenceTranslator
+    return package
@@ -0,0 +1,176 @@
+"""Benchmark time sentence decoding and check TimerInfo results are unchanged.
+
+For each bundled pack, times TimeSentenceTranslator.translate_sentence and
+Normaliser.normalise_sentence over the corpus, and the legacy
+SentenceDecoder.decode if the wordtodigits package is installed.  The sync
+methods are timed, as translate and normalise only add pack loading to them.
+
+Decoded TimerInfo for each corpus sentence and type hint are compared with
+decode_snapshot.json, the results of the translator modules at the baseline
+commit before the decode optimisations (see baseline.py).  --update
+regenerates it by decoding the corpus with those baseline modules, so is
+only needed when the corpus changes.
+
+Run from the repository root with python -m tests.benchmarks.bench_decode
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict
+import importlib
+import json
+import logging
+from pathlib import Path
+import sys
+from typing import Any
+
+from ..corpus import LANGUAGES, corpus
+from ..ha_stubs import PACKAGE, VA_PATH, FakeHass, load_translator
+from .baseline import BASELINE_COMMIT, load_baseline_translator
+from .timing import format_result, measure
+
+SNAPSHOT_PATH = Path(__file__).parent / "decode_snapshot.json"
+
+TYPE_HINTS = ["time", "interval"]
+
+
+def timer_info_as_dict(timer_info: Any) -> dict[str, Any] | None:
+    """Return TimerInfo fields that are not defaults."""
+    if timer_info is None:
+        return None
+    return {k: v for k, v in asdict(timer_info).items() if v not in (0, "", False)}
+
+
+async def decode(translator_module, hass, sentence: str, lang: str) -> list:
+    """Decode sentence as the timer services do, for each type hint."""
+    translated = await translator_module.TimeSentenceTranslator(hass, None).translate(
+        sentence, lang
+    )
+    results = []
+    for type_hint in TYPE_HINTS:
+        normaliser = translator_module.Normaliser(hass, locale=lang)
+        try:
+            results.append(
+                timer_info_as_dict(await normaliser.normalise(translated, type_hint))
+            )
+        except ValueError as ex:
+            results.append({"error": type(ex).__name__})
+    return results
+
+
+async def decode_corpus(translator_module, hass) -> dict[str, dict[str, list]]:
+    """Decode every corpus sentence by language."""
+    return {
+        lang: {s: await decode(translator_module, hass, s, lang) for s in corpus(lang)}
+        for lang in LANGUAGES
+    }
+
+
+def load_snapshot() -> dict[str, dict[str, list]]:
+    """Load snapshot of decode results.
+
+    Sentences that decode to no TimerInfo for any type hint are not stored.
+    """
+    return json.loads(SNAPSHOT_PATH.read_text(encoding="utf-8"))
+
+
+def save_snapshot(results: dict[str, dict[str, list]]) -> None:
+    """Save snapshot with one sentence per line so changes diff well."""
+    lines = ["{"]
+    for lang_idx, (lang, sentences) in enumerate(results.items()):
+        stored = [(s, r) for s, r in sentences.items() if any(r)]
+        lines.append(f"  {json.dumps(lang)}: {{")
+        lines.extend(
+            f"    {json.dumps(s, ensure_ascii=False)}: "
+            f"{json.dumps(r, ensure_ascii=False)}"
+            + ("," if idx < len(stored) - 1 else "")
+            for idx, (s, r) in enumerate(stored)
+        )
+        lines.append("  }" + ("," if lang_idx < len(results) - 1 else ""))
+    lines.append("}")
+    SNAPSHOT_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+async def async_main(update: bool) -> int:
+    """Run benchmark."""
+    translator_module = load_translator()
+    hass = FakeHass()
+
+    try:
+        decoder_module = importlib.import_module(f"{PACKAGE}.core.decoder")
+    except ImportError as ex:
+        print(f"SKIPPED SentenceDecoder - {ex}")
+        decoder_module = None
+
+    for lang in LANGUAGES:
+        sentences = corpus(lang)
+        translator = translator_module.TimeSentenceTranslator(hass, None)
+        await translator.async_load_language_pack(lang)
+        normaliser = translator_module.Normaliser(hass, locale=lang)
+        await normaliser.async_load_language_packs()
+        translated = [translator.translate_sentence(s) for s in sentences]
+
+        def normalise(s: str, normaliser=normaliser) -> None:
+            # Some generated sentences are not valid numbers
+            try:
+                normaliser.normalise_sentence(s, "interval")
+            except ValueError:
+                pass
+
+        print(
+            format_result(
+                f"{lang} translate", measure(translator.translate_sentence, sentences)
+            )
+        )
+        print(format_result(f"{lang} normalise", measure(normalise, translated)))
+
+        if decoder_module:
+            # Legacy decoder reads packs from the view_assist dir in config
+            decoder = decoder_module.SentenceDecoder(FakeHass(VA_PATH.parent), lang)
+            failed = set()
+
+            def legacy_decode(s: str, decoder=decoder, failed=failed) -> None:
+                # Legacy decoder raises on many sentences it cannot decode
+                try:
+                    decoder.decode(s)
+                except Exception:  # noqa: BLE001
+                    failed.add(s)
+
+            print(
+                format_result(
+                    f"{lang} SentenceDecoder", measure(legacy_decode, sentences)
+                )
+                + f"  ({len(failed)} raised)"
+            )
+
+    if update:
+        save_snapshot(await decode_corpus(load_baseline_translator(), hass))
+        print(f"Updated {SNAPSHOT_PATH.name} from {BASELINE_COMMIT}")
+        return 0
+
+    results = await decode_corpus(translator_module, hass)
+    snapshot = load_snapshot()
+    errors = [
+        f"{lang} {s!r} expected {expected} got {actual}"
+        for lang, sentences in results.items()
+        for s, actual in sentences.items()
+        if actual
+        != (expected := snapshot.get(lang, {}).get(s, [None] * len(TYPE_HINTS)))
+    ]
+    for error in errors:
+        print(error)
+    checked = sum(len(sentences) for sentences in results.values())
+    print(f"{len(errors)} of {checked} sentences with changed TimerInfo")
+    return 1 if errors else 0
+
+
+def main() -> int:
+    """Run benchmark."""
+    # Legacy decoder logs each sentence it cannot decode
+    logging.disable(logging.WARNING)
+    return asyncio.run(async_main("--update" in sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Load test the timer manager against a virtual clock.
+
+Adds thousands of timers across hundreds of entities, cancels and snoozes
+some, and runs hours of virtual time in steps.  The timer manager, store and
+event loop share the virtual clock, so timers fire when the clock passes
+their deadline without waiting in real time.
+
+Steps are of random length, averaging --step, and every --lag-every steps
+on average the clock jumps --lag seconds as if the loop was blocked, so
+events fire late by up to the step they fall in.
+
+Reports event loop lag per step, memory per timer, store write coalescing
+and how late warning and expiry events fired.  Exits non zero if any timer
+did not fire its expired event, a snoozed timer did not expire again, timers
+expired out of deadline order, no event fired late or an event fired later
+than the step it fell in.
+
+Run from the repository root with python -m tests.benchmarks.bench_timers_load
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+
+from ..ha_stubs import DEVICES, FakeConfigEntry, FakeHass, VirtualClock, load_timers
+
+timers = load_timers()
+
+# Unix time the virtual clock starts at
+START_TIME = 1_800_000_000.0
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose scheduled callbacks run on the virtual clock."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        """Initialise."""
+        super().__init__()
+        self.clock = clock
+        self.start = clock.now
+
+    def time(self) -> float:
+        """Return loop time from the virtual clock."""
+        return self.clock.now - self.start
+
+
+async def run(args: argparse.Namespace, clock: VirtualClock) -> int:
+    """Run load test."""
+    rnd = random.Random(1)
+    DEVICES.update({f"mic_{i}": f"sensor.va_{i}" for i in range(args.entities)})
+    hass = FakeHass()
+    config = FakeConfigEntry()
+    tm = timers.TimerManager(hass, config, clock=clock)
+    await tm.async_setup()
+
+    duration = int(args.hours * 3600)
+    items = [
+        {
+            "timer_class": rnd.choice(
+                [timers.TimerClass.TIMER, timers.TimerClass.ALARM]
+            ),
+            "device_id": f"mic_{i % args.entities}",
+            "entity_id": None,
+            "timer_info": timers.TimerInfo(seconds=rnd.randint(60, duration)),
+            "pre_expire_warning": rnd.choice([0, 10, 60]),
+            "extra_info": {},
+        }
+        for i in range(args.timers)
+    ]
+
+    tracemalloc.start()
+    memory = tracemalloc.get_traced_memory()[0]
+    for idx in range(0, len(items), 100):
+        await tm.add_timers(items[idx : idx + 100])
+    memory = tracemalloc.get_traced_memory()[0] - memory
+    tracemalloc.stop()
+
+    # Identical items are added as one timer
+    added = len(tm.store.timers)
+    cancelled = set(rnd.sample(list(tm.store.timers), added // 10))
+    for timer_id in cancelled:
+        await tm.cancel_timer(timer_id=timer_id)
+    to_snooze = set(rnd.sample(list(tm.store.timers.keys() - cancelled), added // 20))
+
+    # Step the clock, snoozing timers in to_snooze when they first expire
+    expired_event = timers.VA_EVENT_PREFIX.format(timers.TimerEvent.EXPIRED)
+    expiries: dict[str, int] = {}
+    out_of_order = 0
+    last_deadline = 0
+    lags = []
+    longest_step = 0.0
+    seen_events = 0
+    end = clock.now + duration + 600
+    while clock.now < end:
+        step = rnd.uniform(0, 2 * args.step)
+        if rnd.random() < 1 / args.lag_every:
+            step += args.lag
+        longest_step = max(longest_step, step)
+        clock.now += step
+        started = time.perf_counter()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        lags.append(time.perf_counter() - started)
+
+        events = hass.bus.events
+        for event_type, event_data in events[seen_events:]:
+            if event_type != expired_event:
+                continue
+            timer_id = event_data["timer_id"]
+            expiries[timer_id] = expiries.get(timer_id, 0) + 1
+            deadline = tm.store.timers[timer_id].expires_at
+            if deadline < last_deadline:
+                out_of_order += 1
+            last_deadline = max(last_deadline, deadline)
+            if timer_id in to_snooze and expiries[timer_id] == 1:
+                await tm.snooze_timer(
+                    timer_id, timers.TimerInfo(minutes=5, sentence="5 minutes")
+                )
+        seen_events = len(events)
+
+    lags.sort()
+    print(
+        f"entities {args.entities}  timers {added}"
+        f"  memory {memory / added / 1024:.2f}KiB/timer"
+    )
+    print(
+        f"loop lag per {args.step * 1000:.0f}ms mean step"
+        f"  p50 {lags[len(lags) // 2] * 1000:.3f}ms"
+        f"  p99 {lags[int(len(lags) * 0.99)] * 1000:.3f}ms"
+        f"  max {lags[-1] * 1000:.3f}ms"
+    )
+    print(f"store {tm.store.stats}")
+    print(
+        f"status {tm.status_counts}  cancelled {len(cancelled)}"
+        f"  snoozed {len(to_snooze)}"
+    )
+
+    errors = []
+    max_lateness = 0
+    for event in [timers.TimerEvent.WARNING, timers.TimerEvent.EXPIRED]:
+        for timer_class, histogram in tm.get_lateness(event).items():
+            print(
+                f"{event} {timer_class} lateness count {histogram['count']}"
+                f"  mean {histogram['mean']}ms  max {histogram['max']}ms"
+                f"  {histogram['buckets']}"
+            )
+            max_lateness = max(max_lateness, histogram["max"])
+            if histogram["max"] > longest_step * 1000 + 1:
+                errors.append(f"{event} {timer_class} fired {histogram['max']}ms late")
+    if not max_lateness:
+        errors.append("no event fired late, so lateness was not measured")
+    if out_of_order:
+        errors.append(f"{out_of_order} timers expired before an earlier deadline")
+
+    # Expired timers are swept from the store, so check the expired events
+    if expired := cancelled & expiries.keys():
+        errors.append(f"{len(expired)} cancelled timers expired")
+    if missed := tm.store.timers.keys() - cancelled - expiries.keys():
+        errors.append(f"{len(missed)} timers did not expire")
+    if unexpired := added - len(cancelled) - len(expiries):
+        errors.append(f"{unexpired} timers did not fire an expired event")
+    if not_snoozed := {t for t in to_snooze if expiries.get(t) != 2}:
+        errors.append(f"{len(not_snoozed)} snoozed timers did not expire twice")
+    if running := tm.status_counts[timers.TimerStatus.RUNNING]:
+        errors.append(f"{running} timers still running")
+
+    await tm.async_unload()
+    config.unload()
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+def main() -> int:
+    """Run load test on a virtual clock event loop."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=200)
+    parser.add_argument("--timers", type=int, default=5000)
+    parser.add_argument("--hours", type=float, default=2)
+    parser.add_argument("--step", type=float, default=0.05, help="mean clock step in s")
+    parser.add_argument(
+        "--lag", type=float, default=0.5, help="clock jump in s of a blocked loop"
+    )
+    parser.add_argument(
+        "--lag-every", type=int, default=1000, help="mean steps between lag jumps"
+    )
+    args = parser.parse_args()
+
+    clock = VirtualClock(START_TIME)
+    loop = VirtualClockEventLoop(clock)
+    try:
+        return loop.run_until_complete(run(args, clock))
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
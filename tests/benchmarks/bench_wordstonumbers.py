@@ -0,0 +1,150 @@
+"""Compare WordsToDigits.convert with the regex implementation it replaced.
+
+Checks the number conversions in CASES, then runs the corpus for every
+bundled pack through the legacy and current convert, exiting non zero if
+outputs differ other than in ACCEPTED_DIFFERENCES.
+
+Run from the repository root with python -m tests.benchmarks.bench_wordstonumbers
+"""
+
+from __future__ import annotations
+
+import importlib
+import re
+import sys
+
+from ..corpus import LANGUAGES, corpus
+from ..ha_stubs import PACKAGE, load_translator
+from .timing import format_result, measure
+
+# Input -> expected output of the current convert
+CASES = {
+    # Compound numbers become one number
+    "twenty five minutes": "25 minutes",
+    "one hundred and twenty": "120",
+    "one hundred and twenty seconds": "120 seconds",
+    "two thousand five hundred": "2500",
+    "two thousand seconds": "2000 seconds",
+    "a hundred": "a 100",
+    # Clock pairs are not merged
+    "seven thirty": "7 30",
+    "twenty twenty": "20 20",
+    "zero eight": "0 8",
+    "ten fifteen pm": "10 15 pm",
+    # and is only consumed after hundred or a larger scale
+    "two and a half hours": "2 and a half hours",
+    "set a timer for five minutes": "set a timer for 5 minutes",
+}
+
+# Input -> (legacy output, current output) for known differences.
+# Legacy converted each number word separately, so scale words were left as
+# separate digits, and its tens/units substitution overlapped on repeats.
+ACCEPTED_DIFFERENCES = {
+    "one hundred and twenty": ("1 100 and 20", "120"),
+    "two thousand five hundred": ("2 1000 5 100", "2500"),
+    "one hundred and twenty seconds": ("1 100 and 20 seconds", "120 seconds"),
+    "two thousand seconds": ("2 1000 seconds", "2000 seconds"),
+    "tres twenty two twenty two one hrs tarde": (
+        "tres 22 20 2 1 hrs tarde",
+        "tres 22 22 1 hrs tarde",
+    ),
+}
+
+legacy_numbers = {
+    "zero": "0",
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    "ten": "10",
+    "eleven": "11",
+    "twelve": "12",
+    "thirteen": "13",
+    "fourteen": "14",
+    "fifteen": "15",
+    "sixteen": "16",
+    "seventeen": "17",
+    "eighteen": "18",
+    "nineteen": "19",
+    "twenty": "20",
+    "thirty": "30",
+    "forty": "40",
+    "fifty": "50",
+    "sixty": "60",
+    "seventy": "70",
+    "eighty": "80",
+    "ninety": "90",
+    "hundred": "100",
+    "thousand": "1000",
+    "million": "1000000",
+    "billion": "1000000000",
+}
+
+
+def legacy_convert(s: str) -> str:
+    """Legacy WordsToDigits.convert."""
+    s = s.lower()
+
+    # Handle "twenty one", "thirty two", etc.
+    tens = "twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety"
+
+    units = "one|two|three|four|five|six|seven|eight|nine"
+
+    word_pattern = rf"(?:^|\s)({tens}) ({units})(?:$|\s)"
+    if matches := re.findall(word_pattern, s):
+        for m in matches:
+            p = rf"(?:^|\s)({m[0]}) ({m[1]})(?:$|\s)"
+            s = re.sub(
+                p,
+                " " + str(int(legacy_numbers[m[0]]) + int(legacy_numbers[m[1]])) + " ",
+                s,
+            )
+
+    all_numbers = "|".join(legacy_numbers.keys())
+    word_pattern = rf"({all_numbers})\b"
+    if m := re.findall(word_pattern, s):
+        for group in m:
+            word_p = rf"(?:^|\s)({group})(?:$|\s)"
+            s = re.sub(word_p, " " + legacy_numbers[group] + " ", s)
+
+    # Clean up spaces
+    s = re.sub(r"\s+", " ", s)
+    return s.strip()
+
+
+def main() -> int:
+    """Run checks and benchmark."""
+    load_translator()
+    convert = importlib.import_module(
+        f"{PACKAGE}.core.translator.wordstonumbers"
+    ).WordsToDigits.convert
+
+    errors = [
+        f"case {s!r} expected {expected!r} got {actual!r}"
+        for s, expected in CASES.items()
+        if (actual := convert(s)) != expected
+    ]
+
+    sentences = [" ".join(s.split()) for lang in LANGUAGES for s in corpus(lang)]
+    sentences += list(CASES)
+    for s in sentences:
+        legacy, current = legacy_convert(s), convert(s)
+        if legacy != current and ACCEPTED_DIFFERENCES.get(s) != (legacy, current):
+            errors.append(f"corpus {s!r} legacy {legacy!r} new {current!r}")
+
+    print(format_result("convert legacy", measure(legacy_convert, sentences)))
+    print(format_result("convert new", measure(convert, sentences)))
+
+    for error in errors:
+        print(error)
+    print(f"{len(errors)} errors")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
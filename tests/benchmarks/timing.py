@@ -0,0 +1,48 @@
+"""Timing helpers for benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import time
+from typing import Any
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Return percentile of sorted samples."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def measure(
+    func: Callable[[Any], Any], inputs: Iterable[Any], rounds: int = 5
+) -> dict[str, float]:
+    """Time func over each input for a number of rounds.
+
+    Returns throughput as calls per second over the fastest round, which is
+    the least disturbed by other load, and p50/p99 per call latency in us
+    over all rounds.
+    """
+    inputs = list(inputs)
+    samples = []
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in inputs:
+            t = time.perf_counter()
+            func(item)
+            samples.append(time.perf_counter() - t)
+        best = min(best, time.perf_counter() - start)
+    samples.sort()
+    return {
+        "calls": len(samples),
+        "ops_per_sec": len(inputs) / best if best else 0,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+    }
+
+
+def format_result(label: str, result: dict[str, float]) -> str:
+    """Format a measure result as one line."""
+    return (
+        f"{label:<32} {result['ops_per_sec']:>10.0f} ops/s"
+        f"  p50 {result['p50_us']:>8.1f}us  p99 {result['p99_us']:>8.1f}us"
+    )
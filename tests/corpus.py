@@ -0,0 +1,100 @@
+"""Deterministic sentence corpus built from the bundled language packs."""
+
+from __future__ import annotations
+
+import random
+
+from .ha_stubs import load_pack_json
+
+LANGUAGES = ["en", "de", "fr", "es", "ua"]
+
+# Keys that are not word collections
+NON_VOCAB_KEYS = ["compound_words", "decimal_separator", "responses", "structures"]
+
+# Hand written English sentences covering the common timer phrasings
+EN_SENTENCES = [
+    "5 minutes",
+    "30 seconds",
+    "1 hour 20 minutes",
+    "7:30 pm",
+    "7:30pm",
+    "at 7am",
+    "set a timer for five minutes",
+    "twenty five minutes",
+    "half an hour",
+    "an hour and a half",
+    "2 and a half hours",
+    "quarter past three",
+    "quarter to 4",
+    "half past seven in the morning",
+    "tomorrow at 7am",
+    "monday at 10:30",
+    "ten to six",
+    "in 2 hours",
+    "one hundred and twenty seconds",
+    "two thousand seconds",
+    "a minute",
+    "a second",
+    "an hour",
+    "a day",
+    "3 days",
+    "midday",
+    "midnight",
+    "noon",
+    "tonight at 9",
+    "friday at 6 in the evening",
+    "7 o'clock",
+    "seven oclock",
+    "20 past 4 pm",
+    "1.5 hours",
+    "1 hour, 30 minutes and 10 seconds",
+    "thursday 9pm",
+    "9:15 on wednesday",
+    "three quarters of an hour",
+    "twenty to nine tonight",
+    "wake me at 6:45 tomorrow",
+    "the day after",
+    "fourty five minutes",
+    "ninety seconds",
+    "sunday at noon",
+    "at 12 midnight",
+    "5 mins",
+    "10 secs",
+    "2 hrs",
+    "1 hr 5 min",
+]
+
+
+def vocabulary(pack: dict) -> list[str]:
+    """Return all words and translations in a pack's collections."""
+    words = []
+    for key, collection in pack.items():
+        if key in NON_VOCAB_KEYS:
+            continue
+        if isinstance(collection, dict):
+            for translation, entry in collection.items():
+                words.append(translation)
+                words.extend(entry if isinstance(entry, list) else [entry])
+        elif isinstance(collection, list):
+            words.extend(collection)
+    return [w for w in words if w and isinstance(w, str)]
+
+
+def corpus(lang: str, size: int = 400, seed: int = 1) -> list[str]:
+    """Return size sentences for a language.
+
+    Sentences are random runs of 1 to 6 words, numbers and separators from
+    the language and normaliser packs, so they exercise every collection
+    including overlapping phrases.  English also includes EN_SENTENCES.
+    """
+    rnd = random.Random(seed)
+    words = (
+        vocabulary(load_pack_json(lang))
+        + vocabulary(load_pack_json("normaliser"))
+        + [str(i) for i in range(60)]
+        + ["7:30", "10:15", ",", "1,5", "and", "a"]
+    )
+    sentences = list(EN_SENTENCES) if lang == "en" else []
+    while len(sentences) < size:
+        sentences.append(" ".join(rnd.choice(words) for _ in range(rnd.randint(1, 6))))
+    return sentences
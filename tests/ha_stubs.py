@@ -0,0 +1,554 @@
+"""Lightweight Home Assistant stand-ins for tests and benchmarks.
+
+Installs just enough of the homeassistant package into sys.modules to import
+the view_assist translator package and timer manager without Home Assistant
+installed, and loads them without running the integration __init__ files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass, is_dataclass
+import datetime as dt
+from enum import StrEnum
+from functools import reduce
+import importlib
+import itertools
+import json
+import os
+from pathlib import Path
+import sys
+import types
+from types import SimpleNamespace
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+VA_PATH = REPO_ROOT / "custom_components" / "view_assist"
+PACKS_PATH = VA_PATH / "translations" / "timers"
+
+# Package name the integration is loaded under
+PACKAGE = "view_assist"
+
+
+def _module(name: str, **attrs: Any) -> types.ModuleType:
+    """Get or create a module in sys.modules and set attributes on it."""
+    module = sys.modules.get(name) or types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(module, key, value)
+    sys.modules[name] = module
+    return module
+
+
+class _Generic:
+    """Subscriptable stand-in for generic HA classes."""
+
+    def __class_getitem__(cls, item):
+        return cls
+
+
+class HomeAssistant:
+    """Stand-in for HomeAssistant type hints."""
+
+
+class Context:
+    """Stand-in for conversation context."""
+
+
+class HomeAssistantError(Exception):
+    """Stand-in for HomeAssistantError."""
+
+
+def callback(func):
+    """Stand-in for the callback decorator."""
+    return func
+
+
+def save_json(filename: str, data: Any, *args, **kwargs) -> None:
+    """Stand-in for homeassistant.helpers.json.save_json."""
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode dataclasses and sets as Home Assistant's json encoder does."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_copy(data: Any) -> Any:
+    """Return data as it would be after saving and loading as json."""
+    return json.loads(json.dumps(data, default=_json_default))
+
+
+# Saved Store data by key, shared by all Store instances like the .storage dir
+STORAGE: dict[str, Any] = {}
+
+
+class Store:
+    """In memory stand-in for homeassistant.helpers.storage.Store."""
+
+    def __init__(self, hass, version: int, key: str, *args, **kwargs) -> None:
+        """Initialise."""
+        self.key = key
+        self.writes = 0
+        self.delay_save_requests = 0
+        self._delay_handle: asyncio.TimerHandle | None = None
+
+    async def async_load(self) -> Any:
+        """Load data."""
+        if self.key not in STORAGE:
+            return None
+        return _json_copy(STORAGE[self.key])
+
+    async def async_save(self, data: Any) -> None:
+        """Save data, cancelling any pending delayed save."""
+        if self._delay_handle:
+            self._delay_handle.cancel()
+            self._delay_handle = None
+        STORAGE[self.key] = _json_copy(data)
+        self.writes += 1
+
+    def async_delay_save(self, data_func, delay: float = 0) -> None:
+        """Save data after delay, replacing any pending delayed save."""
+        self.delay_save_requests += 1
+        if self._delay_handle:
+            self._delay_handle.cancel()
+
+        def write() -> None:
+            # Home Assistant serialises and writes in the executor
+            self._delay_handle = None
+            STORAGE[self.key] = data_func()
+            self.writes += 1
+
+        self._delay_handle = asyncio.get_running_loop().call_later(delay, write)
+
+
+def get_key(dot_notation_path: str, data: dict) -> Any:
+    """Stand-in for view_assist.helpers.get_key."""
+    try:
+        return reduce(dict.get, dot_notation_path.split("."), data)
+    except (TypeError, KeyError):
+        return None
+
+
+class SupportsResponse(StrEnum):
+    """Stand-in for SupportsResponse."""
+
+    NONE = "none"
+    OPTIONAL = "optional"
+    ONLY = "only"
+
+
+class ConfigEntryChange(StrEnum):
+    """Stand-in for ConfigEntryChange."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    UPDATED = "updated"
+
+
+class Platform(StrEnum):
+    """Stand-in for Platform."""
+
+    SENSOR = "sensor"
+    UPDATE = "update"
+
+
+class SensorEntity:
+    """Stand-in for the sensor entity base class."""
+
+    hass: Any = None
+    entity_id: str | None = None
+    entity_description: Any = None
+    _attr_device_info: dict[str, Any] | None = None
+    _attr_unique_id: str | None = None
+
+    @property
+    def device_info(self) -> dict[str, Any] | None:
+        """Return device info."""
+        return self._attr_device_info
+
+    @property
+    def unique_id(self) -> str | None:
+        """Return unique id."""
+        return self._attr_unique_id
+
+
+@dataclass(frozen=True, kw_only=True)
+class SensorEntityDescription:
+    """Stand-in for sensor entity description."""
+
+    key: str
+    name: str | None = None
+    icon: str | None = None
+    native_unit_of_measurement: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+
+
+class EntityPlatform:
+    """Stand-in for the current entity platform, recording entity services."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.services: dict[str, Any] = {}
+
+    def async_register_entity_service(self, name: str, schema, func) -> None:
+        """Register entity service."""
+        self.services[name] = func
+
+
+PLATFORM = EntityPlatform()
+
+
+class IntentTimerManager:
+    """Stand-in for the intent component timer manager."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.timers: dict[str, Any] = {}
+
+
+def ensure_list(value: Any) -> list:
+    """Stand-in for config_validation.ensure_list."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _run_listener(result: Any) -> None:
+    """Run a listener result on the loop if it is a coroutine, as HA does."""
+    if asyncio.iscoroutine(result):
+        asyncio.get_running_loop().create_task(result)
+
+
+def async_dispatcher_connect(hass, signal: str, target) -> Any:
+    """Connect target to a signal on the hass stand-in."""
+    targets = hass.dispatcher_targets.setdefault(signal, [])
+    targets.append(target)
+    return lambda: targets.remove(target)
+
+
+def async_dispatcher_send(hass, signal: str, *args: Any) -> None:
+    """Record dispatcher signals sent on the hass stand-in and call targets."""
+    hass.dispatched.append((signal, *args))
+    for target in list(hass.dispatcher_targets.get(signal, [])):
+        _run_listener(target(*args))
+
+
+def async_track_time_interval(hass, action, interval: dt.timedelta):
+    """Run action every interval on the running loop until cancelled."""
+    loop = asyncio.get_running_loop()
+    handle = None
+
+    def run() -> None:
+        nonlocal handle
+        handle = loop.call_later(interval.total_seconds(), run)
+        loop.create_task(action())
+
+    handle = loop.call_later(interval.total_seconds(), run)
+    return lambda: handle.cancel()
+
+
+def ulid_now(counter=itertools.count()) -> str:
+    """Return sortable unique ids, in creation order like ulids."""
+    return f"{next(counter):026d}"
+
+
+# Conversation device id -> View Assist entity id, for the helpers stand-ins
+DEVICES: dict[str, str] = {}
+
+
+def get_entity_id_from_conversation_device_id(hass, device_id: str) -> str | None:
+    """Stand-in for the helper, resolving from DEVICES."""
+    return DEVICES.get(device_id)
+
+
+def get_mic_device_id_from_entity_id(hass, entity_id: str) -> str | None:
+    """Stand-in for the helper, resolving from DEVICES."""
+    return next((d for d, e in DEVICES.items() if e == entity_id), None)
+
+
+def get_config_entry_by_entity_id(hass, entity_id: str) -> Any:
+    """Stand-in for the helper, with a config entry per entity in DEVICES."""
+    if entity_id in DEVICES.values():
+        return SimpleNamespace(entry_id=f"entry_{entity_id}")
+    return None
+
+
+def install_ha_stubs() -> None:
+    """Install homeassistant stand-in modules, if not already installed."""
+    if "homeassistant" in sys.modules:
+        return
+
+    _module("homeassistant")
+    _module("homeassistant.components")
+    _module(
+        "homeassistant.components.sensor",
+        SensorDeviceClass=SimpleNamespace(DURATION="duration"),
+        SensorEntity=SensorEntity,
+        SensorEntityDescription=SensorEntityDescription,
+        SensorStateClass=SimpleNamespace(MEASUREMENT="measurement"),
+    )
+    _module(
+        "homeassistant.components.conversation",
+        HOME_ASSISTANT_AGENT="conversation.home_assistant",
+        async_converse=None,
+        get_agent_manager=None,
+    )
+    _module(
+        "homeassistant.components.intent",
+        TIMER_DATA="intent_timers",
+        TimerEventType=StrEnum("TimerEventType", ["STARTED", "CANCELLED"]),
+        TimerInfo=_Generic,
+        TimerManager=IntentTimerManager,
+    )
+    _module(
+        "homeassistant.components.intent.timers",
+        _normalize_name=lambda name: name.strip().casefold(),
+    )
+    _module(
+        "homeassistant.config_entries",
+        SIGNAL_CONFIG_ENTRY_CHANGED="config_entry_changed",
+        ConfigEntry=_Generic,
+        ConfigEntryChange=ConfigEntryChange,
+    )
+    _module(
+        "homeassistant.const",
+        ATTR_DEVICE_ID="device_id",
+        ATTR_ENTITY_ID="entity_id",
+        ATTR_NAME="name",
+        ATTR_TIME="time",
+        CONF_MODE="mode",
+        CONF_TYPE="type",
+        EVENT_CORE_CONFIG_UPDATE="core_config_updated",
+        EntityCategory=SimpleNamespace(DIAGNOSTIC="diagnostic"),
+        Platform=Platform,
+        UnitOfTime=SimpleNamespace(MILLISECONDS="ms"),
+    )
+    _module(
+        "homeassistant.core",
+        Context=Context,
+        Event=_Generic,
+        HomeAssistant=HomeAssistant,
+        ServiceCall=_Generic,
+        ServiceResponse=dict,
+        SupportsResponse=SupportsResponse,
+        callback=callback,
+    )
+    _module("homeassistant.exceptions", HomeAssistantError=HomeAssistantError)
+    helpers = _module("homeassistant.helpers")
+    helpers.area_registry = _module("homeassistant.helpers.area_registry")
+    helpers.config_validation = _module(
+        "homeassistant.helpers.config_validation",
+        entity_id=lambda value: str(value).lower(),
+        ensure_list=ensure_list,
+        make_entity_service_schema=lambda schema, **kwargs: schema,
+        match_all=lambda value: value,
+        string=str,
+    )
+    helpers.device_registry = _module(
+        "homeassistant.helpers.device_registry",
+        EVENT_DEVICE_REGISTRY_UPDATED="device_registry_updated",
+        DeviceEntryType=SimpleNamespace(SERVICE="service"),
+        DeviceInfo=dict,
+    )
+    helpers.entity_platform = _module(
+        "homeassistant.helpers.entity_platform",
+        async_get_current_platform=lambda: PLATFORM,
+    )
+    helpers.entity_registry = _module(
+        "homeassistant.helpers.entity_registry",
+        EVENT_ENTITY_REGISTRY_UPDATED="entity_registry_updated",
+    )
+    _module(
+        "homeassistant.helpers.dispatcher",
+        async_dispatcher_connect=async_dispatcher_connect,
+        async_dispatcher_send=async_dispatcher_send,
+    )
+    _module(
+        "homeassistant.helpers.event",
+        async_track_time_interval=async_track_time_interval,
+    )
+    _module("homeassistant.helpers.json", save_json=save_json)
+    _module("homeassistant.helpers.storage", Store=Store)
+    _module("homeassistant.util")
+    _module("homeassistant.util.ulid", ulid_now=ulid_now)
+
+
+def _load(module: str) -> types.ModuleType:
+    """Load a view_assist module without running the integration __init__."""
+    install_ha_stubs()
+    if PACKAGE not in sys.modules:
+        _module(PACKAGE, __path__=[str(VA_PATH)])
+        _module(
+            f"{PACKAGE}.helpers",
+            get_config_entry_by_entity_id=get_config_entry_by_entity_id,
+            get_device_id_from_entity_id=get_mic_device_id_from_entity_id,
+            get_entity_id_from_conversation_device_id=(
+                get_entity_id_from_conversation_device_id
+            ),
+            get_key=get_key,
+            get_mic_device_domain=lambda hass, entity_id: None,
+            get_mic_device_id_from_entity_id=get_mic_device_id_from_entity_id,
+            get_mimic_entity_id=lambda hass: None,
+            get_mute_switch_entity_id=lambda hass, entity_id: None,
+        )
+        _module(f"{PACKAGE}.core", __path__=[str(VA_PATH / "core")])
+    return importlib.import_module(f"{PACKAGE}.{module}")
+
+
+def load_translator() -> types.ModuleType:
+    """Load and return the view_assist core.translator package."""
+    return _load("core.translator")
+
+
+def load_timers() -> types.ModuleType:
+    """Load and return the view_assist core.timers module."""
+    return _load("core.timers")
+
+
+def load_sensor() -> types.ModuleType:
+    """Load and return the view_assist sensor platform."""
+    timers = load_timers()
+    # Stand in for the core and devices packages, which load every module
+    _module(f"{PACKAGE}.core", TimerManager=timers.TimerManager)
+    _module(f"{PACKAGE}.devices", MenuManager=SimpleNamespace(get=lambda *a: None))
+    return _load("sensor")
+
+
+def load_pack_json(name: str) -> dict[str, Any]:
+    """Load a bundled language pack as json."""
+    return json.loads((PACKS_PATH / f"{name}.json").read_text(encoding="utf-8"))
+
+
+class VirtualClock:
+    """Clock that only moves when advanced."""
+
+    def __init__(self, now: float) -> None:
+        """Initialise."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return current time."""
+        return self.now
+
+
+class FakeConfig:
+    """Stand-in for hass.config."""
+
+    def __init__(self, config_dir: str) -> None:
+        """Initialise."""
+        self.config_dir = config_dir
+        self.language = "en"
+        self.time_zone = "UTC"
+
+    def path(self, *parts: str) -> str:
+        """Return path within config dir."""
+        return os.path.join(self.config_dir, *parts)
+
+
+class FakeBus:
+    """Stand-in for hass.bus, recording fired events."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.events: list[tuple[str, dict[str, Any]]] = []
+        self.listeners: dict[str, list] = {}
+
+    def async_fire(self, event_type: str, event_data: dict | None = None) -> None:
+        """Record event and call its listeners."""
+        self.events.append((event_type, event_data))
+        event = SimpleNamespace(event_type=event_type, data=event_data or {})
+        for listener in list(self.listeners.get(event_type, [])):
+            _run_listener(listener(event))
+
+    def async_listen(self, event_type: str, listener) -> Any:
+        """Add listener, returning a function to remove it."""
+        listeners = self.listeners.setdefault(event_type, [])
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+
+class FakeServices:
+    """Stand-in for hass.services."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.services: dict[tuple[str, str], Any] = {}
+
+    def async_register(self, domain: str, service: str, func, *args, **kwargs):
+        """Register service."""
+        self.services[(domain, service)] = func
+
+    def async_remove(self, domain: str, service: str) -> None:
+        """Remove service."""
+        self.services.pop((domain, service), None)
+
+
+class FakeHass:
+    """Stand-in for hass, with the repo root as config dir.
+
+    The integration is found at custom_components/view_assist within the
+    config dir, as in a Home Assistant install.
+    """
+
+    def __init__(self, config_dir: str | Path = REPO_ROOT) -> None:
+        """Initialise."""
+        self.config = FakeConfig(str(config_dir))
+        self.data: dict[str, Any] = {"intent_timers": IntentTimerManager()}
+        self.bus = FakeBus()
+        self.services = FakeServices()
+        self.dispatched: list[tuple] = []
+        self.dispatcher_targets: dict[str, list] = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return running event loop."""
+        return asyncio.get_running_loop()
+
+    def async_add_executor_job(self, func, *args) -> asyncio.Future:
+        """Run job in the default executor, returning a future as HA does."""
+        return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def async_create_task(self, coro, *args, **kwargs) -> asyncio.Task:
+        """Create task on running loop."""
+        return asyncio.get_running_loop().create_task(coro)
+
+
+class FakeConfigEntry:
+    """Stand-in for a config entry, running background tasks on the loop."""
+
+    def __init__(self, translation_engine: str | None = None) -> None:
+        """Initialise."""
+        self.entry_id = "master"
+        self.title = "Master Configuration"
+        self.data: dict[str, Any] = {"type": "master_config"}
+        self.runtime_data = SimpleNamespace(
+            integration=SimpleNamespace(
+                translation_engine=translation_engine,
+                expired_timer_retention=60,
+                expired_timer_max=10,
+            )
+        )
+        self.tasks: set[asyncio.Task] = set()
+        self.unload_callbacks: list = []
+
+    def async_create_background_task(self, hass, target, name: str, *args):
+        """Create a task, which must be given a coroutine."""
+        task = asyncio.get_running_loop().create_task(target, name=name)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def async_on_unload(self, func) -> None:
+        """Add function to call on unload."""
+        self.unload_callbacks.append(func)
+
+    def unload(self) -> None:
+        """Call unload functions, as Home Assistant does on entry unload."""
+        while self.unload_callbacks:
+            self.unload_callbacks.pop()()
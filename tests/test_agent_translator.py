@@ -0,0 +1,174 @@
+"""Tests for ConversationAgentTranslator response translation."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from types import SimpleNamespace
+import unittest
+
+from .ha_stubs import STORAGE, FakeHass, load_translator
+
+translator_module = load_translator().translator
+
+AGENT_ENTITY = "conversation.translator"
+
+# Text the agent is asked to translate, within the prompt
+PROMPT_TEXT = re.compile(r"The text is '(.*)'\.?$", re.DOTALL)
+
+
+class StandInAgent:
+    """Conversation agent that counts calls and tags text with the locale."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.calls: list[tuple[str, str]] = []
+        self.drop_markers = False
+        # Calls for these languages wait until the event is set
+        self.blocked: dict[str, asyncio.Event] = {}
+
+    def is_valid_agent_id(self, agent_id: str | None) -> bool:
+        """Return if agent id is this agent."""
+        return agent_id == "translator_entry"
+
+    async def converse(self, hass, text: str, *args, language: str, **kwargs):
+        """Handle a conversation call."""
+        self.calls.append((language, text))
+        if language in self.blocked:
+            await self.blocked[language].wait()
+        output = f"[{language}] {PROMPT_TEXT.search(text).group(1)}"
+        if self.drop_markers:
+            output = re.sub(r"\[\[\d+\]\]", "?", output)
+        return SimpleNamespace(
+            as_dict=lambda: {"response": {"speech": {"plain": {"speech": output}}}}
+        )
+
+
+class AgentTranslatorTest(unittest.IsolatedAsyncioTestCase):
+    """Test response templates are translated once per locale."""
+
+    def setUp(self) -> None:
+        """Set up stand-in agent and empty storage."""
+        STORAGE.clear()
+        self.agent = StandInAgent()
+        self.hass = FakeHass()
+        self.config = SimpleNamespace(
+            runtime_data=SimpleNamespace(
+                integration=SimpleNamespace(translation_engine=AGENT_ENTITY)
+            )
+        )
+        patches = {
+            "async_converse": self.agent.converse,
+            "get_agent_manager": lambda hass: SimpleNamespace(
+                async_is_valid_agent_id=self.agent.is_valid_agent_id
+            ),
+            "get_config_entry_by_entity_id": lambda hass, entity_id: (
+                SimpleNamespace(entry_id="translator_entry")
+                if entity_id == AGENT_ENTITY
+                else None
+            ),
+        }
+        for name, value in patches.items():
+            original = getattr(translator_module, name)
+            setattr(translator_module, name, value)
+            self.addCleanup(setattr, translator_module, name, original)
+
+    def make_translator(self):
+        """Make a translator."""
+        return translator_module.ConversationAgentTranslator(self.hass, self.config)
+
+    async def test_template_cached_per_locale(self) -> None:
+        """Test each template is sent to the agent once per locale."""
+        translator = self.make_translator()
+
+        for name in ("kitchen", "oven", "bath"):
+            self.assertEqual(
+                await translator.translate_response(
+                    "timer_named_set", {"name": name, "time_en": "5 minutes"}, "fr"
+                ),
+                f"[fr] {name} timer set for 5 minutes",
+            )
+        self.assertEqual(len(self.agent.calls), 1)
+
+        await translator.translate_response("timer_none", {}, "fr")
+        self.assertEqual(len(self.agent.calls), 2)
+
+        # New locale needs its own translation
+        self.assertEqual(
+            await translator.translate_response(
+                "timer_named_set",
+                {"name": "oven", "time_en": "5 minutes", "time_de": "5 Minuten"},
+                "de",
+            ),
+            "[de] oven timer set for 5 Minuten",
+        )
+        self.assertEqual(len(self.agent.calls), 3)
+        self.assertEqual([call[0] for call in self.agent.calls], ["fr", "fr", "de"])
+
+    async def test_templates_reused_from_store(self) -> None:
+        """Test a new translator uses templates saved by a previous one."""
+        params = {"name": "oven", "time_en": "5 minutes"}
+        await self.make_translator().translate_response("timer_named_set", params, "fr")
+        self.assertEqual(len(self.agent.calls), 1)
+
+        translator = self.make_translator()
+        self.assertEqual(
+            await translator.translate_response("timer_named_set", params, "fr"),
+            "[fr] oven timer set for 5 minutes",
+        )
+        self.assertEqual(len(self.agent.calls), 1)
+        self.assertIn(
+            "{name} timer set for {time}",
+            STORAGE[translator_module.RESPONSES_STORE_NAME]["fr"],
+        )
+
+    async def test_marker_loss_falls_back_to_sentence(self) -> None:
+        """Test whole sentence is translated if the agent drops markers."""
+        self.agent.drop_markers = True
+        translator = self.make_translator()
+        params = {"name": "oven", "time_en": "5 minutes"}
+
+        for _ in range(2):
+            self.assertTrue(
+                (
+                    await translator.translate_response("timer_named_set", params, "fr")
+                ).endswith("oven timer set for 5 minutes")
+            )
+
+        # Template once, as the failure is cached, and fallback sentence each time
+        self.assertEqual(len(self.agent.calls), 3)
+        self.assertIn("[[0]]", self.agent.calls[0][1])
+        self.assertIn("oven timer set for 5 minutes", self.agent.calls[1][1])
+        self.assertIn("oven timer set for 5 minutes", self.agent.calls[2][1])
+        self.assertNotIn(translator_module.RESPONSES_STORE_NAME, STORAGE)
+
+    async def test_slow_template_does_not_block_others(self) -> None:
+        """Test a template waiting on the agent does not hold up other locales."""
+        self.agent.blocked["de"] = asyncio.Event()
+        translator = self.make_translator()
+
+        de_response = asyncio.create_task(
+            translator.translate_response("timer_none", {}, "de")
+        )
+        await asyncio.sleep(0)
+        self.assertEqual(
+            await asyncio.wait_for(
+                translator.translate_response("timer_none", {}, "fr"), 1
+            ),
+            "[fr] No timers are set",
+        )
+        self.assertFalse(de_response.done())
+
+        # A second request for the blocked template waits for the first
+        de_again = asyncio.create_task(
+            translator.translate_response("timer_none", {}, "de")
+        )
+        await asyncio.sleep(0)
+        self.agent.blocked["de"].set()
+        self.assertEqual(await de_response, "[de] No timers are set")
+        self.assertEqual(await de_again, "[de] No timers are set")
+        self.assertEqual([call[0] for call in self.agent.calls], ["de", "fr"])
+
+
+if __name__ == "__main__":
+    unittest.main()
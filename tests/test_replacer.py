@@ -0,0 +1,67 @@
+"""Tests for the collection word replacer."""
+
+from __future__ import annotations
+
+import json
+import unittest
+
+from .ha_stubs import FakeHass, load_translator
+
+translator_module = load_translator()
+WordReplacer = translator_module.replacer.WordReplacer
+
+
+class WordReplacerTest(unittest.TestCase):
+    """Test phrase matching and replacement."""
+
+    def test_whole_words_only(self) -> None:
+        """Test phrases only match on word boundaries."""
+        replacer = WordReplacer([("one", "1")])
+        self.assertEqual(replacer.replace("one stone"), " 1 stone")
+        self.assertEqual(replacer.replace("someone"), "someone")
+
+    def test_priority_at_same_position(self) -> None:
+        """Test the first listed phrase wins where several match."""
+        replacer = WordReplacer([("half past", "30 past"), ("half", "0.5")])
+        self.assertEqual(replacer.replace("half past two"), " 30 past two")
+        self.assertEqual(
+            WordReplacer([("half", "0.5"), ("half past", "30 past")]).replace(
+                "half past two"
+            ),
+            " 0.5 past two",
+        )
+
+    def test_trailing_comma_consumed(self) -> None:
+        """Test a phrase before a comma matches and the comma is replaced."""
+        replacer = WordReplacer([("ten", "10")])
+        self.assertEqual(replacer.replace("ten, minutes"), " 10  minutes")
+
+    def test_replacement_not_matched_again(self) -> None:
+        """Test replacements are not themselves replaced."""
+        replacer = WordReplacer([("one", "two"), ("two", "three")])
+        self.assertEqual(replacer.replace("one two"), " two  three ")
+
+    def test_saved_replacer(self) -> None:
+        """Test a replacer restored from json replaces the same."""
+        replacer = WordReplacer([("de la", "in the"), ("la", "the"), ("la", "x")])
+        restored = WordReplacer.from_dict(json.loads(json.dumps(replacer.as_dict())))
+        self.assertEqual(restored.replacements, replacer.replacements)
+        self.assertEqual(restored.replace("la de la"), replacer.replace("la de la"))
+
+
+class TranslateCollectionsTest(unittest.IsolatedAsyncioTestCase):
+    """Test language pack collection replacement in translate."""
+
+    async def test_phrase_not_split_by_earlier_word(self) -> None:
+        """Test a phrase is replaced whole after a shorter word it contains.
+
+        The baseline per word regex replaced "la" over the whole sentence
+        first, giving "the de the eighty morning minus minus".
+        """
+        translator = translator_module.TimeSentenceTranslator(FakeHass(), None)
+        self.assertEqual(
+            await translator.translate(
+                "la de la ochenta de la mañana menos minus", "es"
+            ),
+            "the in the eighty morning minus minus",
+        )
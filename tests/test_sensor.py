@@ -0,0 +1,51 @@
+"""Tests for the sensor platform."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+import unittest
+
+from .ha_stubs import PLATFORM, FakeConfigEntry, FakeHass, load_sensor
+
+sensor = load_sensor()
+
+
+class SensorSetupTest(unittest.IsolatedAsyncioTestCase):
+    """Test sensor platform setup for master and device entries."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up hass."""
+        self.hass = FakeHass()
+        self.entities = []
+
+    def add_entities(self, entities) -> None:
+        """Record added entities."""
+        self.entities.extend(entities)
+
+    async def test_master_entry(self) -> None:
+        """Test timer diagnostic sensors are added to the master device."""
+        config = FakeConfigEntry()
+        await sensor.async_setup_entry(self.hass, config, self.add_entities)
+
+        self.assertEqual(
+            [e.unique_id for e in self.entities],
+            [f"view_assist_{d.key}" for d in sensor.TIMER_DIAGNOSTIC_SENSORS],
+        )
+        for entity in self.entities:
+            self.assertIsInstance(entity, sensor.TimerDiagnosticSensor)
+            self.assertEqual(
+                entity.device_info["identifiers"], {("view_assist", "master")}
+            )
+
+    async def test_device_entry(self) -> None:
+        """Test a device entry gets its View Assist sensor and services."""
+        config = FakeConfigEntry()
+        config.entry_id = "kitchen"
+        config.data = {"type": "view_audio"}
+        config.runtime_data.core = SimpleNamespace(name="Kitchen", type="view_audio")
+        await sensor.async_setup_entry(self.hass, config, self.add_entities)
+
+        self.assertEqual(len(self.entities), 1)
+        self.assertIsInstance(self.entities[0], sensor.ViewAssistSensor)
+        self.assertEqual(self.entities[0].unique_id, "Kitchen_vasensor")
+        self.assertIn("set_state", PLATFORM.services)
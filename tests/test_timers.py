@@ -0,0 +1,729 @@
+"""Tests for the timer manager."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+from types import SimpleNamespace
+from typing import Any
+import unittest
+from unittest import mock
+
+from .ha_stubs import (
+    DEVICES,
+    STORAGE,
+    FakeConfigEntry,
+    FakeHass,
+    VirtualClock,
+    async_dispatcher_send,
+    load_timers,
+    load_translator,
+)
+
+timers = load_timers()
+TimerInfo = timers.TimerInfo
+
+
+class TimerManagerTest(unittest.IsolatedAsyncioTestCase):
+    """Test timer manager timer lookups."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up timer manager with timers on two devices."""
+        STORAGE.clear()
+        DEVICES.clear()
+        DEVICES.update({"kitchen_mic": "sensor.kitchen", "lounge_mic": "sensor.lounge"})
+        self.addCleanup(DEVICES.clear)
+
+        self.config = FakeConfigEntry()
+        self.tm = timers.TimerManager(FakeHass(), self.config)
+        await self.tm.async_setup()
+        for device_id, minutes in [("kitchen_mic", 5), ("lounge_mic", 10)]:
+            await self.tm.add_timer(
+                timers.TimerClass.TIMER, device_id, None, TimerInfo(minutes=minutes)
+            )
+
+    async def asyncTearDown(self) -> None:
+        """Unload timer manager."""
+        await self.tm.async_unload()
+
+    async def test_get_timers_by_device(self) -> None:
+        """Test timers are filtered by device."""
+        kitchen = self.tm.get_timers(device_id="kitchen_mic")
+        self.assertEqual([t["entity_id"] for t in kitchen], ["sensor.kitchen"])
+        self.assertEqual(len(self.tm.get_timers()), 2)
+
+    async def test_get_timers_unknown_device(self) -> None:
+        """Test a device with no VA entity has no timers, not all timers."""
+        self.assertEqual(self.tm.get_timers(device_id="unknown_mic"), [])
+
+    async def test_get_timer_by_id_and_entity(self) -> None:
+        """Test a timer id with an entity only returns the entity's timer."""
+        kitchen_id = self.tm.get_timers(entity_id="sensor.kitchen")[0]["id"]
+        self.assertEqual(
+            [
+                t["id"]
+                for t in self.tm.get_timers(
+                    timer_id=kitchen_id, entity_id="sensor.kitchen"
+                )
+            ],
+            [kitchen_id],
+        )
+        self.assertEqual(
+            self.tm.get_timers(timer_id=kitchen_id, entity_id="sensor.lounge"), []
+        )
+
+    async def test_get_timers_by_name_ignores_case(self) -> None:
+        """Test timer names match ignoring case, as HA intent timers do."""
+        await self.tm.add_timer(
+            timers.TimerClass.TIMER,
+            "kitchen_mic",
+            None,
+            TimerInfo(minutes=20),
+            name="Pizza",
+        )
+        for name in ["pizza", "PIZZA", " Pizza "]:
+            named = self.tm.get_timers(device_id="kitchen_mic", name=name)
+            self.assertEqual([t["name"] for t in named], ["Pizza"])
+        self.assertEqual(self.tm.get_timers(device_id="kitchen_mic", name="pasta"), [])
+
+    async def test_cancel_timer_cancels_every_match(self) -> None:
+        """Test cancelling by device or all cancels every matching timer."""
+        await self.tm.add_timer(
+            timers.TimerClass.TIMER, "kitchen_mic", None, TimerInfo(minutes=15)
+        )
+        self.assertEqual(len(self.tm.get_timers(device_id="kitchen_mic")), 2)
+
+        self.assertTrue(await self.tm.cancel_timer(device_id="kitchen_mic"))
+        self.assertEqual(self.tm.get_timers(device_id="kitchen_mic"), [])
+        self.assertEqual(len(self.tm.get_timers(device_id="lounge_mic")), 1)
+
+        await self.tm.add_timer(
+            timers.TimerClass.TIMER, "kitchen_mic", None, TimerInfo(minutes=15)
+        )
+        self.assertTrue(await self.tm.cancel_timer(cancel_all=True))
+        self.assertEqual(self.tm.get_timers(), [])
+        self.assertFalse(await self.tm.cancel_timer(cancel_all=True))
+
+    async def test_trace_times_expiry_of_added_timer(self) -> None:
+        """Test a decode trace records the expiry calculation of the timer."""
+        tracer = load_translator().tracing.DecodeTracer()
+        self.tm.hass.data.setdefault(timers.DOMAIN, {})["Translator"] = SimpleNamespace(
+            tracer=tracer
+        )
+        trace = timers.DecodeTrace("in 5 minutes", "en", "interval")
+        trace.path = "fast_path"
+
+        await self.tm.add_timer(
+            timers.TimerClass.TIMER,
+            "kitchen_mic",
+            None,
+            TimerInfo(minutes=5),
+            name="traced",
+            trace=trace,
+        )
+        self.assertIn("expiry", trace.stages)
+        self.assertEqual(
+            list(tracer.samples["fast_path"]["expiry"]), [trace.stages["expiry"]]
+        )
+
+
+class TimerStoreSaveTest(unittest.IsolatedAsyncioTestCase):
+    """Test timer store writes are delayed and coalesced."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up timer manager with a short save delay."""
+        STORAGE.clear()
+        DEVICES.clear()
+        DEVICES.update({"kitchen_mic": "sensor.kitchen"})
+        self.addCleanup(DEVICES.clear)
+        patcher = mock.patch.object(timers, "TIMERS_SAVE_DELAY", 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tm = timers.TimerManager(FakeHass(), FakeConfigEntry())
+        await self.tm.async_setup()
+        self.store = self.tm.store.store
+
+    async def asyncTearDown(self) -> None:
+        """Unload timer manager."""
+        await self.tm.async_unload()
+
+    async def add_timer(self, minutes: int) -> str:
+        """Add a timer to the kitchen and return its id."""
+        _, timer = await self.tm.add_timer(
+            timers.TimerClass.TIMER, "kitchen_mic", None, TimerInfo(minutes=minutes)
+        )
+        return timer["id"]
+
+    async def test_updates_within_delay_are_written_once(self) -> None:
+        """Test several updates within the save delay give one write."""
+        writes = self.store.writes
+        timer_ids = [await self.add_timer(minutes) for minutes in (5, 10, 15)]
+        await self.tm.cancel_timer(timer_id=timer_ids[0])
+        self.assertEqual(self.store.writes, writes)
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.store.writes, writes + 1)
+        self.assertEqual(sorted(STORAGE[timers.TIMERS_STORE_NAME]), timer_ids[1:])
+        self.assertGreaterEqual(self.tm.store.stats["writes_avoided"], 3)
+
+    async def test_unload_writes_pending_update(self) -> None:
+        """Test unloading writes a pending update once."""
+        writes = self.store.writes
+        timer_id = await self.add_timer(5)
+
+        await self.tm.async_unload()
+        self.assertEqual(self.store.writes, writes + 1)
+        self.assertEqual(list(STORAGE[timers.TIMERS_STORE_NAME]), [timer_id])
+
+        # Pending delayed save was replaced by the flush
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.store.writes, writes + 1)
+
+    async def test_flush_without_changes_does_not_write(self) -> None:
+        """Test flush only writes when there are unsaved changes."""
+        await self.add_timer(5)
+        await asyncio.sleep(0.05)
+        writes = self.store.writes
+
+        await self.tm.store.flush()
+        self.assertEqual(self.store.writes, writes)
+
+    async def test_migrate_saves_migrated_timers(self) -> None:
+        """Test migrating timers from device id to entity id saves them."""
+        stored = {"timer1": {"id": "timer1", "device_id": "kitchen_mic"}}
+        writes = self.store.writes
+
+        migrated = await self.tm.store.migrate(stored)
+        self.assertEqual(
+            migrated["timer1"], {"id": "timer1", "entity_id": "sensor.kitchen"}
+        )
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.store.writes, writes + 1)
+
+
+# Friday 16 October 2026 09:00 UTC
+FRIDAY_9AM = dt.datetime(2026, 10, 16, 9, tzinfo=dt.UTC).timestamp()
+
+
+class VirtualClockTimerTest(unittest.IsolatedAsyncioTestCase):
+    """Base for timer manager tests on a virtual clock."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up timer manager on a virtual clock at Friday 09:00 UTC."""
+        STORAGE.clear()
+        DEVICES.clear()
+        DEVICES.update({"kitchen_mic": "sensor.kitchen"})
+        self.addCleanup(DEVICES.clear)
+
+        self.clock = VirtualClock(FRIDAY_9AM)
+        self.hass = FakeHass()
+        self.config = FakeConfigEntry()
+        self.tm = timers.TimerManager(self.hass, self.config, clock=self.clock)
+        await self.tm.async_setup()
+
+    async def asyncTearDown(self) -> None:
+        """Unload timer manager."""
+        await self.tm.async_unload()
+        self.config.unload()
+
+    async def advance_to(self, timestamp: float) -> None:
+        """Move the clock and run the deadlines that are now due.
+
+        The loop does not follow the virtual clock, so the scheduler is run
+        directly as its loop handle would be.
+        """
+        self.clock.now = timestamp
+        self.tm.scheduler._run_due()  # noqa: SLF001
+        while self.config.tasks:
+            await asyncio.gather(*self.config.tasks)
+
+    async def add_alarm(self, timer_info: TimerInfo, **kwargs: Any) -> str:
+        """Add an alarm to the kitchen device and return its id."""
+        _, output = await self.tm.add_timer(
+            timers.TimerClass.ALARM, "kitchen_mic", None, timer_info, **kwargs
+        )
+        return output["id"]
+
+    def timer(self, timer_id: str) -> Any:
+        """Return timer from the store."""
+        return self.tm.store.timers[timer_id]
+
+    def events(self, event: Any) -> list[str]:
+        """Return ids of timers that fired event."""
+        name = timers.VA_EVENT_PREFIX.format(event)
+        return [
+            data["timer_id"]
+            for event_type, data in self.hass.bus.events
+            if event_type == name
+        ]
+
+
+def at(day: int, hour: int, minute: int = 0) -> float:
+    """Return timestamp of a day in October 2026 at a time in UTC."""
+    return dt.datetime(2026, 10, day, hour, minute, tzinfo=dt.UTC).timestamp()
+
+
+class RecurringTimerTest(VirtualClockTimerTest):
+    """Test recurring timers across expiry and their next occurrence."""
+
+    async def test_weekdays_stays_expired_until_dismissed(self) -> None:
+        """Test a weekdays alarm rings until dismissed, then sets next day."""
+        timer_id = await self.add_alarm(
+            TimerInfo(hours=7, is_time=True, timeofday="am"),
+            recurrence={"rule": timers.TimerRecurrence.WEEKDAYS},
+        )
+        # Set on a Friday after 07:00, so first occurs on Monday
+        self.assertEqual(self.timer(timer_id).expires_at, at(19, 7))
+
+        await self.advance_to(at(19, 7))
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.EXPIRED)
+        self.assertEqual(self.events(timers.TimerEvent.EXPIRED), [timer_id])
+
+        # Still ringing later, with no new occurrence started
+        await self.advance_to(at(19, 7, 10))
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.EXPIRED)
+        self.assertEqual(self.events(timers.TimerEvent.STARTED), [timer_id])
+
+        self.assertTrue(await self.tm.cancel_timer(timer_id, just_expired=True))
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.RUNNING)
+        self.assertEqual(self.timer(timer_id).expires_at, at(20, 7))
+        self.assertEqual(self.events(timers.TimerEvent.STARTED), [timer_id] * 2)
+
+    async def test_weekdays_skips_weekend(self) -> None:
+        """Test a weekdays alarm dismissed on Friday next occurs on Monday."""
+        timer_id = await self.add_alarm(
+            TimerInfo(hours=10, is_time=True, timeofday="am"),
+            recurrence={"rule": timers.TimerRecurrence.WEEKDAYS},
+        )
+        self.assertEqual(self.timer(timer_id).expires_at, at(16, 10))
+
+        await self.advance_to(at(16, 10))
+        await self.tm.cancel_timers([timer_id])
+        self.assertEqual(self.timer(timer_id).expires_at, at(19, 10))
+
+    async def test_daily_snooze_then_next_occurrence(self) -> None:
+        """Test a daily alarm can be snoozed when expired, not when running."""
+        timer_id = await self.add_alarm(
+            TimerInfo(hours=10, is_time=True, timeofday="am"),
+            recurrence={"rule": timers.TimerRecurrence.DAILY},
+        )
+        snooze = TimerInfo(minutes=5, sentence="5 minutes")
+        response, _ = await self.tm.snooze_timer(timer_id, snooze)
+        self.assertEqual(response, "timer_error")
+
+        await self.advance_to(at(16, 10))
+        response, _ = await self.tm.snooze_timer(timer_id, snooze)
+        self.assertEqual(response, "timer_snoozed")
+        self.assertEqual(self.timer(timer_id).expires_at, at(16, 10, 5))
+
+        await self.advance_to(at(16, 10, 5))
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.EXPIRED)
+
+        await self.tm.cancel_timer(timer_id, just_expired=True)
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.RUNNING)
+        self.assertEqual(self.timer(timer_id).expires_at, at(17, 10))
+
+    async def test_running_recurring_timer_is_removed_on_cancel(self) -> None:
+        """Test cancelling a recurring timer that is not ringing removes it."""
+        timer_id = await self.add_alarm(
+            TimerInfo(hours=10, is_time=True, timeofday="am"),
+            recurrence={"rule": timers.TimerRecurrence.DAILY},
+        )
+        self.assertTrue(await self.tm.cancel_timer(timer_id))
+        self.assertNotIn(timer_id, self.tm.store.timers)
+
+    async def test_day_of_week_today(self) -> None:
+        """Test a time today on today's day of week is today unless passed."""
+        later = self.tm.get_expiry_from_timerinfo(
+            TimerInfo(hours=9, dayofweek="friday", timeofday="pm", is_time=True)
+        )
+        self.assertEqual(later.timestamp(), at(16, 21))
+
+        passed = self.tm.get_expiry_from_timerinfo(
+            TimerInfo(hours=7, dayofweek="friday", timeofday="am", is_time=True)
+        )
+        self.assertEqual(passed.timestamp(), at(23, 7))
+
+    async def test_sweep_starts_next_occurrence(self) -> None:
+        """Test an undismissed recurring alarm is re-armed, not swept away."""
+        timer_id = await self.add_alarm(
+            TimerInfo(hours=10, is_time=True, timeofday="am"),
+            recurrence={"rule": timers.TimerRecurrence.DAILY},
+        )
+        await self.advance_to(at(16, 10))
+        self.clock.now = at(16, 11, 30)
+        removed = await self.tm._async_sweep_expired_timers()  # noqa: SLF001
+        self.assertEqual(removed, [])
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.RUNNING)
+        self.assertEqual(self.timer(timer_id).expires_at, at(17, 10))
+
+
+class TimerSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    """Test the heap deadline scheduler."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up scheduler on a virtual clock, recording fired deadlines."""
+        self.clock = VirtualClock(FRIDAY_9AM)
+        self.config = FakeConfigEntry()
+        self.fired: list[tuple[str, Any]] = []
+        self.scheduler = timers.TimerScheduler(
+            FakeHass(), self.config, self.record, clock=self.clock
+        )
+        self.addCleanup(self.scheduler.cancel_all)
+
+    async def record(self, timer_id: str, event: Any, deadline: float) -> None:
+        """Record a fired deadline."""
+        self.fired.append((timer_id, event))
+
+    async def run_due(self, timestamp: float) -> None:
+        """Move the clock and run the deadlines that are now due."""
+        self.clock.now = timestamp
+        self.scheduler._run_due()  # noqa: SLF001
+        while self.config.tasks:
+            await asyncio.gather(*self.config.tasks)
+
+    def next_deadline(self) -> float | None:
+        """Return the deadline the loop handle is armed for."""
+        return self.scheduler.stats["next_deadline"]
+
+    async def test_rearms_for_earliest_deadline(self) -> None:
+        """Test the handle follows the earliest deadline as they change."""
+        expired = timers.TimerEvent.EXPIRED
+        self.scheduler.schedule("a", FRIDAY_9AM + 60, expired)
+        self.scheduler.schedule("b", FRIDAY_9AM + 30, expired)
+        self.assertEqual(self.next_deadline(), FRIDAY_9AM + 30)
+
+        # Rescheduling replaces the timer's deadline
+        self.scheduler.schedule("b", FRIDAY_9AM + 90, expired)
+        self.assertEqual(self.next_deadline(), FRIDAY_9AM + 60)
+        self.assertEqual(len(self.scheduler), 2)
+
+        # Cancelled deadlines are skipped when the handle runs, which then
+        # re-arms for the next live deadline
+        self.assertTrue(self.scheduler.cancel("a"))
+        self.assertFalse(self.scheduler.cancel("a"))
+        await self.run_due(FRIDAY_9AM + 60)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(self.next_deadline(), FRIDAY_9AM + 90)
+
+        self.scheduler.cancel("b")
+        self.assertIsNone(self.next_deadline())
+        self.assertEqual(self.scheduler.stats["heap_size"], 0)
+
+    async def test_runs_due_deadlines_in_order_once(self) -> None:
+        """Test due deadlines fire in order and superseded ones do not fire."""
+        warning = timers.TimerEvent.WARNING
+        expired = timers.TimerEvent.EXPIRED
+        self.scheduler.schedule_many(
+            [
+                ("a", FRIDAY_9AM + 30, warning),
+                ("b", FRIDAY_9AM + 10, expired),
+                ("c", FRIDAY_9AM + 50, expired),
+            ]
+        )
+        self.scheduler.schedule("a", FRIDAY_9AM + 40, expired)
+
+        await self.run_due(FRIDAY_9AM + 45)
+        self.assertEqual(self.fired, [("b", expired), ("a", expired)])
+        self.assertEqual(self.next_deadline(), FRIDAY_9AM + 50)
+
+        await self.run_due(FRIDAY_9AM + 45)
+        self.assertEqual(len(self.fired), 2)
+        await self.run_due(FRIDAY_9AM + 50)
+        self.assertEqual(self.fired[-1], ("c", expired))
+        self.assertIsNone(self.next_deadline())
+
+    async def test_compacts_superseded_entries(self) -> None:
+        """Test rescheduling does not grow the heap without bound."""
+        for offset in range(200):
+            self.scheduler.schedule(
+                "a", FRIDAY_9AM + 100 - offset, timers.TimerEvent.EXPIRED
+            )
+        self.assertLessEqual(self.scheduler.stats["heap_size"], 2 * 1 + 33)
+        self.assertEqual(self.scheduler.stats["queue_depth"], 1)
+        self.assertEqual(self.next_deadline(), FRIDAY_9AM - 99)
+
+        await self.run_due(FRIDAY_9AM)
+        self.assertEqual(self.fired, [("a", timers.TimerEvent.EXPIRED)])
+
+
+class TimerSchedulerRestoreTest(VirtualClockTimerTest):
+    """Test timers restored from the store are scheduled on setup."""
+
+    async def test_setup_rearms_stored_timers(self) -> None:
+        """Test a restarted timer manager schedules and fires stored timers."""
+        timer_id = await self.add_alarm(TimerInfo(minutes=5))
+        expires_at = self.timer(timer_id).expires_at
+        await self.tm.async_unload()
+        self.config.unload()
+
+        self.config = FakeConfigEntry()
+        self.tm = timers.TimerManager(self.hass, self.config, clock=self.clock)
+        await self.tm.async_setup()
+        self.assertEqual(len(self.tm.scheduler), 1)
+        # Next deadline is the pre expire warning
+        self.assertEqual(
+            self.tm.scheduler.stats["next_deadline"],
+            expires_at - self.timer(timer_id).pre_expire_warning,
+        )
+
+        await self.advance_to(expires_at)
+        self.assertEqual(self.timer(timer_id).status, timers.TimerStatus.EXPIRED)
+        self.assertEqual(self.events(timers.TimerEvent.EXPIRED), [timer_id])
+
+
+class TimerOutputCacheTest(VirtualClockTimerTest):
+    """Test formatted timer output is cached until the timer changes."""
+
+    def cached(self, timer_id: str) -> Any:
+        """Return the cached static output of a timer."""
+        return self.tm._output_cache.get(timer_id)  # noqa: SLF001
+
+    async def test_remaining_time_follows_clock(self) -> None:
+        """Test time remaining fields are recalculated from the cached output."""
+        timer_id = await self.add_alarm(TimerInfo(minutes=5))
+        first = self.tm.format_timer_output(self.timer(timer_id))
+        cached = self.cached(timer_id)
+
+        self.clock.now += 61
+        output = self.tm.format_timer_output(self.timer(timer_id))
+        self.assertIs(self.cached(timer_id), cached)
+        self.assertEqual(output["expiry"]["seconds"], first["expiry"]["seconds"] - 61)
+        self.assertEqual(
+            output["expiry"]["interval"],
+            {"days": 0, "hours": 0, "minutes": 3, "seconds": 59},
+        )
+        self.assertEqual(output["expires"], first["expires"])
+
+    async def test_snooze_invalidates_output(self) -> None:
+        """Test a changed expiry is formatted again."""
+        timer_id = await self.add_alarm(TimerInfo(minutes=5))
+        await self.advance_to(self.timer(timer_id).expires_at)
+        expired = self.tm.format_timer_output(self.timer(timer_id))
+        self.assertEqual(expired["status"], timers.TimerStatus.EXPIRED)
+
+        await self.tm.snooze_timer(timer_id, TimerInfo(minutes=10))
+        output = self.tm.format_timer_output(self.timer(timer_id))
+        self.assertEqual(
+            output["expires"], expired["expires"] + dt.timedelta(minutes=10)
+        )
+        self.assertEqual(output["expiry"]["seconds"], 600)
+
+    async def test_cancel_and_time_zone_change_clear_output(self) -> None:
+        """Test cancelled timers are dropped and a new time zone reformats."""
+        cancelled = await self.add_alarm(TimerInfo(minutes=5))
+        timer_id = await self.add_alarm(TimerInfo(minutes=10))
+        self.tm.format_timer_output(self.timer(cancelled))
+        await self.tm.cancel_timer(timer_id=cancelled)
+        self.assertIsNone(self.cached(cancelled))
+
+        self.hass.config.time_zone = "Europe/Paris"
+        await self.tm._async_time_zone_changed()  # noqa: SLF001
+        self.assertIsNone(self.cached(timer_id))
+        output = self.tm.format_timer_output(self.timer(timer_id))
+        self.assertEqual(output["expires"].utcoffset(), dt.timedelta(hours=2))
+
+
+class ExpiredTimerSweepTest(VirtualClockTimerTest):
+    """Test expired timers are removed by age and count."""
+
+    async def expire_alarms(self, *minutes: int) -> list[str]:
+        """Add alarms for minutes from now and run the clock until they expire."""
+        timer_ids = [await self.add_alarm(TimerInfo(minutes=m)) for m in minutes]
+        await self.advance_to(self.timer(timer_ids[-1]).expires_at)
+        return timer_ids
+
+    async def sweep(self, timestamp: float) -> list[str]:
+        """Sweep at a time and return the ids of removed timers."""
+        self.clock.now = timestamp
+        removed = await self.tm._async_sweep_expired_timers()  # noqa: SLF001
+        return [timer.id for timer in removed]
+
+    async def test_removes_timers_expired_longer_than_retention(self) -> None:
+        """Test only timers that expired over the retention age are removed."""
+        old, recent = await self.expire_alarms(5, 30)
+        save_requests = self.tm.store.save_requests
+
+        # Retention is 60 minutes
+        removed = await self.sweep(FRIDAY_9AM + 66 * 60)
+        self.assertEqual(removed, [old])
+        self.assertEqual(list(self.tm.store.timers), [recent])
+        self.assertEqual(self.tm.store.save_requests, save_requests + 1)
+
+    async def test_age_is_from_expiry_not_last_update(self) -> None:
+        """Test updating an expired timer does not extend its retention."""
+        (timer_id,) = await self.expire_alarms(5)
+        self.clock.now = FRIDAY_9AM + 50 * 60
+        await self.tm.store.updated(timer_id)
+
+        self.assertEqual(await self.sweep(FRIDAY_9AM + 66 * 60), [timer_id])
+
+    async def test_keeps_most_recently_expired_per_entity(self) -> None:
+        """Test only the max count of expired timers is kept per entity."""
+        self.config.runtime_data.integration.expired_timer_max = 2
+        timer_ids = await self.expire_alarms(5, 10, 15)
+
+        self.assertEqual(await self.sweep(self.clock.now), timer_ids[:1])
+        self.assertEqual(list(self.tm.store.timers), timer_ids[1:])
+        self.assertEqual(await self.sweep(self.clock.now), [])
+
+
+class TimerResolutionCacheTest(VirtualClockTimerTest):
+    """Test device entity and mic domain lookups are cached until changed."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up timer manager, counting helper lookups."""
+        await super().asyncSetUp()
+        self.lookups = {
+            name: mock.Mock(wraps=getattr(timers, name))
+            for name in [
+                "get_entity_id_from_conversation_device_id",
+                "get_mic_device_domain",
+            ]
+        }
+        for name, lookup in self.lookups.items():
+            patcher = mock.patch.object(timers, name, lookup)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        await self.add_alarm(TimerInfo(minutes=5))
+
+    def lookup_counts(self) -> list[int]:
+        """Return number of entity and mic domain lookups."""
+        return [lookup.call_count for lookup in self.lookups.values()]
+
+    async def test_lookups_are_cached(self) -> None:
+        """Test repeated queries resolve the device and domain once."""
+        for _ in range(3):
+            self.assertEqual(len(self.tm.get_timers(device_id="kitchen_mic")), 1)
+        self.assertEqual(self.lookup_counts(), [1, 1])
+
+    async def test_registry_update_clears_cache(self) -> None:
+        """Test a registry update resolves devices again."""
+        self.tm.get_timers(device_id="kitchen_mic")
+        DEVICES["kitchen_mic"] = "sensor.lounge"
+        self.assertEqual(len(self.tm.get_timers(device_id="kitchen_mic")), 1)
+
+        self.hass.bus.async_fire("entity_registry_updated", {})
+        self.assertEqual(self.tm.get_timers(device_id="kitchen_mic"), [])
+        self.assertEqual(self.lookup_counts(), [2, 2])
+
+        self.hass.bus.async_fire("device_registry_updated", {})
+        self.tm.get_timers(device_id="kitchen_mic")
+        self.assertEqual(self.lookup_counts()[0], 3)
+
+    async def test_only_va_config_entry_change_clears_cache(self) -> None:
+        """Test config entry changes of other integrations keep the cache."""
+        self.tm.get_timers(device_id="kitchen_mic")
+        for domain in ["other", timers.DOMAIN]:
+            async_dispatcher_send(
+                self.hass,
+                timers.SIGNAL_CONFIG_ENTRY_CHANGED,
+                None,
+                SimpleNamespace(domain=domain),
+            )
+            self.tm.get_timers(device_id="kitchen_mic")
+        self.assertEqual(self.lookup_counts(), [2, 2])
+
+    async def test_unload_stops_clearing_cache(self) -> None:
+        """Test registry listeners are removed on unload."""
+        self.config.unload()
+        self.assertEqual(self.hass.bus.listeners["entity_registry_updated"], [])
+        self.assertEqual(
+            self.hass.dispatcher_targets[timers.SIGNAL_CONFIG_ENTRY_CHANGED], []
+        )
+
+
+class TimerBatchTest(VirtualClockTimerTest):
+    """Test timers added and cancelled in a batch are one store change."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up timer manager with a second device."""
+        await super().asyncSetUp()
+        DEVICES["lounge_mic"] = "sensor.lounge"
+
+    def deltas(self) -> list[tuple[str, Any]]:
+        """Return entity and change type of timer deltas sent."""
+        return [
+            (event.payload["entity_id"], event.payload["type"])
+            for _, event in self.hass.dispatched
+            if getattr(event, "event_name", None) == timers.VAEventType.TIMER_DELTA
+        ]
+
+    async def test_add_timers_is_one_change(self) -> None:
+        """Test adding a batch saves once with one delta per entity."""
+        save_requests = self.tm.store.save_requests
+        results = await self.tm.add_timers(
+            [
+                {
+                    "timer_class": timers.TimerClass.TIMER,
+                    "device_id": device_id,
+                    "entity_id": None,
+                    "timer_info": TimerInfo(minutes=minutes),
+                }
+                for device_id, minutes in [
+                    ("kitchen_mic", 5),
+                    ("lounge_mic", 5),
+                    ("kitchen_mic", 10),
+                    ("kitchen_mic", 5),
+                    ("unknown_mic", 5),
+                ]
+            ]
+        )
+        self.assertEqual(
+            [response_id for response_id, _ in results],
+            ["timer_set"] * 3 + ["timer_already_exists", "timer_error"],
+        )
+        self.assertEqual(results[3][1]["id"], results[0][1]["id"])
+        self.assertEqual(len(self.tm.store.timers), 3)
+        self.assertEqual(len(self.tm.scheduler), 3)
+        self.assertEqual(self.tm.store.save_requests, save_requests + 1)
+        self.assertEqual(
+            self.deltas(),
+            [("sensor.kitchen", "added"), ("sensor.lounge", "added")],
+        )
+
+    async def test_cancel_timers_is_one_change(self) -> None:
+        """Test cancelling a batch saves once with one delta per entity."""
+        timer_ids = [await self.add_alarm(TimerInfo(minutes=m)) for m in (5, 10)]
+        _, lounge = await self.tm.add_timer(
+            timers.TimerClass.TIMER, "lounge_mic", None, TimerInfo(minutes=5)
+        )
+        timer_ids.append(lounge["id"])
+        self.hass.dispatched.clear()
+        save_requests = self.tm.store.save_requests
+
+        cancelled = await self.tm.cancel_timers([*timer_ids, "unknown", timer_ids[0]])
+        self.assertEqual(cancelled, timer_ids)
+        self.assertEqual(self.tm.store.timers, {})
+        self.assertEqual(len(self.tm.scheduler), 0)
+        self.assertEqual(self.tm.store.save_requests, save_requests + 1)
+        self.assertEqual(
+            self.deltas(),
+            [("sensor.kitchen", "removed"), ("sensor.lounge", "removed")],
+        )
+
+
+class TimerClockTest(VirtualClockTimerTest):
+    """Test the timer manager and store use the injected clock."""
+
+    async def test_times_are_from_clock(self) -> None:
+        """Test created, updated, expiry and output times follow the clock."""
+        self.assertEqual(
+            self.tm._now(),  # noqa: SLF001
+            dt.datetime.fromtimestamp(FRIDAY_9AM, dt.UTC),
+        )
+        timer_id = await self.add_alarm(TimerInfo(minutes=5))
+        timer = self.timer(timer_id)
+        self.assertEqual(timer.created_at, FRIDAY_9AM)
+        self.assertEqual(timer.expires_at, FRIDAY_9AM + 300)
+
+        self.clock.now = FRIDAY_9AM + 100
+        await self.tm.store.updated(timer_id)
+        self.assertEqual(timer.updated_at, FRIDAY_9AM + 100)
+        output = self.tm.format_timer_output(timer)
+        self.assertEqual(output["expiry"]["seconds"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
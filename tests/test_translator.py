@@ -0,0 +1,37 @@
+"""Tests for the Translator."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+
+from .ha_stubs import FakeConfigEntry, FakeHass, load_translator
+
+translator_package = load_translator()
+
+
+class TranslatorSetupTest(unittest.IsolatedAsyncioTestCase):
+    """Test Translator setup."""
+
+    async def test_preload_runs_as_background_task(self) -> None:
+        """Test language pack preload is passed as a coroutine and runs."""
+        packs = translator_package.LANGUAGE_PACKS
+        self.addCleanup(setattr, packs, "cache_dir", packs.cache_dir)
+
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = FakeHass(config_dir)
+            config = FakeConfigEntry()
+            translator = translator_package.Translator(hass, config)
+            preloaded = asyncio.Event()
+            translator._preload_language_packs = preloaded.set
+
+            self.assertTrue(await translator.async_setup())
+            self.assertEqual(len(config.tasks), 1)
+            await config.tasks.pop()
+            self.assertTrue(preloaded.is_set())
+            await translator.async_unload()
+
+
+if __name__ == "__main__":
+    unittest.main()